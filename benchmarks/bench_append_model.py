@@ -0,0 +1,81 @@
+"""
+Benchmark adding a model to a large single-file ``models.py``.
+
+Compares ``FileOverlay.append_to_module``, which reads only the import block
+and appends to the file, with reading, merging and rewriting the whole module
+through ``merge_module_source``.
+
+Usage:
+    python benchmarks/bench_append_model.py [--classes 5000] [--repeat 5]
+"""
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from django_create.imports import merge_module_source  # noqa: E402
+from django_create.overlay import current_overlay  # noqa: E402
+from django_create.session import session_scope  # noqa: E402
+
+IMPORTS = "from django.db import models"
+BODY = "class Product(models.Model):\n    name = models.CharField(max_length=100)\n"
+
+
+def generate_module(class_count):
+    """Build a models module with ``class_count`` models."""
+    return "from django.db import models\n\n" + "\n\n".join(
+        f"class Model{index}(models.Model):\n"
+        f"    name = models.CharField(max_length=100)\n"
+        f"    code = models.IntegerField(default={index})\n\n"
+        f"    def __str__(self):\n"
+        f"        return self.name"
+        for index in range(class_count)
+    ) + "\n"
+
+
+def rewrite_model(path):
+    """The full read-merge-rewrite path ``append_to_module`` replaces."""
+    with open(path) as f:
+        content = f.read()
+    with open(path, 'w') as f:
+        f.write(merge_module_source(content, IMPORTS, BODY))
+
+
+def append_model(path):
+    with session_scope():
+        current_overlay().append_to_module(path, IMPORTS, BODY)
+
+
+def measure(function, source, path, repeat):
+    def reset():
+        with open(path, 'w') as f:
+            f.write(source)
+    return min(timeit.repeat(lambda: function(path), setup=reset, number=1, repeat=repeat))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--classes', type=int, default=5000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    source = generate_module(args.classes)
+    directory = tempfile.mkdtemp()
+    try:
+        path = os.path.join(directory, 'models.py')
+        legacy = measure(rewrite_model, source, path, args.repeat)
+        current = measure(append_model, source, path, args.repeat)
+    finally:
+        shutil.rmtree(directory)
+
+    print(f"{args.classes} models ({len(source) // 1024} KiB), best of {args.repeat}")
+    print(f"  read, merge and rewrite: {legacy * 1000:8.2f} ms")
+    print(f"  append to module:        {current * 1000:8.2f} ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,140 @@
+"""
+Benchmark class extraction (``extract_file_contents``) on a large module.
+
+Compares ``extract_classes``, which parses the module once with ``ast`` and
+slices every class out of the original text, with the previous line scanner
+on a generated 500-class module. Every tenth class has a decorator, a leading
+comment, a multi-line header and a docstring with unindented lines, which the
+line scanner does not extract intact.
+
+The ast extractor is not faster: ``ast.parse`` alone takes several times as
+long as the whole line scan, so no extractor built on it can catch up. What
+it buys is correctness (every class intact) and the per-class names that
+import pruning and sibling imports need. The benchmark prints the cost of
+``ast.parse`` on its own to show how much of the time is the parse.
+
+Usage:
+    python benchmarks/bench_extract_classes.py [--classes 500] [--repeat 5]
+"""
+import argparse
+import ast
+import os
+import re
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from django_create.extraction import extract_classes  # noqa: E402
+
+
+def legacy_extract_file_contents(content):
+    """The line scanner replaced by ``extract_classes``."""
+    import_lines = []
+    for line in content.split('\n'):
+        if line.strip() and (line.strip().startswith('from ') or line.strip().startswith('import ')):
+            import_lines.append(line)
+
+    imports = "\n".join(import_lines)
+
+    classes = {}
+    lines = content.split('\n')
+    current_class = None
+    current_content = []
+    indent_level = 0
+
+    for line in lines:
+        class_match = re.match(r'^class\s+(\w+)\s*.*:', line)
+
+        if class_match:
+            if current_class:
+                classes[current_class] = '\n'.join(current_content)
+            current_class = class_match.group(1)
+            current_content = [line]
+            indent_level = len(line) - len(line.lstrip())
+            continue
+
+        if current_class:
+            if not line.strip():
+                current_content.append(line)
+                continue
+
+            current_indent = len(line) - len(line.lstrip())
+            if not line.strip() or current_indent > indent_level:
+                current_content.append(line)
+            else:
+                classes[current_class] = '\n'.join(current_content)
+                current_class = None
+                current_content = []
+
+    if current_class:
+        classes[current_class] = '\n'.join(current_content)
+
+    return {"imports": imports, **classes}
+
+
+def generate_module(class_count):
+    """
+    Build a models module with ``class_count`` classes.
+
+    Returns:
+        tuple: (source, classes) where classes maps each name to its exact source
+    """
+    classes = {}
+    for index in range(class_count):
+        name = f"Model{index}"
+        body = (
+            f"    code = models.IntegerField(default={index})\n"
+            "    name = models.CharField(max_length=100)\n"
+            "\n"
+            "    class Meta:\n"
+            "        ordering = ['name']\n"
+            "\n"
+            "    def __str__(self):\n"
+            "        return self.name"
+        )
+        if index % 10 == 0:
+            classes[name] = (
+                f"# Model {index}, registered with the admin\n"
+                f"@admin.register({name})\n"
+                f"class {name}(\n"
+                "    models.Model,\n"
+                "):\n"
+                '    """\n'
+                "Notes kept flush left.\n"
+                '    """\n'
+                f"{body}"
+            )
+        else:
+            classes[name] = f"class {name}(models.Model):\n{body}"
+    source = "from django.contrib import admin\nfrom django.db import models\n\n\n" + "\n\n\n".join(classes.values()) + "\n"
+    return source, classes
+
+
+def count_intact(extracted, classes):
+    return sum(extracted.get(name, '').strip('\n') == text for name, text in classes.items())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--classes', type=int, default=500)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    source, classes = generate_module(args.classes)
+    legacy = min(timeit.repeat(lambda: legacy_extract_file_contents(source), number=1, repeat=args.repeat))
+    current = min(timeit.repeat(lambda: extract_classes(source), number=1, repeat=args.repeat))
+    parse = min(timeit.repeat(lambda: ast.parse(source), number=1, repeat=args.repeat))
+
+    legacy_intact = count_intact(legacy_extract_file_contents(source), classes)
+    current_intact = count_intact(extract_classes(source).classes, classes)
+
+    print(f"{args.classes} classes ({source.count(chr(10))} lines), best of {args.repeat}")
+    print(f"  legacy line scanner: {legacy * 1000:8.2f} ms  ({legacy_intact} classes intact)")
+    print(f"  ast extractor:       {current * 1000:8.2f} ms  ({current_intact} classes intact)")
+    print(f"    of which ast.parse: {parse * 1000:7.2f} ms")
+    print(f"  ast extractor / line scanner: {current / legacy:.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,106 @@
+"""
+Benchmark creating the classes of a split module during ``folderize``.
+
+Compares ``CreateEngine``, which folderize now calls in process for every
+class, with invoking the create command through a new ``CliRunner`` per
+class, as folderize used to: output capture, a click context and an app
+lookup for each class. The create command now scans the app layout itself,
+which folderize used to pass it, so that figure also includes a layout scan
+per class. Both create the same ``models/`` package, flushed to disk at the
+end of the run.
+
+Usage:
+    python benchmarks/bench_folderize.py [--classes 1000] [--repeat 3]
+"""
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from click.testing import CliRunner  # noqa: E402
+from django_create.commands import create_model  # noqa: E402
+from django_create.engine import CreateEngine  # noqa: E402
+from django_create.layout import ProjectLayout  # noqa: E402
+from django_create.session import session_scope  # noqa: E402
+from django_create.utils import create_mock_django_app  # noqa: E402
+
+IMPORTS = "from django.db import models"
+
+
+def generate_classes(class_count):
+    """Build the sources of ``class_count`` models."""
+    return {
+        f"Model{index}": (
+            f"class Model{index}(models.Model):\n"
+            f"    name = models.CharField(max_length=100)\n"
+            f"    code = models.IntegerField(default={index})\n"
+        )
+        for index in range(class_count)
+    }
+
+
+def create_with_runner(app_path, layout, classes):
+    """The per-class ``CliRunner`` invocation ``CreateEngine`` replaces."""
+    for name, source in classes.items():
+        result = CliRunner().invoke(
+            create_model,
+            [name],
+            obj={'app_name': 'shop', 'class_dict': {'imports': IMPORTS, name: source}},
+            catch_exceptions=False
+        )
+        if result.exit_code != 0:
+            raise RuntimeError(result.output)
+
+
+def create_in_process(app_path, layout, classes):
+    engine = CreateEngine(app_path, layout)
+    for name, source in classes.items():
+        engine.create_model(name, source, IMPORTS)
+
+
+def measure(function, directory, classes, repeat):
+    state = {}
+
+    def reset():
+        shutil.rmtree(os.path.join(directory, 'shop'), ignore_errors=True)
+        app_path = create_mock_django_app(Path(directory), app_name='shop', with_models_file=False, with_models_folder=True)
+        state['app_path'] = app_path
+        state['layout'] = ProjectLayout.scan(app_path)
+
+    def run():
+        with session_scope():
+            function(state['app_path'], state['layout'], classes)
+
+    return min(timeit.repeat(run, setup=reset, number=1, repeat=repeat))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--classes', type=int, default=1000)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    classes = generate_classes(args.classes)
+    directory = tempfile.mkdtemp()
+    cwd = os.getcwd()
+    try:
+        # The create commands look the app up from the working directory
+        os.chdir(directory)
+        legacy = measure(create_with_runner, directory, classes, args.repeat)
+        current = measure(create_in_process, directory, classes, args.repeat)
+    finally:
+        os.chdir(cwd)
+        shutil.rmtree(directory)
+
+    print(f"{args.classes} models, best of {args.repeat}")
+    print(f"  CliRunner per class: {legacy * 1000:9.2f} ms")
+    print(f"  CreateEngine:        {current * 1000:9.2f} ms")
+
+
+if __name__ == '__main__':
+    main()
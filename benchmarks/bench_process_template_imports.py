@@ -0,0 +1,91 @@
+"""
+Benchmark the import-style rewriting of ``Utils.process_template_imports``.
+
+Compares the single-pass ``rewrite_import_levels`` with the previous
+line-by-line ``str.replace`` implementation on a generated 20k-line module.
+
+Usage:
+    python benchmarks/bench_process_template_imports.py [--lines 20000] [--repeat 5]
+"""
+import argparse
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from django_create.imports import rewrite_import_levels  # noqa: E402
+from django_create.layout import STANDARD_MODULES  # noqa: E402
+
+IMPORT_STYLES = {module: 'dotdot' if module == 'models' else 'dot' for module in STANDARD_MODULES}
+LEVELS = {module: 2 if style == 'dotdot' else 1 for module, style in IMPORT_STYLES.items()}
+
+
+def legacy_process_template_imports(content):
+    """The implementation replaced by ``rewrite_import_levels``."""
+    lines = content.split('\n')
+    processed_lines = []
+    for line in lines:
+        processed_line = line
+        for module in STANDARD_MODULES:
+            if f'from .{module}' in line:
+                if IMPORT_STYLES[module] == 'dotdot':
+                    processed_line = line.replace(f'from .{module}', f'from ..{module}')
+            elif f'from ..{module}' in line:
+                if IMPORT_STYLES[module] == 'dot':
+                    processed_line = line.replace(f'from ..{module}', f'from .{module}')
+        processed_lines.append(processed_line)
+    return '\n'.join(processed_lines)
+
+
+def generate_module(line_count):
+    """Build a module of about ``line_count`` lines with imports, classes and docstrings."""
+    lines = [
+        "from django.db import models",
+        "from .models import Product",
+        "from .models_extra import Extra",
+        "from ..serializers import ProductSerializer",
+        "",
+    ]
+    index = 0
+    while len(lines) < line_count:
+        lines.extend([
+            "",
+            f"class Model{index}(models.Model):",
+            '    """',
+            "    Example: from .models import Product",
+            '    """',
+            "    name = models.CharField(max_length=100)",
+            f"    code = models.IntegerField(default={index})",
+            "",
+            "    def __str__(self):",
+            "        return self.name",
+        ])
+        index += 1
+    return '\n'.join(lines[:line_count]) + '\n'
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--lines', type=int, default=20000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    source = generate_module(args.lines)
+    legacy = min(timeit.repeat(lambda: legacy_process_template_imports(source), number=1, repeat=args.repeat))
+    current = min(timeit.repeat(lambda: rewrite_import_levels(source, LEVELS), number=1, repeat=args.repeat))
+
+    legacy_changed = sum(
+        a != b for a, b in zip(source.split('\n'), legacy_process_template_imports(source).split('\n'))
+    )
+    current_changed = sum(
+        a != b for a, b in zip(source.split('\n'), rewrite_import_levels(source, LEVELS).split('\n'))
+    )
+
+    print(f"{args.lines} lines, best of {args.repeat}")
+    print(f"  legacy str.replace:  {legacy * 1000:8.2f} ms  ({legacy_changed} lines rewritten)")
+    print(f"  single-pass rewrite: {current * 1000:8.2f} ms  ({current_changed} lines rewritten)")
+
+
+if __name__ == '__main__':
+    main()
@@ -1,33 +1,64 @@
-import click
-from .commands import create_model, create_view, create_serializer, create_viewset, create_test, folderize
-
-
-@click.group()
-@click.argument('app_name')
-@click.pass_context
-def cli(ctx, app_name):
-    """Django Create: A CLI tool for organizing Django apps."""
-    ctx.ensure_object(dict)
-    ctx.obj['app_name'] = app_name
-  
-# Create the 'create' group as a sub-command under the main command.
-@cli.group()
-@click.pass_context
-def create(ctx):
-    """Commands for creating elements in the Django app."""
-
-    pass
-
-# Register commands under the 'create' group.
-create.add_command(create_model)
-create.add_command(create_view)
-create.add_command(create_viewset)
-create.add_command(create_serializer)
-create.add_command(create_test)
-
-# Register  folderize command under the 'cli' group.
-cli.add_command(folderize, 'folderize')
-
-
-if __name__ == '__main__':
-    cli()
+import click
+from .discovery import DISCOVERY_BACKENDS
+from .session import current_session, session_scope
+from .commands import create_model, create_view, create_serializer, create_viewset, create_test, folderize
+
+
+class RunGroup(click.Group):
+    """
+    Group whose run is discarded when its command fails.
+
+    The session is held as a context resource, which click before 8.2 closes
+    without the exception, so the failure is caught here as well.
+    """
+
+    def invoke(self, ctx):
+        try:
+            return super().invoke(ctx)
+        except click.exceptions.Exit as e:
+            if e.exit_code:
+                current_session().discard()
+            raise
+        except BaseException:
+            current_session().discard()
+            raise
+
+
+@click.group(cls=RunGroup)
+@click.argument('app_name')
+@click.option('--discovery', type=click.Choice(DISCOVERY_BACKENDS), default='index', show_default=True,
+              help="How to locate the app when it is not directly in the current directory.")
+@click.option('--max-depth', type=click.IntRange(min=1), default=None,
+              help="Maximum directory depth to search for the app.")
+@click.option('--settings', default=None,
+              help="Django settings module or file whose INSTALLED_APPS is used to locate the app.")
+@click.option('--stats', is_flag=True, help="Print I/O statistics when the command finishes.")
+@click.pass_context
+def cli(ctx, app_name, discovery, max_depth, settings, stats):
+    """Django Create: A CLI tool for organizing Django apps."""
+    ctx.ensure_object(dict)
+    ctx.obj['app_name'] = app_name
+    ctx.obj['discovery_options'] = {'discovery': discovery, 'max_depth': max_depth, 'settings': settings}
+    ctx.with_resource(session_scope(show_stats=stats))
+  
+# Create the 'create' group as a sub-command under the main command.
+@cli.group()
+@click.pass_context
+def create(ctx):
+    """Commands for creating elements in the Django app."""
+
+    pass
+
+# Register commands under the 'create' group.
+create.add_command(create_model)
+create.add_command(create_view)
+create.add_command(create_viewset)
+create.add_command(create_serializer)
+create.add_command(create_test)
+
+# Register  folderize command under the 'cli' group.
+cli.add_command(folderize, 'folderize')
+
+
+if __name__ == '__main__':
+    cli()
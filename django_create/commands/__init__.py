@@ -1,6 +1,6 @@
-from .create_model import create_model
-from .create_view import create_view
-from .create_serializer import create_serializer
-from .create_viewset import create_viewset
-from .create_test import create_test
+from .create_model import create_model
+from .create_view import create_view
+from .create_serializer import create_serializer
+from .create_viewset import create_viewset
+from .create_test import create_test
 from .folderize_app import folderize
\ No newline at end of file
@@ -1,121 +1,185 @@
-import click
-import os
-from pathlib import Path
-from click.testing import CliRunner
-from ..utils import Utils, contains_class_definition, extract_file_contents
-from ..commands import create_model, create_view, create_viewset, create_test, create_serializer
-
-@click.command()
-@click.pass_context
-def folderize(ctx):
-    """
-    Organize a Django app by creating folders for models, views, viewsets, and tests.
-    Extracts class definitions from any file in the app if present, deletes the original files,
-    and re-creates each class in separate files within the respective folders.
-    """
-    app_name = ctx.obj['app_name']
-    click.echo(f"Folderizing app '{app_name}'...")
-
-    # Use the current working directory as the base path
-    base_path = Path(os.getcwd()).resolve()
-    app_path = base_path / app_name
-    
-    if not app_path.exists():
-        # If not found directly, check in each subfolder
-        possible_paths = [folder / app_name for folder in base_path.iterdir() if folder.is_dir()]
-        app_path = next((p for p in possible_paths if p.exists()), None)
-        
-        if not app_path:
-            click.echo(f"Error: The app '{app_name}' does not exist.")
-            return 1
-
-    module_types = Utils.STANDARD_MODULES
-    extracted_classes = {}
-
-    # Process files and extract classes
-    print("\n=== Processing Files ===")
-    for module_type in module_types:
-        file_path = app_path / f"{module_type}.py"
-        
-        if file_path.exists():
-            try:
-                if file_path.read_text().strip():  # Check if file is not empty
-                    if contains_class_definition(file_path):
-                        # Extract content and store in extracted_classes
-                        extracted_classes[f"{module_type}.py"] = extract_file_contents(file_path)
-                # Remove the original file after extraction
-                file_path.unlink()
-            except Exception as e:
-                click.echo(f"Error processing {module_type}.py: {str(e)}")
-        else:
-            click.echo(f"Warning: File '{module_type}.py' not found, skipping...")
-
-    # Create required folders
-    for folder_name in module_types:
-        folder_path = app_path / folder_name
-        folder_path.mkdir(exist_ok=True)
-        init_file = folder_path / '__init__.py'
-        if not init_file.exists():
-            init_file.write_text("# This file allows the directory to be treated as a Python module.\n")
-
-    # Map commands to their respective module types
-    command_mapping = {
-        'models.py': (create_model, ['create', 'model']),
-        'views.py': (create_view, ['create', 'view']),
-        'viewsets.py': (create_viewset, ['create', 'viewset']),
-        'tests.py': (create_test, ['create', 'test']),
-        'serializers.py': (create_serializer, ['create', 'serializer'])
-    }
-
-    # Process extracted classes for each file
-    for file_name, class_dict in extracted_classes.items():
-        if file_name not in command_mapping:
-            print(f"No matching command for {file_name}")
-            continue
-
-        command, command_args = command_mapping[file_name]
-        
-        # Store imports for the entire file
-        imports = class_dict.get("imports", "")
-
-        # Process each class (excluding the "imports" key)
-        for class_name in [k for k in class_dict.keys() if k != "imports"]:
-            try:
-                # Get the class content
-                class_content = class_dict[class_name]
-
-                # Create a new class_dict with imports and content
-                processed_class_dict = {
-                    "imports": imports,
-                    class_name: class_content
-                }
-
-                # Create a new runner for each command
-                runner = CliRunner()
-                
-                # Prepare the context object
-                obj = {
-                    'app_name': app_name,
-                    'class_dict': processed_class_dict
-                }
-
-                # Run the command using the runner
-                result = runner.invoke(
-                    command,
-                    [class_name],
-                    obj=obj,
-                    catch_exceptions=False
-                )
-
-                if result.exit_code != 0:
-                    click.echo(f"Failed to create {class_name}: {result.output}")
-                    return 1
-                
-            except Exception as e:
-                click.echo(f"Error creating {class_name}: {str(e)}")
-                import traceback
-                traceback.print_exc()
-                return 1
-
-    click.echo(f"App '{app_name}' has been folderized successfully.")
+import click
+import os
+from pathlib import Path
+from ..engine import CreateEngine, class_module_name
+from ..layout import ProjectLayout
+from ..locks import lock_file
+from ..overlay import current_overlay
+from ..extraction import STREAMING_THRESHOLD, extract_classes, stream_classes
+from ..session import current_session
+from ..utils import Utils, find_app_path
+
+def _write_shared_code(folder_path, module_type, contents, app_path, layout):
+    """
+    Write the top-level code of a split module other than its imports and classes.
+
+    Common code goes to ``_common.py``, which classes import what they use
+    from, and hooks to ``_hooks.py``, which imports the classes it needs.
+    The classes common functions use are imported at the end of
+    ``_common.py``, once the names classes import from it are defined. The
+    package ``__init__.py`` exports their public names, which also makes the
+    hooks run once the package is imported.
+
+    Returns:
+        list: The names of the modules written
+    """
+    written = []
+    exports = []
+    for module_name, code in (('_common', contents.common), ('_hooks', contents.hooks)):
+        if not code.statements:
+            continue
+        imports = list(code.imports)
+        if code.common_names:
+            imports.append(f"from ._common import {', '.join(code.common_names)}")
+        class_imports = [
+            f"from .{class_module_name(module_type, name)} import {name}" for name in code.class_references
+        ]
+        content = "\n\n\n".join(code.statements) + "\n"
+        if module_name == '_common' and class_imports:
+            # Only called functions use them: importing them first would be circular
+            content += "\n\n" + "".join(f"{statement}  # noqa: E402\n" for statement in class_imports)
+        else:
+            imports.extend(class_imports)
+        if imports:
+            content = "\n".join(imports) + "\n\n\n" + content
+        Utils.write_or_append_content(
+            folder_path / f"{module_name}.py",
+            Utils.process_template_imports(content, app_path, layout),
+            module_type
+        )
+        written.append(f"{module_type}/{module_name}.py")
+        exports.extend(f"from .{module_name} import {name}" for name in code.names)
+        if module_name == '_hooks' and not code.names:
+            exports.append("from . import _hooks")
+
+    for export in exports:
+        Utils.write_or_append_content(folder_path / '__init__.py', export, 'init')
+    return written
+
+@click.command()
+@click.pass_context
+def folderize(ctx):
+    """
+    Organize a Django app by creating folders for models, views, viewsets, and tests.
+    Extracts class definitions from any file in the app if present, deletes the original files,
+    and re-creates each class in separate files within the respective folders.
+    """
+    app_name = ctx.obj['app_name']
+    click.echo(f"Folderizing app '{app_name}'...")
+
+    # Use the current working directory as the base path
+    base_path = Path(os.getcwd()).resolve()
+    app_path = find_app_path(app_name, base_path, **ctx.obj.get('discovery_options', {}))
+
+    if not app_path:
+        click.echo(f"Error: The app '{app_name}' does not exist.")
+        return 1
+
+    module_types = Utils.STANDARD_MODULES
+    extracted_classes = {}
+
+    # Snapshot the app layout once for the whole run
+    layout = ProjectLayout.scan(app_path)
+
+    # Process files and extract classes
+    print("\n=== Processing Files ===")
+    for module_type in module_types:
+        file_path = app_path / f"{module_type}.py"
+        
+        if layout.has_file(module_type):
+            try:
+                # Held until the run ends, so concurrent runs cannot append to the file meanwhile
+                lock_file(file_path)
+                size = current_overlay().disk_size(file_path)
+                if size is not None and size >= STREAMING_THRESHOLD:
+                    # Generated modules are extracted without loading them; class
+                    # sources are read back one at a time as they are created
+                    current_session().stats['bytes_read'] += size
+                    contents = stream_classes(file_path)
+                else:
+                    # One read and one parse: an empty module or one without
+                    # classes simply has no classes to extract
+                    contents = extract_classes(current_overlay().read_text(file_path, encoding='utf-8'))
+                if contents.classes or contents.common.statements or contents.hooks.statements or contents.side_effect_imports:
+                    extracted_classes[f"{module_type}.py"] = contents
+                # Remove the original file after extraction
+                current_overlay().unlink(file_path)
+            except Exception as e:
+                click.echo(f"Error processing {module_type}.py: {str(e)}")
+        else:
+            click.echo(f"Warning: File '{module_type}.py' not found, skipping...")
+
+    # Create required folders
+    for folder_name in module_types:
+        folder_path = app_path / folder_name
+        if not layout.has_folder(folder_name):
+            current_overlay().mkdir(folder_path)
+        if not layout.has_init(folder_name):
+            init_file = folder_path / '__init__.py'
+            current_overlay().write_text(init_file, "# This file allows the directory to be treated as a Python module.\n")
+    layout = layout.with_folders(module_types)
+
+    # Classes are created in process, sharing the app path and layout
+    engine = CreateEngine(app_path, layout)
+
+    # Import statements copied into the new modules, and how many copying
+    # every import of the original file would have taken
+    imports_written = imports_unpruned = 0
+
+    # Process extracted classes for each file
+    for file_name, contents in extracted_classes.items():
+        module_type = file_name[:-3]
+
+        # Functions, constants and receivers of the file are kept next to its classes
+        shared_modules = _write_shared_code(app_path / module_type, module_type, contents, app_path, layout)
+        if shared_modules:
+            click.echo(f"Top-level code of {file_name} other than classes moved to {' and '.join(shared_modules)}.")
+
+        # Process each class
+        for class_name, class_content in contents.classes.items():
+            try:
+                # Only the imports the class uses go to its module
+                class_imports = contents.class_imports[class_name]
+                imports_written += len(class_imports)
+                imports_unpruned += len(contents.import_statements)
+
+                # So does the common code of the file it uses
+                common_names = contents.class_common[class_name]
+                common_imports = [f"from ._common import {', '.join(common_names)}"] if common_names else []
+
+                hook_names = contents.class_hooks[class_name]
+                if hook_names:
+                    click.echo(
+                        f"Warning: {class_name} uses {', '.join(hook_names)}, which moved to "
+                        f"{module_type}/_hooks.py and cannot be imported by it; fix its module by hand."
+                    )
+
+                # Classes of the same file it uses now live in sibling modules
+                sibling_imports = [
+                    f"from .{class_module_name(module_type, name)} import {name}"
+                    for name in contents.class_references[class_name]
+                ]
+
+                engine.create(
+                    module_type,
+                    class_name,
+                    class_content,
+                    "\n".join(class_imports + common_imports + sibling_imports)
+                )
+
+            except Exception as e:
+                import traceback
+                traceback.print_exc()
+                # Nothing of a half-converted app reaches the disk: the original
+                # files are kept and the new folders and modules dropped
+                current_session().discard()
+                raise click.ClickException(f"Error creating {class_name}: {str(e)}") from e
+
+        # Imports the file only had for their side effect run once the package is, after its classes
+        for statement in contents.side_effect_imports:
+            Utils.write_or_append_content(app_path / module_type / '__init__.py', statement, 'init')
+
+    if imports_unpruned:
+        click.echo(f"Import statements: {imports_written} written ({imports_unpruned} before pruning).")
+    click.echo(f"App '{app_name}' has been folderized successfully.")
     return 0
\ No newline at end of file
@@ -0,0 +1,66 @@
+import os
+from pathlib import Path
+from ..session import current_session
+from .git import find_app_in_git_index
+from .index import AppIndex
+from .installed_apps import InstalledApps
+from .walker import IgnoreRules, WalkResult, walk_for_app
+
+DISCOVERY_BACKENDS = ('index', 'fs', 'git')
+
+
+def find_app(app_name, base_path=None, discovery='index', max_depth=None, settings=None):
+    """
+    Locate the folder of ``app_name`` below ``base_path`` (defaults to the cwd).
+
+    If a settings module can be found (``settings``, ``DJANGO_SETTINGS_MODULE``
+    or manage.py), the app is first resolved from its ``INSTALLED_APPS``. On a
+    miss, a folder directly inside ``base_path`` wins, and otherwise the selected
+    backend is used:
+
+    - ``index``: the persistent app index, refreshed incrementally on a miss
+    - ``fs``: a pruned breadth-first walk that stops at the first Django app
+    - ``git``: the directories of files tracked in the git index; falls back to
+      ``fs`` outside a git work tree or when the app is not tracked yet
+
+    Args:
+        app_name: Name of the app folder to find
+        base_path: Directory to search from
+        discovery: Name of the backend to use
+        max_depth: Deepest level to search (direct children of base_path are level 1)
+        settings: Django settings module (dotted name or file path)
+
+    Returns:
+        Path or None: Absolute path to the app folder
+    """
+    base_path = Path(base_path or os.getcwd()).resolve()
+    stats = current_session().stats
+
+    installed_apps = InstalledApps(base_path, settings)
+    if installed_apps.settings_path is not None:
+        app_path = installed_apps.resolve(app_name)
+        stats['settings_files_parsed'] += installed_apps.parsed_files
+        if app_path is not None:
+            return app_path
+
+    app_path = base_path / app_name
+    if app_path.is_dir():
+        return app_path
+
+    if discovery == 'git':
+        result = find_app_in_git_index(app_name, base_path, max_depth=max_depth)
+        if result is not None:
+            stats['git_index_entries_read'] += result.visited
+            if result.path is not None:
+                return result.path
+        discovery = 'fs'
+
+    if discovery == 'fs':
+        result = walk_for_app(app_name, base_path, max_depth=max_depth, ignore=IgnoreRules(keep={app_name}))
+        stats['discovery_dirs_visited'] += result.visited
+        return result.path
+
+    index = AppIndex(base_path)
+    app_path = index.lookup(app_name, max_depth=max_depth)
+    stats['discovery_dirs_visited'] += index.listed
+    return app_path
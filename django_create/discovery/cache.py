@@ -0,0 +1,43 @@
+import json
+import os
+
+CACHE_DIR = '.django-create'
+
+
+def read_cache_file(root, name):
+    """
+    Read a JSON cache file from ``<root>/.django-create``.
+
+    Returns:
+        dict or None: The cached data, or None if missing or unreadable
+    """
+    try:
+        with open(os.path.join(root, CACHE_DIR, name), 'r') as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return data if isinstance(data, dict) else None
+
+
+def write_cache_file(root, name, data):
+    """
+    Atomically write a JSON cache file to ``<root>/.django-create``.
+
+    Failures are ignored; every cache can be rebuilt from the project tree.
+    """
+    cache_dir = os.path.join(root, CACHE_DIR)
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        gitignore = os.path.join(cache_dir, '.gitignore')
+        if not os.path.exists(gitignore):
+            with open(gitignore, 'w') as f:
+                # Cache files stay out of version control; project templates do not
+                f.write('*\n!templates/\n!templates/**\n')
+
+        path = os.path.join(cache_dir, name)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(data, f)
+        os.replace(tmp_path, path)
+    except OSError:
+        pass
@@ -0,0 +1,68 @@
+import os
+import subprocess
+from pathlib import Path
+from .walker import APP_MARKERS, WalkResult
+
+
+def tracked_files(root):
+    """
+    List the files tracked in the git index below ``root`` (``git ls-files``).
+
+    Returns:
+        list or None: Paths relative to ``root``, or None if ``root`` is not in a
+        git work tree or git is not installed
+    """
+    try:
+        result = subprocess.run(
+            ['git', 'ls-files', '-z', '--cached'],
+            cwd=str(root),
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return [os.fsdecode(path) for path in result.stdout.split(b'\0') if path]
+
+
+def find_app_in_git_index(app_name, root, max_depth=None):
+    """
+    Find the folder of ``app_name`` among the directories of tracked files.
+
+    Untracked trees (virtualenvs, build output, ignored folders) never appear in
+    the index, so nothing needs to be pruned. A folder containing a tracked
+    ``apps.py`` or ``models.py`` is preferred over a merely same-named folder,
+    and shallower folders over deeper ones.
+
+    Args:
+        app_name: Name of the app folder to find
+        root: Directory to search from
+        max_depth: Deepest level to search (direct children of root are level 1)
+
+    Returns:
+        WalkResult or None: The app path (or None) and the number of index
+        entries read, or None if the git index is not available
+    """
+    paths = tracked_files(root)
+    if paths is None:
+        return None
+
+    candidates = {}
+    for path in paths:
+        if app_name not in path:
+            continue
+        parts = path.split('/')
+        for depth, part in enumerate(parts[:-1], start=1):
+            if max_depth is not None and depth > max_depth:
+                break
+            if part == app_name:
+                rel_path = '/'.join(parts[:depth])
+                is_app = depth == len(parts) - 1 and parts[-1] in APP_MARKERS
+                candidates[rel_path] = candidates.get(rel_path, False) or is_app
+
+    ranked = sorted(candidates, key=lambda p: (not candidates[p], p.count('/'), p))
+    for rel_path in ranked:
+        app_path = Path(root) / rel_path
+        if app_path.is_dir():
+            return WalkResult(app_path, len(paths))
+    return WalkResult(None, len(paths))
@@ -0,0 +1,177 @@
+import os
+from pathlib import Path
+from .cache import CACHE_DIR, read_cache_file, write_cache_file
+from .walker import IgnoreRules
+
+
+class AppIndex:
+    """
+    Persistent map of the directories below a project root, used to locate
+    Django apps without walking the whole tree on every invocation.
+
+    The index is stored in ``<root>/.django-create/app_index.json`` and records,
+    for every directory, its mtime and the names of its subdirectories (pruned
+    with the same ``IgnoreRules`` as the filesystem walker). The index is shared
+    by every lookup, so it is built with rules that do not depend on the app
+    being looked up; the names of pruned subdirectories are recorded too, so an
+    app in a folder that is normally skipped (``media``) can still be matched
+    by name. A lookup that hits a directory which still exists is answered
+    straight from the index.
+    On a miss the index is refreshed incrementally: every known directory is
+    stat'ed, and only the ones whose mtime changed (an entry was added, removed
+    or renamed inside them) are listed again.
+    """
+
+    INDEX_DIR = CACHE_DIR
+    INDEX_FILE = 'app_index.json'
+    VERSION = 3
+
+    def __init__(self, root):
+        self.root = Path(root)
+        self.ignore = IgnoreRules()
+        self.dirs = {}
+        self.listed = 0
+        self._names = None
+        self.load()
+
+    def load(self):
+        """Load the index from disk, starting empty if it is missing or unreadable."""
+        data = read_cache_file(self.root, self.INDEX_FILE)
+        if data and data.get('version') == self.VERSION and isinstance(data.get('dirs'), dict):
+            self.dirs = data['dirs']
+            self._names = None
+
+    def save(self):
+        """Write the index to disk. Failures are ignored; the index is only a cache."""
+        write_cache_file(self.root, self.INDEX_FILE, {'version': self.VERSION, 'dirs': self.dirs})
+
+    def lookup(self, app_name, max_depth=None):
+        """
+        Return the shallowest indexed directory named ``app_name``.
+
+        Args:
+            app_name: Name of the app folder to find
+            max_depth: Deepest level to consider (direct children of root are level 1)
+
+        Returns:
+            Path or None: Absolute path to the app folder
+        """
+        app_path = self._best_match(app_name, max_depth)
+        if app_path is None and self.refresh(max_depth):
+            app_path = self._best_match(app_name, max_depth)
+        return app_path
+
+    def refresh(self, max_depth=None):
+        """
+        Bring the index up to date, re-listing only directories whose mtime
+        (or whose ``.gitignore`` mtime) changed.
+
+        Args:
+            max_depth: Do not descend below this level; deeper entries are kept as they are
+
+        Returns:
+            bool: True if anything in the index changed
+        """
+        old_dirs = self.dirs
+        new_dirs = {}
+        changed = False
+        stack = [('', 0, ())]
+
+        while stack:
+            rel_path, depth, gitignores = stack.pop()
+            full_path = os.path.join(self.root, rel_path)
+            try:
+                mtime = os.stat(full_path).st_mtime_ns
+            except OSError:
+                changed = True
+                continue
+
+            entry = old_dirs.get(rel_path)
+            if entry and entry[0] == mtime and entry[2] == self._gitignore_mtime(full_path, entry[2]):
+                subdirs, gitignore_mtime, pruned = entry[1], entry[2], entry[3]
+            else:
+                subdirs, gitignore_mtime, pruned = self._list_subdirs(full_path, rel_path, gitignores)
+                changed = True
+
+            new_dirs[rel_path] = [mtime, subdirs, gitignore_mtime, pruned]
+            if max_depth is not None and depth >= max_depth:
+                continue
+
+            if gitignore_mtime is not None:
+                gitignores = gitignores + (self.ignore.gitignore(full_path, rel_path),)
+            stack.extend(
+                (f"{rel_path}/{name}" if rel_path else name, depth + 1, gitignores)
+                for name in subdirs
+            )
+
+        if max_depth is not None:
+            for rel_path, entry in old_dirs.items():
+                if rel_path not in new_dirs and rel_path.count('/') >= max_depth:
+                    new_dirs[rel_path] = entry
+
+        if len(new_dirs) != len(old_dirs):
+            changed = True
+
+        self.dirs = new_dirs
+        self._names = None
+        if changed:
+            self.save()
+        return changed
+
+    def _gitignore_mtime(self, dir_path, known_mtime):
+        # Only directories known to have a .gitignore pay for the extra stat.
+        if known_mtime is None:
+            return None
+        try:
+            return os.stat(os.path.join(dir_path, '.gitignore')).st_mtime_ns
+        except OSError:
+            return None
+
+    def _list_subdirs(self, dir_path, rel_path, gitignores):
+        self.listed += 1
+        try:
+            with os.scandir(dir_path) as it:
+                entries = list(it)
+        except OSError:
+            return [], None, []
+
+        names = {entry.name for entry in entries}
+        if rel_path and self.ignore.is_virtualenv(names):
+            return [], None, []
+
+        gitignore_mtime = None
+        if '.gitignore' in names:
+            gitignore_mtime = self._gitignore_mtime(dir_path, 0)
+            gitignores = gitignores + (self.ignore.gitignore(dir_path, rel_path),)
+
+        subdirs = []
+        pruned = []
+        for entry in entries:
+            if not entry.is_dir(follow_symlinks=False):
+                continue
+            child_rel = f"{rel_path}/{entry.name}" if rel_path else entry.name
+            if self.ignore.is_ignored(child_rel, entry.name, gitignores):
+                pruned.append(entry.name)
+            else:
+                subdirs.append(entry.name)
+        return sorted(subdirs), gitignore_mtime, sorted(pruned)
+
+    def _best_match(self, app_name, max_depth=None):
+        if self._names is None:
+            # Pruned folders are matched by name only; nothing below them is indexed
+            names = {}
+            for rel_path, entry in self.dirs.items():
+                if rel_path:
+                    names.setdefault(rel_path.rsplit('/', 1)[-1], []).append(rel_path)
+                for name in entry[3]:
+                    names.setdefault(name, []).append(f"{rel_path}/{name}" if rel_path else name)
+            self._names = names
+
+        candidates = sorted(self._names.get(app_name, []), key=lambda p: (p.count('/'), p))
+        for rel_path in candidates:
+            if max_depth is not None and rel_path.count('/') >= max_depth:
+                break
+            app_path = self.root / rel_path
+            if app_path.is_dir():
+                return app_path
+        return None
@@ -0,0 +1,247 @@
+import ast
+import os
+from pathlib import Path
+from .cache import read_cache_file, write_cache_file
+
+
+def _parse_file(path):
+    try:
+        with open(path, 'rb') as f:
+            return ast.parse(f.read(), filename=str(path))
+    except (OSError, SyntaxError, ValueError):
+        return None
+
+
+def _module_file(root, dotted_name):
+    """Return the source file of a dotted module name below ``root``, if any."""
+    base = Path(root, *dotted_name.split('.'))
+    for candidate in (base.with_suffix('.py'), base / '__init__.py'):
+        if candidate.is_file():
+            return candidate
+    return None
+
+
+def _string_list(node, env):
+    """Statically evaluate a list/tuple of string literals, following simple names and ``+``."""
+    if isinstance(node, (ast.List, ast.Tuple)):
+        values = []
+        for element in node.elts:
+            if isinstance(element, ast.Starred):
+                values.extend(_string_list(element.value, env))
+            elif isinstance(element, ast.Constant) and isinstance(element.value, str):
+                values.append(element.value)
+        return values
+    if isinstance(node, ast.BinOp) and isinstance(node.op, ast.Add):
+        return _string_list(node.left, env) + _string_list(node.right, env)
+    if isinstance(node, ast.Name):
+        return list(env.get(node.id, []))
+    return []
+
+
+def settings_module_from_manage_py(manage_py):
+    """
+    Read ``DJANGO_SETTINGS_MODULE`` from the ``os.environ.setdefault`` call in manage.py.
+
+    Returns:
+        str or None: Dotted settings module name
+    """
+    tree = _parse_file(manage_py)
+    if tree is None:
+        return None
+
+    for node in ast.walk(tree):
+        if (
+            isinstance(node, ast.Call)
+            and isinstance(node.func, ast.Attribute)
+            and node.func.attr == 'setdefault'
+            and len(node.args) == 2
+            and all(isinstance(arg, ast.Constant) for arg in node.args)
+            and node.args[0].value == 'DJANGO_SETTINGS_MODULE'
+        ):
+            return node.args[1].value
+    return None
+
+
+class InstalledApps:
+    """
+    Resolves app folders from the ``INSTALLED_APPS`` of a Django settings module,
+    statically, without importing Django or the project.
+
+    The settings module is taken from ``settings`` (dotted name or file path),
+    ``DJANGO_SETTINGS_MODULE`` or the project's ``manage.py``. It is parsed with
+    ``ast``, following ``from ... import *`` of sibling settings modules, list
+    concatenations and ``append``/``extend`` calls. ``AppConfig`` entries are
+    mapped to their ``name`` attribute. The resulting map of dotted app names to
+    folders is cached in ``.django-create/installed_apps.json`` and reused while
+    the mtimes of every parsed file are unchanged.
+    """
+
+    CACHE_FILE = 'installed_apps.json'
+
+    def __init__(self, base_path, settings=None):
+        self.base_path = Path(base_path)
+        self.settings = settings
+        self.parsed_files = 0
+        self._apps = None
+        self.source_root, self.settings_path = self._locate_settings()
+
+    def _locate_settings(self):
+        settings = self.settings or os.environ.get('DJANGO_SETTINGS_MODULE')
+        if not settings:
+            manage_py = self.base_path / 'manage.py'
+            if manage_py.is_file():
+                settings = settings_module_from_manage_py(manage_py)
+        if not settings:
+            return self.base_path, None
+
+        if settings.endswith('.py') or os.sep in settings or '/' in settings:
+            settings_path = (self.base_path / settings).resolve()
+            if not settings_path.is_file():
+                return self.base_path, None
+            # The source root is the first ancestor that is not a package
+            source_root = settings_path.parent
+            while (source_root / '__init__.py').is_file() and source_root.parent != source_root:
+                source_root = source_root.parent
+            return source_root, settings_path
+
+        return self.base_path, _module_file(self.base_path, settings)
+
+    def resolve(self, app_name):
+        """
+        Return the folder of an installed app.
+
+        Args:
+            app_name: Folder name (e.g. ``shop``) or dotted app name (e.g. ``apps.shop``)
+
+        Returns:
+            Path or None: The app folder, or None if no installed app matches
+        """
+        if self.settings_path is None:
+            return None
+
+        for dotted_name, rel_path in self.apps().items():
+            if dotted_name == app_name or dotted_name.rsplit('.', 1)[-1] == app_name:
+                app_path = self.source_root / rel_path
+                if app_path.is_dir():
+                    return app_path
+        return None
+
+    def apps(self):
+        """
+        Map the dotted name of every installed app that lives in the project to
+        its folder, relative to the source root.
+        """
+        if self._apps is not None:
+            return self._apps
+
+        cached = read_cache_file(self.base_path, self.CACHE_FILE)
+        if (
+            cached
+            and cached.get('settings') == str(self.settings_path)
+            and cached.get('mtimes')
+            and all(self._mtime(path) == mtime for path, mtime in cached['mtimes'].items())
+        ):
+            self._apps = cached['apps']
+            return self._apps
+
+        mtimes = {}
+        entries = self._installed_apps(self.settings_path, mtimes, set())
+        apps = {}
+        for entry in entries:
+            dotted_name = self._app_name(entry, mtimes)
+            rel_path = dotted_name.replace('.', '/')
+            if dotted_name not in apps and (self.source_root / rel_path).is_dir():
+                apps[dotted_name] = rel_path
+
+        self._apps = apps
+        write_cache_file(self.base_path, self.CACHE_FILE, {
+            'settings': str(self.settings_path),
+            'mtimes': mtimes,
+            'apps': apps,
+        })
+        return apps
+
+    @staticmethod
+    def _mtime(path):
+        try:
+            return os.stat(path).st_mtime_ns
+        except OSError:
+            return None
+
+    def _installed_apps(self, settings_path, mtimes, seen, env=None):
+        """Collect INSTALLED_APPS from a settings file and the modules it star-imports."""
+        env = {} if env is None else env
+        if settings_path in seen:
+            return env.get('INSTALLED_APPS', [])
+        seen.add(settings_path)
+
+        mtimes[str(settings_path)] = self._mtime(settings_path)
+        tree = _parse_file(settings_path)
+        self.parsed_files += 1
+        if tree is None:
+            return env.get('INSTALLED_APPS', [])
+
+        for node in tree.body:
+            if isinstance(node, ast.ImportFrom) and any(alias.name == '*' for alias in node.names):
+                module_path = self._resolve_import(settings_path, node)
+                if module_path:
+                    self._installed_apps(module_path, mtimes, seen, env)
+            elif isinstance(node, ast.Assign):
+                for target in node.targets:
+                    if isinstance(target, ast.Name):
+                        env[target.id] = _string_list(node.value, env)
+            elif isinstance(node, ast.AugAssign) and isinstance(node.target, ast.Name):
+                env[node.target.id] = env.get(node.target.id, []) + _string_list(node.value, env)
+            elif (
+                isinstance(node, ast.Expr)
+                and isinstance(node.value, ast.Call)
+                and isinstance(node.value.func, ast.Attribute)
+                and isinstance(node.value.func.value, ast.Name)
+                and node.value.func.attr in ('append', 'extend')
+                and node.value.args
+            ):
+                name = node.value.func.value.id
+                arg = node.value.args[0]
+                if node.value.func.attr == 'append':
+                    values = [arg.value] if isinstance(arg, ast.Constant) and isinstance(arg.value, str) else []
+                else:
+                    values = _string_list(arg, env)
+                env[name] = env.get(name, []) + values
+
+        return env.get('INSTALLED_APPS', [])
+
+    def _resolve_import(self, settings_path, node):
+        if node.level:
+            package_dir = settings_path.parent
+            for _ in range(node.level - 1):
+                package_dir = package_dir.parent
+            if not node.module:
+                return None
+            return _module_file(package_dir, node.module)
+        return _module_file(self.source_root, node.module)
+
+    def _app_name(self, entry, mtimes):
+        """Turn an INSTALLED_APPS entry into a dotted app name, following AppConfig paths."""
+        module_name, _, last = entry.rpartition('.')
+        if not module_name or not last[:1].isupper():
+            return entry
+
+        # 'shop.apps.ShopConfig': read ShopConfig.name from shop/apps.py
+        module_path = _module_file(self.source_root, module_name)
+        if module_path:
+            mtimes[str(module_path)] = self._mtime(module_path)
+            tree = _parse_file(module_path)
+            self.parsed_files += 1
+            for node in (tree.body if tree else []):
+                if isinstance(node, ast.ClassDef) and node.name == last:
+                    for statement in node.body:
+                        if (
+                            isinstance(statement, ast.Assign)
+                            and any(isinstance(t, ast.Name) and t.id == 'name' for t in statement.targets)
+                            and isinstance(statement.value, ast.Constant)
+                        ):
+                            return statement.value.value
+
+        if module_name.endswith('.apps'):
+            return module_name[:-len('.apps')]
+        return module_name
@@ -0,0 +1,168 @@
+import os
+from collections import deque, namedtuple
+from fnmatch import fnmatch
+from pathlib import Path
+
+
+# Directories that never contain Django apps but can hold huge trees.
+HEAVY_DIRS = frozenset({
+    '.git', '.hg', '.svn', '.tox', '.nox', '.venv', 'venv',
+    '.mypy_cache', '.pytest_cache', '.ruff_cache', '.django-create',
+    '__pycache__', 'node_modules', 'bower_components', 'site-packages',
+    'media', 'staticfiles', 'htmlcov',
+})
+
+# Files whose presence marks a folder as a Django app.
+APP_MARKERS = frozenset({'apps.py', 'models.py'})
+
+WalkResult = namedtuple('WalkResult', ['path', 'visited'])
+
+
+class GitIgnore:
+    """
+    The directory patterns of one ``.gitignore`` file, parsed on first use.
+
+    Supports comments, negation (``!``), anchored patterns (leading ``/`` or a
+    ``/`` in the middle) and directory-only patterns (trailing ``/``), which
+    covers what matters for pruning directories.
+    """
+
+    def __init__(self, path, base_rel):
+        self.path = path
+        self.base_rel = base_rel
+        self._rules = None
+
+    @property
+    def rules(self):
+        if self._rules is None:
+            self._rules = []
+            try:
+                lines = Path(self.path).read_text(errors='ignore').splitlines()
+            except OSError:
+                lines = []
+            for line in lines:
+                line = line.strip()
+                if not line or line.startswith('#'):
+                    continue
+                negated = line.startswith('!')
+                if negated:
+                    line = line[1:]
+                line = line.rstrip('/')
+                anchored = '/' in line
+                self._rules.append((line.lstrip('/'), anchored, negated))
+        return self._rules
+
+    def match(self, rel_path, name):
+        """Return True/False if a rule decides ``rel_path``, None otherwise."""
+        if self.base_rel:
+            if not rel_path.startswith(self.base_rel + '/'):
+                return None
+            rel_path = rel_path[len(self.base_rel) + 1:]
+
+        decision = None
+        for pattern, anchored, negated in self.rules:
+            if fnmatch(rel_path if anchored else name, pattern):
+                decision = not negated
+        return decision
+
+
+class IgnoreRules:
+    """
+    Decides which directories a discovery walk may skip: well-known heavy
+    folders, hidden folders, virtualenvs and anything matched by a ``.gitignore``.
+    """
+
+    def __init__(self, keep=()):
+        self.keep = frozenset(keep)
+
+    def gitignore(self, dir_path, rel_path):
+        """Return the ``.gitignore`` of a directory as a lazily parsed rule set."""
+        return GitIgnore(os.path.join(dir_path, '.gitignore'), rel_path)
+
+    def is_ignored(self, rel_path, name, gitignores):
+        """
+        Check whether a subdirectory should be pruned.
+
+        Args:
+            rel_path: Path of the directory relative to the walk root
+            name: Directory name
+            gitignores: ``GitIgnore`` objects of the directory's ancestors
+
+        Returns:
+            bool: True if the directory should not be descended into
+        """
+        if name in self.keep:
+            return False
+        if name in HEAVY_DIRS or name.startswith('.'):
+            return True
+
+        ignored = False
+        for gitignore in gitignores:
+            decision = gitignore.match(rel_path, name)
+            if decision is not None:
+                ignored = decision
+        return ignored
+
+    @staticmethod
+    def is_virtualenv(entry_names):
+        return 'pyvenv.cfg' in entry_names
+
+
+def walk_for_app(app_name, root, max_depth=None, ignore=None):
+    """
+    Breadth-first search for the folder of ``app_name`` using ``os.scandir``.
+
+    Heavy and ignored directories are pruned, and the walk stops at the first
+    folder named ``app_name`` that looks like a Django app (contains ``apps.py``
+    or ``models.py``). If no such folder exists, the shallowest folder with the
+    right name is returned instead.
+
+    Args:
+        app_name: Name of the app folder to find
+        root: Directory to start from
+        max_depth: Deepest level to search (direct children of root are level 1)
+        ignore: ``IgnoreRules`` to prune with
+
+    Returns:
+        WalkResult: The app path (or None) and the number of directories listed
+    """
+    root = Path(root)
+    ignore = ignore or IgnoreRules(keep={app_name})
+    queue = deque([('', 0, ())])
+    visited = 0
+    fallback = None
+
+    while queue:
+        rel_path, depth, gitignores = queue.popleft()
+        dir_path = os.path.join(root, rel_path)
+        try:
+            with os.scandir(dir_path) as it:
+                entries = list(it)
+        except OSError:
+            continue
+        visited += 1
+
+        names = {entry.name for entry in entries}
+        if rel_path and ignore.is_virtualenv(names):
+            continue
+
+        if rel_path and rel_path.rsplit('/', 1)[-1] == app_name:
+            if names & APP_MARKERS:
+                return WalkResult(root / rel_path, visited)
+            if fallback is None:
+                fallback = root / rel_path
+
+        if max_depth is not None and depth >= max_depth:
+            continue
+
+        if '.gitignore' in names:
+            gitignores = gitignores + (ignore.gitignore(dir_path, rel_path),)
+
+        for entry in sorted(entries, key=lambda e: e.name):
+            if not entry.is_dir(follow_symlinks=False):
+                continue
+            child_rel = f"{rel_path}/{entry.name}" if rel_path else entry.name
+            if not ignore.is_ignored(child_rel, entry.name, gitignores):
+                queue.append((child_rel, depth + 1, gitignores))
+
+    return WalkResult(fallback, visited)
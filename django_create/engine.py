@@ -0,0 +1,93 @@
+from pathlib import Path
+from .layout import ProjectLayout
+from .overlay import current_overlay
+from .utils import Utils, snake_case
+
+
+def class_module_name(module_type, class_name):
+    """
+    Name of the module a class of ``module_type`` gets in the module's folder.
+
+    Args:
+        module_type: 'models', 'views', 'serializers', 'viewsets' or 'tests'
+        class_name: Name of the class
+
+    Returns:
+        str: The module name, without ``.py``; tests get a ``test_`` prefix
+    """
+    module_name = snake_case(class_name)
+    return f"test_{module_name}" if module_type == 'tests' else module_name
+
+
+class CreateEngine:
+    """
+    Creates elements of an app from class sources, in process.
+
+    The create commands (given a ``class_dict``) and ``folderize`` go through
+    it: the app is looked up once by the caller and its layout snapshot is
+    shared by every class created, so creating a class costs the import
+    rewriting and the (in-memory) file writes only.
+
+    A class goes to the app's single-file module when there is one
+    (``models.py``), otherwise to its own module in the module's folder
+    (``models/product.py``), which the folder's ``__init__.py`` exports.
+    """
+
+    def __init__(self, app_path, layout=None):
+        self.app_path = Path(app_path)
+        self.layout = layout or ProjectLayout.scan(self.app_path)
+
+    def create(self, module_type, class_name, class_source, imports="", path=None):
+        """
+        Create a class from its source.
+
+        Args:
+            module_type: 'models', 'views', 'serializers', 'viewsets' or 'tests'
+            class_name: Name of the class
+            class_source: Source of the class
+            imports: Import statements the class needs
+            path: Optional subdirectory of the module folder
+
+        Returns:
+            Path: The file the class was written to
+        """
+        content = class_source
+        if imports:
+            content = Utils.process_template_imports(f"{imports}\n\n{class_source}", self.app_path, self.layout)
+
+        if self.layout.has_file(module_type):
+            file_path = self.app_path / f"{module_type}.py"
+            Utils.write_or_append_content(file_path, content, module_type)
+            return file_path
+
+        folder_path = self.app_path / module_type
+        current_overlay().mkdir(folder_path)
+        if path:
+            folder_path = folder_path / Path(path)
+            current_overlay().mkdir(folder_path)
+
+        module_name = class_module_name(module_type, class_name)
+        file_path = folder_path / f"{module_name}.py"
+        Utils.write_or_append_content(file_path, content, module_type)
+        Utils.write_or_append_content(folder_path / '__init__.py', f"from .{module_name} import {class_name}", 'init')
+        return file_path
+
+    def create_model(self, class_name, class_source, imports="", path=None):
+        """Create a model from its source; see ``create``."""
+        return self.create('models', class_name, class_source, imports, path)
+
+    def create_view(self, class_name, class_source, imports="", path=None):
+        """Create a view from its source; see ``create``."""
+        return self.create('views', class_name, class_source, imports, path)
+
+    def create_serializer(self, class_name, class_source, imports="", path=None):
+        """Create a serializer from its source; see ``create``."""
+        return self.create('serializers', class_name, class_source, imports, path)
+
+    def create_viewset(self, class_name, class_source, imports="", path=None):
+        """Create a viewset from its source; see ``create``."""
+        return self.create('viewsets', class_name, class_source, imports, path)
+
+    def create_test(self, class_name, class_source, imports="", path=None):
+        """Create a test case from its source; see ``create``."""
+        return self.create('tests', class_name, class_source, imports, path)
@@ -0,0 +1,151 @@
+import ast
+from pathlib import Path
+from .overlay import current_overlay
+from .session import current_session
+
+
+class ExportRegistry:
+    """
+    The exports of a package ``__init__.py``.
+
+    The file is parsed once into a set of ``(module, name)`` pairs, one per
+    ``from .module import Name`` it contains, plus the names of its
+    ``__all__``. Everything else in the file is kept as it is, before or after
+    the exports. Adding an export is a set lookup; the file is rendered and
+    written once, at the end of the run, with the exports sorted and a sorted
+    ``__all__``.
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.exports = set()
+        self.all_names = set()
+        self._head = []
+        self._tail = []
+        self._original = self._load()
+
+    @classmethod
+    def for_file(cls, path):
+        """
+        Return the registry of an ``__init__.py`` for the current run.
+
+        Args:
+            path: Path to the ``__init__.py``
+
+        Returns:
+            ExportRegistry: The registry, loaded on first use and shared by the run
+        """
+        path = Path(path).resolve()
+        return current_session().cached(('exports', path), lambda: cls(path))
+
+    def _load(self):
+        try:
+            source = current_overlay().read_text(self.path)
+        except OSError:
+            return None
+        head, tail = self._collect(source)
+        self._head.extend(head)
+        self._tail.extend(tail)
+        return source
+
+    def _collect(self, source):
+        """
+        Record the exports and ``__all__`` names of ``source``.
+
+        Returns:
+            tuple: The other lines of ``source`` before the first export or
+            ``__all__``, and after it
+        """
+        try:
+            tree = ast.parse(source)
+        except SyntaxError:
+            return source.splitlines(), []
+
+        lines = source.splitlines()
+        consumed = set()
+        for node in tree.body:
+            if (
+                isinstance(node, ast.ImportFrom)
+                and node.level == 1
+                and node.module
+                and all(alias.asname is None and alias.name != '*' for alias in node.names)
+            ):
+                self.exports.update((node.module, alias.name) for alias in node.names)
+            elif (
+                isinstance(node, ast.Assign)
+                and any(isinstance(target, ast.Name) and target.id == '__all__' for target in node.targets)
+                and isinstance(node.value, (ast.List, ast.Tuple))
+            ):
+                self.all_names.update(
+                    element.value for element in node.value.elts
+                    if isinstance(element, ast.Constant) and isinstance(element.value, str)
+                )
+            else:
+                continue
+            consumed.update(range(node.lineno - 1, getattr(node, 'end_lineno', node.lineno)))
+
+        first = min(consumed, default=len(lines))
+        head = lines[:first]
+        tail = [line for index, line in enumerate(lines[first:], first) if index not in consumed]
+        return head, tail
+
+    def add(self, module, name):
+        """
+        Export ``name`` from the sibling module ``module``.
+
+        Returns:
+            bool: False if the export was already there
+        """
+        if (module, name) in self.exports:
+            return False
+        self.exports.add((module, name))
+        return True
+
+    def add_source(self, source):
+        """Add the exports in ``source``; other statements are kept as they are."""
+        head, tail = self._collect(source)
+        self._tail.extend(line for line in head + tail if line.strip() and line not in self._tail)
+
+    def render(self):
+        """
+        Render the ``__init__.py``.
+
+        Returns:
+            str: The preserved content with the sorted exports in place, then ``__all__``
+        """
+        parts = []
+        head = '\n'.join(self._head).strip('\n')
+        if head:
+            parts.append(head + '\n')
+        if self.exports:
+            parts.append(''.join(
+                f"from .{module} import {name}\n" for module, name in sorted(self.exports)
+            ))
+        # Removed exports can leave blank lines behind; keep at most one in a row
+        tail_lines = [
+            line for index, line in enumerate(self._tail)
+            if line.strip() or index == 0 or self._tail[index - 1].strip()
+        ]
+        tail = '\n'.join(tail_lines).strip('\n')
+        if tail:
+            parts.append(f"\n{tail}\n")
+        names = self.all_names | {name for _, name in self.exports}
+        if names:
+            items = ''.join(f"    '{name}',\n" for name in sorted(names))
+            parts.append(f"\n__all__ = [\n{items}]\n")
+        return ''.join(parts)
+
+    def save(self):
+        """
+        Write the file if its content changed.
+
+        Returns:
+            bool: True if the file was written
+        """
+        content = self.render()
+        if content == self._original:
+            return False
+        current_overlay().write_text(self.path, content)
+        self._original = content
+        current_session().stats['init_files_written'] += 1
+        return True
@@ -0,0 +1,915 @@
+import ast
+import mmap
+import os
+import re
+import weakref
+from array import array
+from collections import namedtuple
+from collections.abc import Mapping
+from .imports import ImportBlock
+
+
+# Django relation fields, which also accept their target model by name
+RELATION_FIELDS = frozenset(['ForeignKey', 'OneToOneField', 'ManyToManyField'])
+
+# Module files at least this large are extracted with ``stream_classes``
+STREAMING_THRESHOLD = 16 * 1024 * 1024
+
+# Lines that can start a top-level statement, and those continuing the one before
+_STATEMENT_START_PATTERN = re.compile(rb'[A-Za-z_@\x80-\xff]')
+_CONTINUATION_PATTERN = re.compile(rb'(?:else|elif|except|finally)\b')
+
+# What changes the string and bracket state of a line: comments, quotes and brackets
+_TOKEN_PATTERN = re.compile(rb'#|\'\'\'|"""|[\'"()\[\]{}]')
+# The rest of a string up to its closing quote, by opening quote
+_STRING_END_PATTERNS = {
+    quote: re.compile(rb'(?:\\.|[^\\])*?' + re.escape(quote), re.DOTALL)
+    for quote in (b"'''", b'"""')
+}
+_STRING_END_PATTERNS.update({
+    quote: re.compile(rb'(?:\\.|[^\\\n' + quote + rb'])*' + quote, re.DOTALL)
+    for quote in (b"'", b'"')
+})
+_OPENING_BRACKETS = frozenset([b'(', b'[', b'{'])
+_CLOSING_BRACKETS = frozenset([b')', b']', b'}'])
+
+# A comment keeping an unused import
+_NOQA_PATTERN = re.compile(r'#\s*noqa\b', re.IGNORECASE)
+# The dots of a relative import statement
+_RELATIVE_LEVEL_PATTERN = re.compile(r'from\s+(\.+)')
+
+# Statements are parsed in pieces of about this many bytes
+_PIECE_SIZE = 64 * 1024
+
+# Pages of a memory-mapped module are handed back to the system every this many bytes
+_RELEASE_INTERVAL = 8 * 1024 * 1024
+
+
+class SharedCode(namedtuple('SharedCode', ['statements', 'imports', 'names', 'class_references', 'common_names'])):
+    """
+    Top-level code of a module other than its imports and classes.
+
+    ``statements`` lists the source of each statement, in module order;
+    ``imports`` the import statements they need; ``names`` the public names
+    they define; ``class_references`` the classes of the module they
+    reference and ``common_names`` the names of the module's common code
+    they use (see ``ModuleContents``).
+    """
+
+    __slots__ = ()
+
+
+_NO_SHARED_CODE = SharedCode([], [], [], [], [])
+
+# A top-level statement other than an import or a class: its source, the
+# names it binds, those of them to export, the names it references, those
+# of them it looks up once run (not only in function bodies), and whether
+# it runs for its effect
+_Statement = namedtuple('_Statement', ['source', 'bound', 'exported', 'referenced', 'evaluated', 'runs'])
+
+
+class ModuleContents(namedtuple('ModuleContents', [
+    'import_statements', 'classes', 'class_imports', 'class_references', 'class_common', 'class_hooks', 'common',
+    'hooks', 'side_effect_imports',
+])):
+    """
+    The top-level import statements, classes and other code of a module.
+
+    ``import_statements`` lists the source of each import statement;
+    ``classes`` maps each class name to its source, in module order;
+    ``class_imports`` to the import statements the class needs: those binding
+    a name it references, reduced to the names it references;
+    ``class_references`` to the other classes of the module it references,
+    in module order; ``class_common`` to the names of ``common`` it uses; and
+    ``class_hooks`` to the names of ``hooks`` it uses, which it cannot import.
+
+    The remaining top-level code is split in two ``SharedCode`` parts:
+    ``common`` holds the functions, constants and other statements that do
+    not need the module's classes when the module is imported, which classes
+    can import (its functions may use classes once called); ``hooks`` the
+    statements that run against the classes, or only for their effect
+    (signal receivers, registrations), which have to be imported after them.
+
+    ``side_effect_imports`` lists the imports of names the module never uses
+    that may be there for their side effect (``from . import signals``),
+    relative ones made a level deeper (see ``_unused_imports``).
+    """
+
+    __slots__ = ()
+
+    @property
+    def imports(self):
+        """The module's import statements, one after the other."""
+        return '\n'.join(self.import_statements)
+
+
+class _LazyMapping(Mapping):
+    """Read-only mapping over given keys, computing each value when it is looked up."""
+
+    def __init__(self, keys, compute):
+        self._keys = keys
+        self._compute = compute
+
+    def __getitem__(self, key):
+        if key not in self._keys:
+            raise KeyError(key)
+        return self._compute(key)
+
+    def __iter__(self):
+        return iter(self._keys)
+
+    def __len__(self):
+        return len(self._keys)
+
+
+def _bound_name(node, alias):
+    """The name an import alias binds in the module namespace."""
+    if alias.asname:
+        return alias.asname
+    if isinstance(node, ast.Import):
+        return alias.name.partition('.')[0]
+    return alias.name
+
+
+# Nodes that never have a name or a call below them
+_LEAF_NODES = (ast.Constant, ast.expr_context, ast.alias, ast.operator, ast.cmpop, ast.unaryop)
+
+
+def _children(node, stack):
+    """Push the children of ``node`` that can be or hold names or calls onto ``stack``."""
+    for field in node._fields:
+        value = getattr(node, field, None)
+        if type(value) is list:
+            for item in value:
+                if isinstance(item, ast.AST) and not isinstance(item, _LEAF_NODES):
+                    stack.append(item)
+        elif isinstance(value, ast.AST) and not isinstance(value, _LEAF_NODES):
+            stack.append(value)
+
+
+def _walk(node):
+    """
+    Iterate over ``node`` and the nodes below it that can be or hold a
+    ``Name`` or a ``Call``, like ``ast.walk`` but faster.
+    """
+    stack = [node]
+    while stack:
+        node = stack.pop()
+        yield node
+        _children(node, stack)
+
+
+def _evaluated_names(node):
+    """
+    Collect the names a top-level statement looks up when it runs.
+
+    Function and lambda bodies only run once called: of a function, only
+    the decorators, default values and annotations count.
+    """
+    names = []
+    stack = [node]
+    while stack:
+        child = stack.pop()
+        kind = type(child)
+        if kind is ast.Name:
+            names.append(child.id)
+        elif kind is ast.FunctionDef or kind is ast.AsyncFunctionDef:
+            arguments = child.args
+            stack.extend(child.decorator_list)
+            stack.extend(arguments.defaults)
+            stack.extend(default for default in arguments.kw_defaults if default is not None)
+            for argument in (
+                arguments.posonlyargs + arguments.args + arguments.kwonlyargs + [arguments.vararg, arguments.kwarg]
+            ):
+                if argument is not None and argument.annotation is not None:
+                    stack.append(argument.annotation)
+            if child.returns is not None:
+                stack.append(child.returns)
+        elif kind is ast.Lambda:
+            stack.extend(child.args.defaults)
+            stack.extend(default for default in child.args.kw_defaults if default is not None)
+        else:
+            _children(child, stack)
+    return tuple(dict.fromkeys(names))
+
+
+def _bound_names(node):
+    """
+    Collect the names a top-level statement binds in the module namespace.
+
+    Returns:
+        tuple: (names, imported): the names bound, and those bound by an import
+    """
+    names = []
+    imported = []
+    stack = [node]
+    while stack:
+        child = stack.pop()
+        if isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            names.append(child.name)
+            continue
+        if isinstance(child, (ast.Lambda, ast.ListComp, ast.SetComp, ast.DictComp, ast.GeneratorExp)):
+            # Their names are local to them
+            continue
+        if isinstance(child, ast.Name) and isinstance(child.ctx, ast.Store):
+            names.append(child.id)
+        elif isinstance(child, (ast.Import, ast.ImportFrom)):
+            imported.extend(_bound_name(child, alias) for alias in child.names if alias.name != '*')
+        elif isinstance(child, ast.ExceptHandler) and child.name:
+            names.append(child.name)
+        stack.extend(reversed(list(ast.iter_child_nodes(child))))
+    return tuple(dict.fromkeys(names + imported)), tuple(imported)
+
+
+def _call_targets(call):
+    """Return the ``Name`` nodes naming the target model if ``call`` creates a relation field."""
+    function = call.func
+    function_name = function.attr if isinstance(function, ast.Attribute) else getattr(function, 'id', None)
+    if function_name not in RELATION_FIELDS:
+        return []
+    arguments = call.args[:1] + [keyword.value for keyword in call.keywords if keyword.arg == 'to']
+    return [argument for argument in arguments if isinstance(argument, ast.Name)]
+
+
+def _relation_targets(node):
+    """Return the ``Name`` nodes naming the target model of a relation field in a class."""
+    targets = []
+    for child in _walk(node):
+        if isinstance(child, ast.Call):
+            targets.extend(_call_targets(child))
+    return targets
+
+
+def _referenced_names(node):
+    """
+    Collect the names a class references.
+
+    Returns:
+        tuple: (names, lazy): the distinct names referenced, and those only
+        ever referenced as the target of a relation field
+    """
+    counts = {}
+    targets = {}
+    # The hottest loop of extraction: ``_walk`` inlined, with local lookups
+    Name, Call, AST, leaves = ast.Name, ast.Call, ast.AST, _LEAF_NODES
+    stack = [node]
+    pop, push = stack.pop, stack.append
+    while stack:
+        child = pop()
+        kind = type(child)
+        if kind is Name:
+            counts[child.id] = counts.get(child.id, 0) + 1
+            continue
+        if kind is Call:
+            for target in _call_targets(child):
+                targets[target.id] = targets.get(target.id, 0) + 1
+        for field in child._fields:
+            value = getattr(child, field, None)
+            if type(value) is list:
+                for item in value:
+                    if isinstance(item, AST) and not isinstance(item, leaves):
+                        push(item)
+            elif isinstance(value, AST) and not isinstance(value, leaves):
+                push(value)
+    lazy = frozenset(name for name, count in targets.items() if counts[name] == count)
+    return tuple(counts), lazy
+
+
+def _strongly_connected(graph):
+    """
+    Group the nodes of a graph into strongly connected components (Tarjan's algorithm).
+
+    Args:
+        graph: Dict mapping each node to the nodes it points to
+
+    Returns:
+        dict: The component of each node, as the node that identifies it
+    """
+    index = {}
+    low = {}
+    stack = []
+    on_stack = set()
+    component = {}
+
+    def visit(node):
+        index[node] = low[node] = len(index)
+        stack.append(node)
+        on_stack.add(node)
+        work.append((node, iter(graph[node])))
+
+    for root in graph:
+        if root in index:
+            continue
+        work = []
+        visit(root)
+        while work:
+            node, children = work[-1]
+            for child in children:
+                if child not in index:
+                    visit(child)
+                    break
+                if child in on_stack:
+                    low[node] = min(low[node], index[child])
+            else:
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    low[parent] = min(low[parent], low[node])
+                if low[node] == index[node]:
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        component[member] = node
+                        if member == node:
+                            break
+    return component
+
+
+def _replace_names(lines, nodes):
+    """
+    Turn ``Name`` nodes into string literals, in place.
+
+    Args:
+        lines: Source lines
+        nodes: ``Name`` nodes of the source parsed from ``lines``
+    """
+    # Right to left, so earlier offsets on the same line stay valid
+    for node in sorted(nodes, key=lambda node: (node.lineno, node.col_offset), reverse=True):
+        row = node.lineno - 1
+        line = lines[row].encode('utf-8')
+        # ast offsets count UTF-8 bytes
+        end_col_offset = getattr(node, 'end_col_offset', None) or node.col_offset + len(node.id.encode('utf-8'))
+        lines[row] = (
+            line[:node.col_offset] + f"'{node.id}'".encode('utf-8') + line[end_col_offset:]
+        ).decode('utf-8')
+
+
+def _render_import(node, aliases, level=None):
+    """Render an import statement importing only ``aliases`` of ``node``, optionally at another ``level``."""
+    if isinstance(node, ast.Import):
+        return 'import ' + ', '.join(
+            f"{alias.name} as {alias.asname}" if alias.asname else alias.name for alias in aliases
+        )
+    block = ImportBlock()
+    key = ('from', node.level if level is None else level, node.module or '')
+    block.from_imports[key] = {(alias.name, alias.asname) for alias in aliases}
+    return block.render()
+
+
+def _deeper_import(node, aliases, text):
+    """
+    Render a relative import statement a level deeper, for the package the
+    module is split into; its source, comments included, is kept when it
+    imports nothing but ``aliases``.
+    """
+    if text is not None and len(aliases) == len(node.names):
+        match = _RELATIVE_LEVEL_PATTERN.match(text)
+        if match and len(match.group(1)) == node.level:
+            return f"{text[:match.start(1)]}.{text[match.start(1):]}"
+    return _render_import(node, aliases, node.level + 1)
+
+
+def _imports_for(imports, names):
+    """
+    Reduce import statements to the ones binding any of ``names``.
+
+    The imports are for a module of the package the module is split into:
+    relative imports are made one level deeper (``from .validators import``
+    becomes ``from ..validators import``).
+
+    Args:
+        imports: (node, source) pairs of import statements; the source is None
+            for statements that share a line with another one
+        names: Names referenced by the code the imports are for
+
+    Returns:
+        list: Statement sources; statements importing unused names too are
+        rendered again with only the used ones
+    """
+    needed = []
+    for node, text in imports:
+        if isinstance(node, ast.ImportFrom) and node.module == '__future__':
+            # Compiler directives apply to any code
+            aliases = node.names
+        else:
+            aliases = [
+                alias for alias in node.names
+                if alias.name == '*' or _bound_name(node, alias) in names
+            ]
+        if not aliases:
+            continue
+        if isinstance(node, ast.ImportFrom) and node.level:
+            needed.append(_deeper_import(node, aliases, text))
+        elif len(aliases) == len(node.names) and text is not None:
+            needed.append(text)
+        else:
+            needed.append(_render_import(node, aliases))
+    return needed
+
+
+def _unused_imports(imports, names):
+    """
+    Collect the imports that bind none of ``names`` but may be there for
+    their side effect: module imports (``import app.checks``), relative
+    imports (``from . import signals``) and those marked ``# noqa``. Unused
+    names imported from other packages (``from django.shortcuts import
+    render``) are left out.
+
+    Relative imports are made one level deeper, for the package the module
+    is split into.
+
+    Args:
+        imports: (node, source) pairs of import statements; the source is None
+            for statements that share a line with another one
+        names: Names referenced anywhere in the module
+
+    Returns:
+        list: Statement sources, importing only the unused names
+    """
+    unused = []
+    for node, text in imports:
+        relative = isinstance(node, ast.ImportFrom) and node.level
+        if not (isinstance(node, ast.Import) or relative or (text and _NOQA_PATTERN.search(text))):
+            continue
+        aliases = [
+            alias for alias in node.names
+            if alias.name != '*' and _bound_name(node, alias) not in names
+        ]
+        if not aliases:
+            continue
+        if relative:
+            unused.append(_deeper_import(node, aliases, text))
+        elif len(aliases) == len(node.names) and text is not None:
+            unused.append(text)
+        else:
+            unused.append(_render_import(node, aliases))
+    return unused
+
+
+def _leading_comment_start(lines, start, floor):
+    """
+    Return the first line of the comment block directly above line ``start``.
+
+    Args:
+        lines: The module's lines
+        start: Index of the first line of a statement
+        floor: Index of the first line that may belong to the block (the line
+            after the previous statement)
+    """
+    while start > floor and lines[start - 1].lstrip().startswith('#'):
+        start -= 1
+    return start
+
+
+class _Scanner:
+    """
+    Collects the top-level imports and classes of a module, from one or more
+    parsed pieces of it, and resolves the references between the classes.
+
+    Of each class only where its source is and the names it references are
+    kept, in flat arrays and shared tuples, so that modules with hundreds of
+    thousands of classes take little memory.
+    """
+
+    def __init__(self):
+        self.statements = []
+        self.imports = []
+        self.classes = {}
+        self._starts = array('q')
+        self._ends = array('q')
+        self._names = []
+        self._lazy = []
+        self._shared = {}
+        self._others = []
+        self._first = True
+
+    def _share(self, value):
+        return self._shared.setdefault(value, value)
+
+    def scan(self, tree, lines, position):
+        """
+        Record the top-level statements of a piece of the module.
+
+        Args:
+            tree: The piece, parsed
+            lines: Its lines
+            position: Function of a line index returning where the line can
+                be read back from
+        """
+        previous = None
+        previous_end = 0
+        previous_other = False
+        for node in tree.body:
+            first, self._first = self._first, False
+            other = False
+            start = node.lineno - 1
+            if isinstance(node, (ast.ClassDef, ast.FunctionDef, ast.AsyncFunctionDef)) and node.decorator_list:
+                start = min(decorator.lineno for decorator in node.decorator_list) - 1
+            # Python 3.8+ records where a statement ends
+            end = getattr(node, 'end_lineno', None) or node.lineno
+
+            if isinstance(node, (ast.Import, ast.ImportFrom)):
+                if start >= previous_end:
+                    text = '\n'.join(lines[start:end])
+                    self.statements.append(text)
+                    self.imports.append((node, text))
+                else:
+                    # Shares a line with the previous statement (``import a; import b``):
+                    # the line is not the source of this import alone
+                    if self.imports and self.imports[-1][0] is previous:
+                        self.imports[-1] = (previous, None)
+                    else:
+                        self.statements.append(_render_import(node, node.names))
+                    self.imports.append((node, None))
+            elif isinstance(node, ast.ClassDef):
+                start = _leading_comment_start(lines, start, previous_end)
+                names, lazy = _referenced_names(node)
+                index = self.classes.setdefault(node.name, len(self._names))
+                if index == len(self._names):
+                    self._starts.append(0)
+                    self._ends.append(0)
+                    self._names.append(None)
+                    self._lazy.append(None)
+                # A class defined again replaces the earlier one
+                self._starts[index] = position(start)
+                self._ends[index] = position(end)
+                self._names[index] = self._share(names)
+                self._lazy[index] = self._share(lazy)
+            elif first and isinstance(node, ast.Expr) and isinstance(node.value, ast.Constant) and isinstance(node.value.value, str):
+                # The module docstring describes the module being split up
+                pass
+            else:
+                bound, imported = _bound_names(node)
+                # Names it imports are not its own to export
+                exported = tuple(name for name in bound if name not in imported and not name.startswith('_'))
+                referenced = _referenced_names(node)[0]
+                evaluated = _evaluated_names(node)
+                runs = isinstance(node, ast.Expr)
+                if start < previous_end and previous_other:
+                    # Shares a line with the previous statement: one source for both
+                    last = self._others[-1]
+                    self._others[-1] = last._replace(
+                        bound=last.bound + bound,
+                        exported=last.exported + exported,
+                        referenced=last.referenced + referenced,
+                        evaluated=last.evaluated + evaluated,
+                        runs=last.runs or runs,
+                    )
+                else:
+                    start = _leading_comment_start(lines, start, previous_end)
+                    self._others.append(_Statement('\n'.join(lines[start:end]), bound, exported, referenced, evaluated, runs))
+                other = True
+            previous = node
+            previous_end = end
+            previous_other = other
+
+    def contents(self, read):
+        """
+        Resolve the references between the classes.
+
+        Args:
+            read: Function of a (start, end) range reading the source of a
+                class back
+
+        Returns:
+            ModuleContents: With mappings computing the source, imports and
+            references of a class when it is looked up
+        """
+        order = self.classes
+        graph = {}
+        for name, index in order.items():
+            references = [other for other in self._names[index] if other in order and other != name]
+            if references:
+                graph[name] = sorted(references, key=order.__getitem__)
+
+        # Cycles would make the new modules import each other: break them
+        # with lazy relation targets where the class allows it
+        lazy = {}
+        nodes = dict(graph)
+        for references in graph.values():
+            for other in references:
+                nodes.setdefault(other, ())
+        component = _strongly_connected(nodes)
+        for name, references in graph.items():
+            made_lazy = [
+                other for other in references
+                if component[other] == component[name] and other in self._lazy[order[name]]
+            ]
+            if made_lazy:
+                lazy[name] = frozenset(made_lazy)
+                references[:] = [other for other in references if other not in lazy[name]]
+
+        common, hooks, common_names, hook_names = self._shared_code()
+
+        def source(name):
+            index = order[name]
+            text = read(self._starts[index], self._ends[index])
+            if name not in lazy:
+                return text
+            lines = text.split('\n')
+            targets = _relation_targets(ast.parse(text))
+            _replace_names(lines, [target for target in targets if target.id in lazy[name]])
+            return '\n'.join(lines)
+
+        return ModuleContents(
+            self.statements,
+            _LazyMapping(order, source),
+            _LazyMapping(order, lambda name: _imports_for(self.imports, self._names[order[name]])),
+            _LazyMapping(order, lambda name: graph.get(name, [])),
+            _LazyMapping(order, lambda name: sorted(
+                (other for other in self._names[order[name]] if other in common_names),
+                key=common_names.__getitem__,
+            )),
+            _LazyMapping(order, lambda name: sorted(
+                (other for other in self._names[order[name]] if other in hook_names),
+                key=hook_names.__getitem__,
+            )),
+            common,
+            hooks,
+            _unused_imports(self.imports, self._referenced()),
+        )
+
+    def _referenced(self):
+        """The names referenced anywhere in the module."""
+        referenced = set()
+        for names in set(self._names):
+            referenced.update(names)
+        for statement in self._others:
+            referenced.update(statement.referenced)
+        return referenced
+
+    def _shared_code(self):
+        """
+        Split the statements other than imports and classes into common code and hooks.
+
+        Statements that run for their effect, or that use the module's
+        classes when run, are hooks, and so is any statement using a name a
+        hook defines: common code is imported by the classes, so it cannot
+        need them before they are defined. Classes used in the bodies of
+        common functions are looked up once those are called, after the
+        classes are.
+
+        Returns:
+            tuple: (common, hooks, common_names, hook_names), the last two
+            mapping each name the common code and the hooks define to its
+            position
+        """
+        if not self._others:
+            return _NO_SHARED_CODE, _NO_SHARED_CODE, {}, {}
+
+        defined_by = {}
+        for index, statement in enumerate(self._others):
+            for name in statement.bound:
+                if name not in self.classes:
+                    defined_by[name] = index
+        hooks = {
+            index for index, statement in enumerate(self._others)
+            if statement.runs or any(name in self.classes for name in statement.evaluated)
+        }
+        changed = True
+        while changed:
+            changed = False
+            for index, statement in enumerate(self._others):
+                if index not in hooks and any(defined_by.get(name, index) in hooks for name in statement.referenced):
+                    hooks.add(index)
+                    changed = True
+
+        common_names = {}
+        hook_names = {}
+        for index, statement in enumerate(self._others):
+            names = hook_names if index in hooks else common_names
+            names.update((name, len(names)) for name in statement.bound if name in defined_by)
+
+        def part(statements):
+            if not statements:
+                return _NO_SHARED_CODE
+            referenced = {name for statement in statements for name in statement.referenced}
+            defined = {name for statement in statements for name in statement.bound}
+            return SharedCode(
+                [statement.source for statement in statements],
+                _imports_for(self.imports, referenced - defined),
+                [name for statement in statements for name in statement.exported if name in defined_by],
+                sorted((name for name in referenced if name in self.classes), key=self.classes.__getitem__),
+                sorted((name for name in referenced - defined if name in common_names), key=common_names.__getitem__),
+            )
+
+        return (
+            part([statement for index, statement in enumerate(self._others) if index not in hooks]),
+            part([statement for index, statement in enumerate(self._others) if index in hooks]),
+            common_names,
+            hook_names,
+        )
+
+
+def extract_classes(source):
+    """
+    Extract the top-level imports and classes of a module.
+
+    The module is parsed once and every statement is sliced out of the
+    original text by its line range, so class sources are verbatim: with
+    their decorators and the comment block directly above them, multi-line
+    headers and anything inside strings kept intact.
+
+    References between the classes are resolved from one graph of the whole
+    module. Where classes reference each other in a cycle, which would make
+    their modules import each other, references that are only the target of
+    a relation field (``models.ForeignKey(Order, ...)``) are turned into lazy
+    string references (``'Order'``) and dropped from ``class_references``.
+
+    Other top-level statements (functions, constants, signal receivers) are
+    kept as well, split into common code the classes can import and hooks
+    that run against the classes (see ``ModuleContents``).
+
+    Args:
+        source: Python source text
+
+    Returns:
+        ModuleContents: The imports, classes and other code, with the
+        imports, sibling classes and common code each class needs
+
+    Raises:
+        SyntaxError: If ``source`` cannot be parsed
+    """
+    lines = source.split('\n')
+    scanner = _Scanner()
+    scanner.scan(ast.parse(source), lines, lambda line: line)
+    contents = scanner.contents(lambda start, end: '\n'.join(lines[start:end]))
+    return ModuleContents(
+        contents.import_statements,
+        *(dict(mapping) for mapping in contents[1:6]),
+        contents.common,
+        contents.hooks,
+        contents.side_effect_imports,
+    )
+
+
+def _parse_lines(raw_lines):
+    """
+    Parse lines of a module.
+
+    Returns:
+        tuple: (lines, tree), with a tree of None if the lines do not parse
+    """
+    lines = [raw.decode('utf-8').rstrip('\r\n') for raw in raw_lines]
+    try:
+        return lines, ast.parse('\n'.join(lines))
+    except SyntaxError:
+        return lines, None
+
+
+def _line_state(raw, quote, depth):
+    """
+    Follow the string and bracket state of a module over one of its lines.
+
+    Args:
+        raw: The line, as bytes
+        quote: The quote of the string the line starts in, or None
+        depth: How many brackets are open at its start
+
+    Returns:
+        tuple: (quote, depth, continued) at the end of the line, ``continued``
+        telling whether it ends with a backslash continuing the statement
+    """
+    pos = 0
+    while True:
+        if quote is not None:
+            match = _STRING_END_PATTERNS[quote].match(raw, pos)
+            if match is None:
+                if len(quote) == 1 and not raw.rstrip(b'\r\n').endswith(b'\\'):
+                    # Unterminated string: the parser reports it
+                    quote = None
+                return quote, depth, False
+            pos = match.end()
+            quote = None
+
+        match = _TOKEN_PATTERN.search(raw, pos)
+        if match is None:
+            return None, depth, raw.rstrip(b'\r\n').endswith(b'\\')
+        token = match.group()
+        pos = match.end()
+        if token == b'#':
+            return None, depth, False
+        if token in _OPENING_BRACKETS:
+            depth += 1
+        elif token in _CLOSING_BRACKETS:
+            depth = max(depth - 1, 0)
+        else:
+            quote = token
+
+
+def _top_level_pieces(source):
+    """
+    Cut a module into pieces made of whole top-level statements.
+
+    Once the piece gathered so far holds about ``_PIECE_SIZE`` bytes, it ends
+    before the next line starting a statement at column 0 outside of strings
+    and brackets (followed with ``_line_state``), unless it continues the
+    statement before (``else:``, a decorated definition, a backslash). The
+    comment lines directly above the new statement go with it.
+
+    A piece is parsed once; should it not parse on its own all the same, the
+    next attempt waits for it to double in size, so that no stretch of the
+    module gets parsed more than a few times.
+
+    Args:
+        source: The module as bytes with a ``readline()`` method (a memory map)
+
+    Yields:
+        tuple: (offset, raw_lines, lines, tree) of each piece, ``offset``
+        being its position in bytes
+    """
+    pending = []
+    pending_size = 0
+    piece_size = _PIECE_SIZE
+    offset = 0
+    released = 0
+    release = getattr(source, 'madvise', None) if hasattr(mmap, 'MADV_DONTNEED') else None
+    quote = None
+    depth = 0
+    continued = decorated = False
+
+    while True:
+        raw = source.readline()
+        if not raw:
+            break
+        if quote is None and not depth and not continued and _STATEMENT_START_PATTERN.match(raw):
+            if (
+                pending_size >= piece_size
+                and not decorated
+                and not _CONTINUATION_PATTERN.match(raw)
+            ):
+                split = len(pending)
+                while split and pending[split - 1].lstrip().startswith(b'#'):
+                    split -= 1
+                lines, tree = _parse_lines(pending[:split])
+                if tree is not None:
+                    yield offset, pending[:split], lines, tree
+                    size = sum(map(len, pending[:split]))
+                    offset += size
+                    pending_size -= size
+                    pending = pending[split:]
+                    piece_size = _PIECE_SIZE
+                else:
+                    piece_size = pending_size * 2
+            decorated = raw.startswith(b'@')
+        quote, depth, continued = _line_state(raw, quote, depth)
+        pending.append(raw)
+        pending_size += len(raw)
+
+        if release is not None and offset - released >= _RELEASE_INTERVAL:
+            # Parsed lines are done with: their pages can go
+            end = offset - offset % mmap.PAGESIZE
+            release(mmap.MADV_DONTNEED, released, end - released)
+            released = end
+
+    if pending:
+        lines, tree = _parse_lines(pending)
+        if tree is None:
+            ast.parse('\n'.join(lines))  # Raises the SyntaxError
+        yield offset, pending, lines, tree
+
+
+def stream_classes(path):
+    """
+    Extract the top-level imports and classes of a module file without loading it.
+
+    For very large (generated) modules. The file is memory-mapped and cut
+    into pieces of whole top-level statements, each parsed on its own (see
+    ``_top_level_pieces``), so memory holds one piece and its syntax tree at
+    a time plus a small record per class. Class sources are read
+    back from the file one at a time, when looked up in ``classes``. The
+    result is the same as ``extract_classes`` on the file's text.
+
+    Args:
+        path: Path to a UTF-8 module file
+
+    Returns:
+        ModuleContents: As ``extract_classes``, with mappings reading and
+        computing each class's source, imports and references on lookup
+
+    Raises:
+        SyntaxError: If the module cannot be parsed
+    """
+    scanner = _Scanner()
+    f = open(path, 'rb')
+    try:
+        if os.fstat(f.fileno()).st_size:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as source:
+                for offset, raw_lines, lines, tree in _top_level_pieces(source):
+                    line_offsets = [offset]
+                    for raw in raw_lines:
+                        line_offsets.append(line_offsets[-1] + len(raw))
+                    scanner.scan(tree, lines, line_offsets.__getitem__)
+    except BaseException:
+        f.close()
+        raise
+
+    def read(start, end):
+        f.seek(start)
+        text = f.read(end - start).decode('utf-8').replace('\r\n', '\n')
+        return text[:-1] if text.endswith('\n') else text
+
+    contents = scanner.contents(read)
+    # The file stays open as long as the class sources can be looked up
+    weakref.finalize(contents.classes, f.close)
+    return contents
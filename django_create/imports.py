@@ -0,0 +1,471 @@
+import ast
+import importlib.util
+import os
+import re
+import sys
+import sysconfig
+from functools import lru_cache
+
+# A relative ``from`` import at the start of a line: leading dots and first module component
+_RELATIVE_FROM_PATTERN = re.compile(r'^[ \t]*from[ \t]+(\.{1,2})(\w+)\b', re.MULTILINE)
+
+# String literals (docstrings included) and comments, as the tokenizer sees them
+_STRING_OR_COMMENT_PATTERN = re.compile(
+    r'''(?=["'#])(?:"""[\s\S]*?"""|\'\'\'[\s\S]*?\'\'\''''
+    r'''|"(?:\\.|[^"\\\n])*"|'(?:\\.|[^'\\\n])*'|#[^\n]*)'''
+)
+
+
+def _outside_strings(source, candidates):
+    """
+    Drop the candidate matches that lie inside a string literal or a comment.
+
+    Strings and comments are scanned lazily and only up to the last candidate,
+    which for import statements is usually near the top of the file.
+    """
+    kept = []
+    index = 0
+    for span in _STRING_OR_COMMENT_PATTERN.finditer(source):
+        while index < len(candidates) and candidates[index].start() < span.start():
+            kept.append(candidates[index])
+            index += 1
+        while index < len(candidates) and candidates[index].start() < span.end():
+            index += 1
+        if index == len(candidates):
+            break
+    kept.extend(candidates[index:])
+    return kept
+
+
+def rewrite_import_levels(source, levels):
+    """
+    Rewrite the level of relative ``from`` imports of the given modules.
+
+    Only one- and two-level ``from`` import statements whose first module
+    component is a key of ``levels`` are touched, in a single pass over the
+    source: ``from .models_extra``, absolute imports and text inside strings,
+    docstrings and comments are left as they are.
+
+    Args:
+        source: Python source text
+        levels: Module name to wanted level, e.g. ``{'models': 2, 'views': 1}``
+
+    Returns:
+        str: The source with rewritten imports
+    """
+    if 'from .' not in source:
+        return source
+
+    candidates = [
+        match for match in _RELATIVE_FROM_PATTERN.finditer(source)
+        if levels.get(match.group(2), len(match.group(1))) != len(match.group(1))
+    ]
+    if not candidates:
+        return source
+
+    pieces = []
+    position = 0
+    for match in _outside_strings(source, candidates):
+        pieces.append(source[position:match.start(1)])
+        pieces.append('.' * levels[match.group(2)])
+        position = match.end(1)
+    pieces.append(source[position:])
+    return ''.join(pieces)
+
+
+IMPORT_LINE_LENGTH = 79
+# A line that may start a module docstring: a string literal, with an optional prefix
+_STRING_START_PATTERN = re.compile(r'[rRuUbBfF]{0,2}["\']')
+
+# Section order of a canonical import block
+FUTURE, STDLIB, THIRD_PARTY, RELATIVE = range(4)
+
+
+@lru_cache(maxsize=None)
+def _is_stdlib(name):
+    """Check whether a top-level module name belongs to the standard library."""
+    stdlib_names = getattr(sys, 'stdlib_module_names', None)
+    if stdlib_names is not None:
+        return name in stdlib_names
+    if name in sys.builtin_module_names:
+        return True
+    # Python < 3.10: look where the module would be loaded from, without importing it
+    try:
+        spec = importlib.util.find_spec(name)
+    except (ImportError, ValueError):
+        return False
+    if spec is None or not spec.origin:
+        return False
+    origin = os.path.normcase(spec.origin)
+    stdlib_path = os.path.normcase(sysconfig.get_paths()['stdlib'])
+    return origin.startswith(stdlib_path) and 'site-packages' not in origin
+
+
+def _import_header_bounds(lines, measure=len):
+    """
+    Scan lines lazily for the import block at the top of a module.
+
+    Stops at the first line that is not part of the block, so only the top of
+    a large module is ever looked at.
+
+    Args:
+        lines: Iterable of lines, with their line endings
+        measure: Size of a line in offset units (characters, or bytes for files)
+
+    Returns:
+        tuple: (start, end) offsets of the block
+    """
+    offset = 0
+    preamble_end = None
+    docstring_lines = None
+    comment_start = None
+    start = end = None
+    depth = 0
+    continued = False
+
+    for line in lines:
+        line_start = offset
+        offset += measure(line)
+        stripped = line.strip()
+
+        if preamble_end is None and docstring_lines is None and _STRING_START_PATTERN.match(line):
+            # Possibly the module docstring; the ast decides once the statement is complete
+            docstring_start = line_start
+            docstring_lines = []
+        if docstring_lines is not None:
+            docstring_lines.append(line)
+            is_docstring = _is_docstring(docstring_lines)
+            if is_docstring is None:
+                continue
+            if not is_docstring:
+                preamble_end = docstring_start
+                break
+            docstring_lines = None
+            preamble_end = offset
+            continue
+        if depth > 0 or continued:
+            # Continuation of a parenthesized or backslash-continued import
+            depth += line.count('(') - line.count(')')
+            continued = line.rstrip().endswith('\\')
+            end = offset
+            continue
+        if not stripped:
+            comment_start = None
+            continue
+        if stripped.startswith('#'):
+            # Comments directly above the first import travel with it, unless
+            # they are leading comments of the module
+            if comment_start is None and preamble_end is not None:
+                comment_start = line_start
+            continue
+
+        if line.startswith(('import ', 'from ')):
+            if start is None:
+                preamble_end = line_start if preamble_end is None else preamble_end
+                start = line_start if comment_start is None else comment_start
+            depth = line.count('(') - line.count(')')
+            continued = line.rstrip().endswith('\\')
+            end = offset
+            comment_start = None
+            continue
+
+        if preamble_end is None:
+            preamble_end = line_start
+        break
+    else:
+        if preamble_end is None:
+            preamble_end = docstring_start if docstring_lines is not None else offset
+
+    if start is None:
+        return preamble_end, preamble_end
+    return start, end
+
+
+def _is_docstring(lines):
+    """
+    Check whether lines hold a docstring statement: an expression statement
+    that is a single ``str`` constant.
+
+    Returns:
+        bool or None: None while the statement is incomplete
+    """
+    try:
+        module = ast.parse(''.join(lines))
+    except SyntaxError:
+        return None
+    return (
+        len(module.body) == 1
+        and isinstance(module.body[0], ast.Expr)
+        and isinstance(module.body[0].value, ast.Constant)
+        and isinstance(module.body[0].value.value, str)
+    )
+
+
+def find_import_header(source):
+    """
+    Locate the block of import statements at the top of a module.
+
+    The block starts after any leading comments and module docstring (a
+    comment directly above the first import belongs to the block) and ends
+    after the last import statement that is only preceded by imports, comments
+    and blank lines. Parenthesized and backslash-continued imports are handled.
+    Imports are recognized line by line; only a leading string statement is
+    parsed, to tell whether it is the module docstring (in any quotes).
+
+    Args:
+        source: Python source text
+
+    Returns:
+        tuple: (start, end) character offsets of the block; equal when the
+        module has no leading imports
+    """
+    return _import_header_bounds(source.splitlines(True))
+
+
+def read_import_header(path, encoding=None):
+    """
+    Read only the import block at the top of a module file.
+
+    Args:
+        path: Path to the module
+        encoding: File encoding; the platform default if omitted
+
+    Returns:
+        tuple: (start, end, text) where start and end are byte offsets of the
+        block in the file and text is the block as written in the file
+    """
+    with open(path, 'r', encoding=encoding, newline='') as f:
+        encoding = f.encoding
+        read_lines = []
+
+        def lines():
+            for line in f:
+                read_lines.append(line)
+                yield line
+
+        start, end = _import_header_bounds(lines(), lambda line: len(line.encode(encoding)))
+
+    data = ''.join(read_lines).encode(encoding)
+    return start, end, data[start:end].decode(encoding)
+
+
+def split_import_header(text):
+    """
+    Split source text into its leading import block and the rest.
+
+    Returns:
+        tuple: (header, body) with surrounding blank lines stripped; anything
+        before the imports (comments, docstring) stays in the body
+    """
+    start, end = find_import_header(text)
+    if start == end:
+        return '', text.lstrip('\n')
+    header = text[start:end].strip('\n')
+    body = (text[:start] + text[end:]).lstrip('\n')
+    return header, body
+
+
+class ImportBlock:
+    """
+    The import statements of a module, merged by imported module.
+
+    ``import a, b`` is kept as one entry per name, ``from`` imports are merged
+    by (level, module) into one set of ``(name, asname)`` pairs. Comments on
+    their own line above a statement (or inside a parenthesized one) and at
+    the end of a single-line statement stay attached to it. ``render()``
+    produces a canonical block: ``__future__``, standard library, third-party
+    and relative sections, each sorted, with long ``from`` imports wrapped in
+    parentheses.
+    """
+
+    def __init__(self):
+        self.imports = set()
+        self.from_imports = {}
+        self.comments = {}
+        self.trailing_comments = {}
+
+    def __bool__(self):
+        return bool(self.imports or self.from_imports)
+
+    @classmethod
+    def parse(cls, source):
+        """
+        Parse a block of import statements.
+
+        Args:
+            source: Source text containing only import statements and comments
+
+        Returns:
+            ImportBlock: The parsed imports
+
+        Raises:
+            SyntaxError: If the text is not a block of import statements
+        """
+        block = cls()
+        if not source.strip():
+            return block
+
+        tree = ast.parse(source)
+        lines = source.splitlines()
+        previous_end = 0
+        for node in tree.body:
+            if isinstance(node, ast.Import):
+                keys = [('import', alias.name, alias.asname) for alias in node.names]
+                block.imports.update(keys)
+            elif isinstance(node, ast.ImportFrom):
+                key = ('from', node.level, node.module or '')
+                block.from_imports.setdefault(key, set()).update(
+                    (alias.name, alias.asname) for alias in node.names
+                )
+                keys = [key]
+            else:
+                raise SyntaxError(f"line {node.lineno} is not an import statement")
+
+            end_lineno = getattr(node, 'end_lineno', node.lineno)
+            comments = [
+                line.strip() for line in lines[previous_end:node.lineno - 1]
+                if line.strip().startswith('#')
+            ]
+            statement_comments = [
+                '#' + line.partition('#')[2].rstrip()
+                for line in lines[node.lineno - 1:end_lineno] if '#' in line
+            ]
+            trailing = None
+            if end_lineno == node.lineno and statement_comments:
+                trailing = statement_comments.pop()
+            comments.extend(statement_comments)
+
+            for key in keys:
+                block._add_comments(key, comments, trailing)
+            previous_end = end_lineno
+
+        return block
+
+    def _add_comments(self, key, comments, trailing=None):
+        existing = self.comments.setdefault(key, [])
+        existing.extend(comment for comment in comments if comment not in existing)
+        if trailing and key not in self.trailing_comments:
+            self.trailing_comments[key] = trailing
+
+    def covers(self, other):
+        """Check whether every import of another block is already in this one."""
+        return other.imports <= self.imports and all(
+            names <= self.from_imports.get(key, set())
+            for key, names in other.from_imports.items()
+        )
+
+    def update(self, other):
+        """Merge the imports (and comments) of another block into this one."""
+        self.imports.update(other.imports)
+        for key, names in other.from_imports.items():
+            self.from_imports.setdefault(key, set()).update(names)
+        for key in other.imports | set(other.from_imports):
+            self._add_comments(key, other.comments.get(key, []), other.trailing_comments.get(key))
+
+    @staticmethod
+    def _section(key):
+        if key[0] == 'from' and key[1]:
+            return RELATIVE
+        top_level = key[2 if key[0] == 'from' else 1].split('.')[0]
+        if top_level == '__future__':
+            return FUTURE
+        return STDLIB if _is_stdlib(top_level) else THIRD_PARTY
+
+    @staticmethod
+    def _sort_key(key):
+        # Plain imports before from imports, each sorted by module
+        if key[0] == 'import':
+            return (0, key[1], key[2] or '')
+        return (1, '.' * key[1] + key[2], '')
+
+    def _statement(self, key):
+        if key[0] == 'import':
+            return f"import {key[1]} as {key[2]}" if key[2] else f"import {key[1]}"
+
+        module = '.' * key[1] + key[2]
+        aliases = [
+            f"{name} as {asname}" if asname else name
+            for name, asname in sorted(self.from_imports[key], key=lambda alias: (alias[0], alias[1] or ''))
+        ]
+        statement = f"from {module} import {', '.join(aliases)}"
+        if len(statement) <= IMPORT_LINE_LENGTH or len(aliases) == 1:
+            return statement
+        wrapped = ''.join(f"    {alias},\n" for alias in aliases)
+        return f"from {module} import (\n{wrapped})"
+
+    def render(self):
+        """
+        Render the canonical import block.
+
+        Returns:
+            str: Import statements, sections separated by a blank line, without
+            a trailing newline
+        """
+        sections = {}
+        for key in self.imports | set(self.from_imports):
+            sections.setdefault(self._section(key), []).append(key)
+
+        rendered = []
+        for section in sorted(sections):
+            lines = []
+            for key in sorted(sections[section], key=self._sort_key):
+                lines.extend(self.comments.get(key, []))
+                statement = self._statement(key)
+                if key in self.trailing_comments:
+                    first_line, newline, rest = statement.partition('\n')
+                    statement = f"{first_line}  {self.trailing_comments[key]}{newline}{rest}"
+                lines.append(statement)
+            rendered.append('\n'.join(lines))
+        return '\n\n'.join(rendered)
+
+
+def merge_import_header(header, imports):
+    """
+    Merge import statements into an existing import block.
+
+    Args:
+        header: The module's import block
+        imports: Import statements to add
+
+    Returns:
+        str or None: The re-rendered block ending with a newline, or None when
+        ``header`` already has every import
+
+    Raises:
+        SyntaxError: If either text is not a block of import statements
+    """
+    block = ImportBlock.parse(header)
+    new_imports = ImportBlock.parse(imports)
+    if block.covers(new_imports):
+        return None
+    block.update(new_imports)
+    return block.render() + '\n'
+
+
+def merge_module_source(current, imports, body):
+    """
+    Add new imports and a new body to existing module source.
+
+    Only the import block of ``current`` is parsed and re-rendered; whatever
+    precedes it (comments, docstring) and the rest of the module are kept as
+    they are, and ``body`` is appended after them.
+
+    Args:
+        current: Existing module source
+        imports: Import statements to merge into the module's import block
+        body: Source to append after the existing body
+
+    Returns:
+        str: The merged module source, ending with a newline
+    """
+    start, end = find_import_header(current)
+    try:
+        block = ImportBlock.parse(current[start:end])
+        block.update(ImportBlock.parse(imports))
+    except SyntaxError:
+        # Not something we can merge safely; append the new code as it is
+        parts = [current.strip('\n'), imports.strip('\n'), body.strip('\n')]
+        return '\n\n'.join(part for part in parts if part) + '\n'
+
+    parts = [block.render(), current[end:].strip('\n'), body.strip('\n')]
+    return current[:start] + '\n\n'.join(part for part in parts if part) + '\n'
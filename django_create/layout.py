@@ -0,0 +1,120 @@
+import os
+from pathlib import Path
+
+STANDARD_MODULES = ('models', 'views', 'serializers', 'viewsets', 'tests')
+
+
+class ProjectLayout:
+    """
+    Immutable snapshot of the module layout of a Django app.
+
+    Records, for every standard module type, whether the app has a ``<type>.py``
+    file and/or a ``<type>/`` folder, every subfolder inside those module folders
+    and which of them contain an ``__init__.py``. A layout is taken once per run
+    with ``ProjectLayout.scan`` and then passed to rendering and to every create
+    command, so they can answer "file or folder?" without touching the disk.
+    Changes made during a run produce a new snapshot (see ``with_folders``).
+    """
+
+    __slots__ = ('app_path', 'module_files', 'module_folders', 'subpaths', 'init_dirs')
+
+    def __init__(self, app_path, module_files=(), module_folders=(), subpaths=(), init_dirs=()):
+        self.app_path = Path(app_path)
+        self.module_files = frozenset(module_files)
+        self.module_folders = frozenset(module_folders)
+        self.subpaths = frozenset(subpaths)
+        self.init_dirs = frozenset(init_dirs)
+
+    def __setattr__(self, name, value):
+        if hasattr(self, 'init_dirs'):
+            raise AttributeError("ProjectLayout is immutable")
+        object.__setattr__(self, name, value)
+
+    def __repr__(self):
+        return (
+            f"ProjectLayout({str(self.app_path)!r}, files={sorted(self.module_files)}, "
+            f"folders={sorted(self.module_folders)})"
+        )
+
+    @classmethod
+    def scan(cls, app_path):
+        """
+        Take a snapshot of an app with one ``scandir`` of the app folder, plus
+        one per directory inside existing module folders.
+
+        Args:
+            app_path: Path to the Django app
+
+        Returns:
+            ProjectLayout: The snapshot
+        """
+        app_path = Path(app_path)
+        module_files = set()
+        module_folders = set()
+        subpaths = set()
+        init_dirs = set()
+
+        try:
+            with os.scandir(app_path) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if name.endswith('.py') and name[:-3] in STANDARD_MODULES and entry.is_file():
+                        module_files.add(name[:-3])
+                    elif name in STANDARD_MODULES and entry.is_dir():
+                        module_folders.add(name)
+        except OSError:
+            pass
+
+        stack = list(module_folders)
+        while stack:
+            rel_dir = stack.pop()
+            subpaths.add(rel_dir)
+            try:
+                with os.scandir(app_path / rel_dir) as entries:
+                    for entry in entries:
+                        if entry.name == '__init__.py':
+                            init_dirs.add(rel_dir)
+                        elif entry.is_dir(follow_symlinks=False) and entry.name != '__pycache__':
+                            stack.append(f"{rel_dir}/{entry.name}")
+            except OSError:
+                pass
+
+        return cls(app_path, module_files, module_folders, subpaths, init_dirs)
+
+    def has_file(self, module_type):
+        """Check whether ``<module_type>.py`` exists."""
+        return module_type in self.module_files
+
+    def has_folder(self, module_type):
+        """Check whether the ``<module_type>/`` folder exists."""
+        return module_type in self.module_folders
+
+    def has_subpath(self, rel_dir):
+        """Check whether a folder (relative to the app, e.g. ``models/products``) exists."""
+        return Path(rel_dir).as_posix() in self.subpaths
+
+    def has_init(self, rel_dir):
+        """Check whether a folder (relative to the app) contains an ``__init__.py``."""
+        return Path(rel_dir).as_posix() in self.init_dirs
+
+    def import_style(self, module_type):
+        """
+        Import style for a module type: 'dotdot' when it is a folder, 'dot' otherwise.
+        """
+        if module_type in self.module_folders:
+            return 'dotdot'
+        return 'dot'
+
+    def with_folders(self, module_types):
+        """
+        Return a new snapshot in which ``module_types`` are packages (folder with
+        ``__init__.py``) instead of single files, as after folderizing them.
+        """
+        module_types = set(module_types)
+        return ProjectLayout(
+            self.app_path,
+            self.module_files - module_types,
+            self.module_folders | module_types,
+            self.subpaths | module_types,
+            self.init_dirs | module_types,
+        )
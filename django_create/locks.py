@@ -0,0 +1,99 @@
+import hashlib
+import os
+import tempfile
+from .session import current_session
+
+try:
+    import fcntl
+except ImportError:  # Windows: no advisory locks
+    fcntl = None
+
+
+def lock_directory():
+    """
+    Return the directory holding the lock files of the current user.
+
+    Lock files live outside the project so they never show up in it; they
+    are empty and left in place, as removing them would race with waiters.
+    """
+    user = os.getuid() if hasattr(os, 'getuid') else os.environ.get('USERNAME', 'user')
+    return os.path.join(tempfile.gettempdir(), f"django-create-locks-{user}")
+
+
+class FileLock:
+    """
+    Advisory lock on a project path, shared by every django-create process.
+
+    The lock is taken with ``flock`` on a lock file named after the target's
+    real path rather than on the target itself, since targets are replaced
+    (``os.replace``) or may not exist yet. Does nothing where ``fcntl`` is
+    not available.
+    """
+
+    def __init__(self, path):
+        self.path = os.path.realpath(os.fspath(path))
+        digest = hashlib.sha1(self.path.encode('utf-8', 'surrogateescape')).hexdigest()
+        self.lock_path = os.path.join(lock_directory(), f"{digest}.lock")
+        self.waited = False
+        self._fd = None
+
+    def acquire(self):
+        """Block until the lock is held."""
+        if fcntl is None or self._fd is not None:
+            return
+        os.makedirs(os.path.dirname(self.lock_path), mode=0o700, exist_ok=True)
+        fd = os.open(self.lock_path, os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                self.waited = True
+                fcntl.flock(fd, fcntl.LOCK_EX)
+        except BaseException:
+            os.close(fd)
+            raise
+        self._fd = fd
+
+    def release(self):
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.release()
+
+
+def lock_file(path):
+    """
+    Hold the lock of a file's directory until the current run ends.
+
+    Call it before reading a file the run will modify: the lock is released
+    only after the run's changes are flushed to disk, so concurrent
+    invocations modifying the same file take turns instead of overwriting
+    each other's changes. The files of a directory share its lock, so a run
+    holds one lock (and one open file) per app or package directory it
+    modifies, however many modules it writes there. Each directory is locked
+    once per run; outside of a run nothing is locked.
+
+    Args:
+        path: Path to the file, which need not exist
+    """
+    session = current_session()
+    if session.detached or fcntl is None:
+        return
+
+    # Resolves the path once, for the lookup and the lock alike
+    lock = FileLock(os.path.dirname(os.path.realpath(os.fspath(path))))
+
+    def acquire():
+        session.enter_context(lock)
+        session.stats['locks_acquired'] += 1
+        if lock.waited:
+            session.stats['lock_waits'] += 1
+        return lock
+
+    session.cached(('lock', lock.path), acquire)
@@ -0,0 +1,530 @@
+import locale
+import os
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+from .imports import find_import_header, merge_import_header, merge_module_source, read_import_header
+from .session import current_session
+
+# Import block of module files as last read, by path:
+# (mtime_ns, size, encoding, start, end, text) with byte offsets
+_header_cache = {}
+
+# Files whose data a flush syncs at the same time
+_SYNC_WORKERS = 16
+
+
+class FileOverlay:
+    """
+    In-memory view of the files a run reads and writes.
+
+    Writes are kept as pending contents and served back to later reads;
+    ``exists()`` answers and file contents read from disk are remembered, and
+    directories are recorded once. Everything is flushed to disk in one pass
+    when the run ends (see ``Session.defer``): first the new directories,
+    then the final content of each written file, then deletions. Files whose
+    final content is identical to what is on disk are not written, so their
+    mtime is left alone (``writes_skipped``). Every call answered from memory
+    is counted in the ``syscalls_saved`` statistic, and every byte read from
+    disk in ``bytes_read``.
+
+    Code added to the end of a module that is only on disk is kept as a
+    ``_ModulePatch`` rather than as the full new content: only the module's
+    import block is read, and on flush the new code is appended to the file
+    (``files_appended``), rewriting the file only when its imports changed.
+
+    Outside of a run the overlay of the detached session flushes right away,
+    so it behaves like plain file access.
+    """
+
+    def __init__(self, session):
+        self.session = session
+        self._pending = {}
+        self._contents = {}
+        self._disk = {}
+        self._exists = {}
+        self._dirs = set()
+        self._new_dirs = []
+        self._memo = {}
+
+    @staticmethod
+    def _key(path):
+        return os.path.abspath(os.fspath(path))
+
+    def _saved(self, count=1):
+        self.session.stats['syscalls_saved'] += count
+
+    def _read(self, size):
+        self.session.stats['bytes_read'] += size
+
+    def _schedule_flush(self):
+        self.session.defer(('overlay',), self.flush, final=True)
+
+    def exists(self, path):
+        """Check whether a file or directory exists, taking pending changes into account."""
+        key = self._key(path)
+        if key in self._pending:
+            self._saved()
+            return self._pending[key] is not None
+        if key in self._exists or key in self._dirs:
+            self._saved()
+            return self._exists.get(key, True)
+        self._exists[key] = os.path.exists(key)
+        return self._exists[key]
+
+    def read_text(self, path, encoding=None):
+        """
+        Read a file, preferring its pending content.
+
+        Raises:
+            FileNotFoundError: If the file does not exist or was deleted during the run
+        """
+        key = self._key(path)
+        if isinstance(self._pending.get(key), _ModulePatch):
+            return self._apply_patch(key)
+        if key in self._pending:
+            self._saved()
+            if self._pending[key] is None:
+                raise FileNotFoundError(key)
+            return self._pending[key]
+        if key in self._contents:
+            self._saved()
+            return self._contents[key]
+
+        # Keep the exact text on disk to tell unchanged writes apart later
+        with open(key, 'rb') as f:
+            raw = f.read()
+        self._read(len(raw))
+        self._disk[key] = raw.decode(encoding or locale.getpreferredencoding(False))
+        content = self._disk[key].replace('\r\n', '\n').replace('\r', '\n')
+        self._contents[key] = content
+        self._exists[key] = True
+        return content
+
+    def iter_lines(self, path, encoding=None):
+        """
+        Iterate over the lines of a file, without newlines.
+
+        A file that is only on disk is read line by line, so callers that stop
+        early never load the rest of it.
+        """
+        key = self._key(path)
+        if isinstance(self._pending.get(key), _ModulePatch):
+            yield from self._pending[key].iter_lines(key)
+            return
+        if key in self._pending or key in self._contents:
+            yield from self.read_text(key, encoding).splitlines()
+            return
+        encoding = encoding or locale.getpreferredencoding(False)
+        with open(key, 'rb') as f:
+            for line in f:
+                self._read(len(line))
+                yield line.decode(encoding).rstrip('\r\n')
+
+    def disk_size(self, path):
+        """
+        Return the size of a file as it is on disk, or None if the run has
+        changed it or already holds its content.
+        """
+        key = self._key(path)
+        if key in self._pending or key in self._contents:
+            return None
+        return os.path.getsize(key)
+
+    def memoize(self, path, name, compute):
+        """
+        Return ``compute(path)``, computed once per run for each version of a file.
+
+        Results for a file that is only on disk are keyed by its path, mtime and
+        size, so every caller of the run shares them and a file changed on
+        disk is looked at again; files with pending changes are not memoized.
+
+        Args:
+            path: Path to the file
+            name: Name of the computed property
+            compute: Function of the path computing it
+        """
+        key = self._key(path)
+        if key in self._pending:
+            return compute(path)
+        try:
+            stat = os.stat(key)
+        except OSError:
+            return compute(path)
+        memo_key = (key, name, stat.st_mtime_ns, stat.st_size)
+        if memo_key in self._memo:
+            self.session.stats['file_cache_hits'] += 1
+            return self._memo[memo_key]
+        self._memo[memo_key] = compute(path)
+        return self._memo[memo_key]
+
+    def import_header(self, path):
+        """
+        Return the import block at the top of a module.
+
+        For a module that is only on disk, only the top of the file is read,
+        and the block's position is remembered for ``append_to_module``.
+        """
+        key = self._key(path)
+        if key in self._pending or key in self._contents:
+            content = self.read_text(key)
+            start, end = find_import_header(content)
+            return content[start:end]
+        return _read_header(key)[5].replace('\r\n', '\n').replace('\r', '\n')
+
+    def append_to_module(self, path, imports, body):
+        """
+        Merge imports into an existing module's import block and append code to it.
+
+        A module that is only on disk is not loaded: its import block is read
+        (or taken from the cache) and the change is recorded as a patch that is
+        applied by appending to the file. Modules already in memory, without
+        an import block, or whose imports cannot be parsed go through
+        ``merge_module_source`` instead.
+
+        Args:
+            path: Path to the module
+            imports: Import statements to merge
+            body: Code to append
+
+        Raises:
+            FileNotFoundError: If the module does not exist or was deleted during the run
+        """
+        key = self._key(path)
+        patch = self._pending.get(key)
+        if patch is None and key not in self._pending and key not in self._contents:
+            patch = _ModulePatch.from_file(key)
+        if not isinstance(patch, _ModulePatch):
+            self.write_text(key, merge_module_source(self.read_text(key), imports, body))
+            return
+
+        try:
+            header = merge_import_header(patch.header, imports)
+        except SyntaxError:
+            header = False
+        if header is False or not patch.has_header:
+            self._pending[key] = patch
+            self.write_text(key, merge_module_source(self.read_text(key), imports, body))
+            return
+
+        if key in self._pending:
+            self._saved()
+        if header is not None:
+            patch.set_header(header)
+        patch.append(body)
+        self._pending[key] = patch
+        self._exists[key] = True
+        self._schedule_flush()
+
+    def _apply_patch(self, key):
+        """Load a patched module, turning its patch into plain pending content."""
+        patch = self._pending[key]
+        with open(key, 'rb') as f:
+            raw = f.read()
+        self._read(len(raw))
+        self._disk[key] = raw.decode(patch.encoding)
+        content = patch.apply(raw)
+        self._pending[key] = content
+        return content
+
+    def write_text(self, path, content):
+        """Record the new content of a file; its parent directories are created on flush."""
+        key = self._key(path)
+        if self._pending.get(key) is not None:
+            # The earlier write (or patch) never reaches the disk
+            self._saved()
+        self._pending[key] = content
+        self.mkdir(os.path.dirname(key))
+        self._schedule_flush()
+
+    def unlink(self, path):
+        """Record the deletion of a file."""
+        key = self._key(path)
+        if key not in self._pending and not self.exists(key):
+            raise FileNotFoundError(key)
+        self._pending[key] = None
+        self._contents.pop(key, None)
+        self._schedule_flush()
+
+    def discard(self, path):
+        """Drop the pending change (write or deletion) of a file, leaving it as it is on disk."""
+        key = self._key(path)
+        if self._pending.pop(key, False) is not False:
+            self._exists.pop(key, None)
+
+    def mkdir(self, path):
+        """Record a directory (and its parents) to be created, like ``mkdir(parents=True, exist_ok=True)``."""
+        key = self._key(path)
+        if key in self._dirs:
+            self._saved()
+            return
+        self._dirs.add(key)
+        if not os.path.isdir(key):
+            self._new_dirs.append(key)
+            self._schedule_flush()
+
+    def _unchanged(self, key, content):
+        """Check whether writing ``content`` would leave the file byte-identical."""
+        if self._exists.get(key) is False or isinstance(content, _ModulePatch):
+            return False
+        if key not in self._disk:
+            try:
+                with open(key, 'rb') as f:
+                    raw = f.read()
+                self._read(len(raw))
+                self._disk[key] = raw.decode(locale.getpreferredencoding(False))
+            except (OSError, UnicodeDecodeError):
+                return False
+        return self._disk[key] == content.replace('\n', os.linesep)
+
+    def flush(self):
+        """
+        Write every pending change to disk, atomically.
+
+        New contents go to temporary files next to their targets; the data of
+        these files and of the files appended to is synced in one batch (see
+        ``_sync_files``), then every temporary file is moved into place with
+        ``os.replace`` and, only after that, deleted files are removed. Each
+        directory touched is synced once at the end. An interrupted flush
+        leaves every file either with its old or its new content.
+        """
+        touched_dirs = set()
+        for directory in self._new_dirs:
+            os.makedirs(directory, exist_ok=True)
+            touched_dirs.add(os.path.dirname(directory))
+        self._new_dirs = []
+
+        pending, self._pending = self._pending, {}
+        writes = []
+        for key, content in pending.items():
+            if content is None:
+                continue
+            if self._unchanged(key, content):
+                self.session.stats['writes_skipped'] += 1
+            else:
+                writes.append((key, content))
+
+        # Patches that leave the imports alone are appended to the files in place
+        appended = [key for key, content in writes if isinstance(content, _ModulePatch) and not content.header_changed]
+        for key in appended:
+            pending[key].append_to_file(key)
+            self.session.stats['files_appended'] += 1
+        writes = [(key, content) for key, content in writes if key not in appended]
+
+        temp_paths = []
+        try:
+            for key, content in writes:
+                temp_path = f"{key}.{os.getpid()}.tmp"
+                temp_paths.append(temp_path)
+                if isinstance(content, _ModulePatch):
+                    content.write_patched(key, temp_path)
+                else:
+                    with open(temp_path, 'w') as f:
+                        f.write(content)
+                if self._exists.get(key) is not False:
+                    try:
+                        os.chmod(temp_path, os.stat(key).st_mode)
+                    except FileNotFoundError:
+                        pass
+            _sync_files(temp_paths + appended)
+
+            for (key, content), temp_path in zip(writes, temp_paths):
+                os.replace(temp_path, key)
+                touched_dirs.add(os.path.dirname(key))
+                self.session.stats['files_written'] += 1
+                if isinstance(content, _ModulePatch):
+                    content.cache_header(key)
+        finally:
+            for temp_path in temp_paths:
+                if os.path.exists(temp_path):
+                    os.unlink(temp_path)
+
+        for key, content in pending.items():
+            if content is None:
+                try:
+                    os.unlink(key)
+                except FileNotFoundError:
+                    pass
+                else:
+                    touched_dirs.add(os.path.dirname(key))
+                    self.session.stats['files_deleted'] += 1
+                self._exists[key] = False
+                self._disk.pop(key, None)
+            elif isinstance(content, _ModulePatch):
+                if key in appended:
+                    content.cache_header(key)
+                self._contents.pop(key, None)
+                self._disk.pop(key, None)
+                self._exists[key] = True
+            else:
+                self._contents[key] = content
+                self._disk[key] = content.replace('\n', os.linesep)
+                self._exists[key] = True
+
+        _sync_dirs(touched_dirs)
+        self.session.stats['dirs_synced'] += len(touched_dirs)
+
+
+class _ModulePatch:
+    """
+    Pending change to a module on disk: a new import block and code to append.
+
+    Offsets are in bytes of the file as it was when the patch was made.
+    """
+
+    def __init__(self, encoding, start, end, header, size, trailing_newlines):
+        self.encoding = encoding
+        self.start = start
+        self.end = end
+        self.header = header
+        self.header_changed = False
+        self.size = size
+        self.trailing_newlines = trailing_newlines
+        self.chunks = []
+
+    @classmethod
+    def from_file(cls, key):
+        """
+        Make an empty patch for a module, reading only its import block and last bytes.
+
+        Raises:
+            FileNotFoundError: If the module does not exist
+        """
+        stat = os.stat(key)
+        _, _, encoding, start, end, header = _read_header(key, stat)
+        with open(key, 'rb') as f:
+            f.seek(max(stat.st_size - 4, 0))
+            ending = f.read().decode(encoding, errors='ignore').replace('\r\n', '\n').replace('\r', '\n')
+        trailing_newlines = len(ending) - len(ending.rstrip('\n'))
+        return cls(encoding, start, end, header, stat.st_size, trailing_newlines)
+
+    @property
+    def has_header(self):
+        return self.start != self.end
+
+    def set_header(self, header):
+        self.header = header
+        self.header_changed = True
+        if self.end == self.size and not self.chunks:
+            # The module ends with its imports; the new block ends with a newline
+            self.trailing_newlines = 1
+
+    def append(self, body):
+        """Queue code to append, separated from what precedes it by a blank line."""
+        separator = '\n' * max(2 - self.trailing_newlines, 0) if self.size or self.chunks else ''
+        self.chunks.append(separator + body.strip('\n') + '\n')
+        self.trailing_newlines = 1
+
+    def iter_lines(self, key):
+        """Iterate over the lines of the patched module, reading the file line by line."""
+        with open(key, 'rb') as f:
+            yield from f.read(self.start).decode(self.encoding).splitlines()
+            header = f.read(self.end - self.start).decode(self.encoding)
+            yield from (self.header if self.header_changed else header).splitlines()
+            for line in f:
+                yield line.decode(self.encoding).rstrip('\r\n')
+        yield from ''.join(self.chunks).splitlines()
+
+    def _encoded_chunks(self):
+        return ''.join(self.chunks).replace('\n', os.linesep).encode(self.encoding)
+
+    def apply(self, raw):
+        """Return the patched module text given the file's bytes, with normalized newlines."""
+        content = raw[:self.start].decode(self.encoding)
+        content += self.header if self.header_changed else raw[self.start:self.end].decode(self.encoding)
+        content += raw[self.end:].decode(self.encoding)
+        content = content.replace('\r\n', '\n').replace('\r', '\n')
+        return content + ''.join(self.chunks)
+
+    def append_to_file(self, key):
+        with open(key, 'ab') as f:
+            f.write(self._encoded_chunks())
+
+    def write_patched(self, key, temp_path):
+        """Write the patched module to ``temp_path``, copying the unchanged parts of the file."""
+        with open(key, 'rb') as source, open(temp_path, 'wb') as target:
+            target.write(source.read(self.start))
+            target.write(self.header.replace('\n', os.linesep).encode(self.encoding))
+            source.seek(self.end)
+            shutil.copyfileobj(source, target)
+            target.write(self._encoded_chunks())
+        try:
+            os.chmod(temp_path, os.stat(key).st_mode)
+        except FileNotFoundError:
+            pass
+
+    def cache_header(self, key):
+        """Remember the import block of the module as written by this patch."""
+        header = self.header.replace('\n', os.linesep) if self.header_changed else self.header
+        end = self.start + len(header.encode(self.encoding))
+        try:
+            stat = os.stat(key)
+        except OSError:
+            return
+        _header_cache[key] = (stat.st_mtime_ns, stat.st_size, self.encoding, self.start, end, header)
+
+
+def _read_header(key, stat=None):
+    """Read the import block of a module file, through the cache when the file is unchanged."""
+    stat = stat or os.stat(key)
+    cached = _header_cache.get(key)
+    if cached and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+        return cached
+    # The encoding ``write_text`` contents are flushed with
+    encoding = locale.getpreferredencoding(False)
+    start, end, text = read_import_header(key, encoding)
+    current_session().stats['bytes_read'] += end
+    _header_cache[key] = (stat.st_mtime_ns, stat.st_size, encoding, start, end, text)
+    return _header_cache[key]
+
+
+def _sync_files(paths):
+    """
+    Make the data of the files written by a flush durable, in one batch.
+
+    The files are synced once all of them are written, a few at a time
+    from ``_SYNC_WORKERS`` threads: a journaling filesystem commits the
+    syncs pending together at once, so the flush waits for about one
+    commit rather than one per file, and only the files written are
+    flushed (unlike ``os.sync()``). The data is what matters
+    (``fdatasync``); the metadata is made durable by the directory sync.
+    """
+    sync = getattr(os, 'fdatasync', os.fsync)
+
+    def sync_path(path):
+        fd = os.open(path, os.O_RDWR)
+        try:
+            sync(fd)
+        finally:
+            os.close(fd)
+
+    if len(paths) <= 1:
+        for path in paths:
+            sync_path(path)
+        return
+    with ThreadPoolExecutor(max_workers=min(_SYNC_WORKERS, len(paths))) as executor:
+        # Consumed so that a failed sync is raised
+        for _ in executor.map(sync_path, paths):
+            pass
+
+
+def _sync_dirs(directories):
+    """Make renames and deletions durable: one fsync per directory (POSIX only)."""
+    if os.name != 'posix':
+        return
+    for directory in directories:
+        try:
+            fd = os.open(directory, os.O_RDONLY)
+        except OSError:
+            continue
+        try:
+            os.fsync(fd)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+
+
+def current_overlay():
+    """Return the file overlay of the current run."""
+    session = current_session()
+    return session.cached(('overlay',), lambda: FileOverlay(session))
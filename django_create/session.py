@@ -0,0 +1,115 @@
+from collections import Counter
+from contextlib import ExitStack, contextmanager
+import click
+
+
+class Session:
+    """
+    State shared by every step of a single django-create invocation.
+
+    Commands open a session with ``session_scope()``; nested scopes (a command
+    run by the CLI group, or by ``folderize``) join the outermost one. Work
+    deferred with ``defer()`` runs when the outermost scope closes, and
+    resources held for the run (file locks, see ``enter_context()``) are
+    released after it. A run that fails drops its deferred work instead, so
+    none of its pending changes reach the disk. Code called outside of any
+    scope gets a detached session, which runs deferred work right away.
+    """
+
+    def __init__(self, show_stats=False, detached=False):
+        self.show_stats = show_stats
+        self.detached = detached
+        self.stats = Counter()
+        self._cache = {}
+        self._deferred = {}
+        self._final = {}
+        self._resources = ExitStack()
+
+    def cached(self, key, factory):
+        """
+        Return the value stored for ``key`` during this run, computing it with
+        ``factory()`` the first time.
+        """
+        try:
+            return self._cache[key]
+        except KeyError:
+            value = self._cache[key] = factory()
+            return value
+
+    def defer(self, key, callback, final=False):
+        """
+        Run ``callback`` once at the end of the run; further calls with the
+        same ``key`` are ignored. ``final`` callbacks (flushing files to disk)
+        run after all others. Detached sessions call it immediately.
+        """
+        deferred = self._final if final else self._deferred
+        if self.detached:
+            callback()
+        elif key not in deferred:
+            deferred[key] = callback
+
+    def enter_context(self, context_manager):
+        """Enter a context manager and keep it open until the run is closed."""
+        return self._resources.enter_context(context_manager)
+
+    def discard(self):
+        """Drop the work deferred so far, e.g. the pending writes of a failed run."""
+        self._deferred.clear()
+        self._final.clear()
+
+    def close(self):
+        """
+        Run the deferred callbacks, in the order they were deferred, then exit
+        the contexts entered with ``enter_context()``, even if a callback failed.
+        """
+        with self._resources:
+            while self._deferred or self._final:
+                deferred = self._deferred or self._final
+                key = next(iter(deferred))
+                deferred.pop(key)()
+
+    def report(self):
+        """Print the collected run statistics."""
+        click.echo("Run statistics:")
+        for key in sorted(self.stats):
+            click.echo(f"  {key.replace('_', ' ')}: {self.stats[key]}")
+
+
+_active_sessions = []
+
+
+def current_session():
+    """Return the active session, or a detached one when none is open."""
+    if _active_sessions:
+        return _active_sessions[-1]
+    return Session(detached=True)
+
+
+@contextmanager
+def session_scope(show_stats=False):
+    """
+    Open a session for the duration of a command, or join the active one.
+
+    Args:
+        show_stats: Print the run statistics when the outermost scope closes
+    """
+    if _active_sessions:
+        session = _active_sessions[-1]
+        session.show_stats = session.show_stats or show_stats
+        yield session
+        return
+
+    session = Session(show_stats)
+    _active_sessions.append(session)
+    try:
+        yield session
+    except BaseException:
+        session.discard()
+        raise
+    finally:
+        try:
+            session.close()
+        finally:
+            _active_sessions.pop()
+        if session.show_stats:
+            session.report()
@@ -0,0 +1,302 @@
+import os
+import re
+from collections import namedtuple
+from functools import lru_cache
+from pathlib import Path
+from .discovery.cache import CACHE_DIR
+from .imports import split_import_header
+from .session import current_session
+
+PLACEHOLDER_PATTERN = re.compile(r'\{\{ (\w+) \}\}')
+SECTION_PATTERN = re.compile(r'^\{% (imports|body) %\}[ \t]*(?:\n|$)', re.MULTILINE)
+TEMPLATES_PACKAGE = 'django_create.templates'
+
+
+class RenderedTemplate(namedtuple('RenderedTemplate', ['imports', 'body'])):
+    """
+    A rendered template kept as its import header and its body, so the merge
+    step can combine imports without re-parsing the rendered text.
+    """
+
+    __slots__ = ()
+
+    def __str__(self):
+        if not self.imports:
+            return self.body
+        return f"{self.imports}\n\n{self.body}"
+
+
+class _Segments:
+    """Text split once into literals and ``{{ name }}`` placeholders."""
+
+    __slots__ = ('literals', 'names')
+
+    def __init__(self, text):
+        parts = PLACEHOLDER_PATTERN.split(text)
+        self.literals = parts[0::2]
+        self.names = parts[1::2]
+
+    def render(self, context):
+        chunks = [self.literals[0]]
+        for name, literal in zip(self.names, self.literals[1:]):
+            if name in context:
+                chunks.append(str(context[name]))
+            else:
+                chunks.append(f"{{{{ {name} }}}}")
+            chunks.append(literal)
+        return ''.join(chunks)
+
+
+class CompiledTemplate:
+    """
+    A template split once into literal text and ``{{ name }}`` placeholders.
+
+    Templates may declare an import header and a body::
+
+        {% imports %}
+        from django.db import models
+        {% body %}
+        class {{ model_name }}(models.Model):
+            ...
+
+    For templates without sections the leading import lines are used as the
+    header. Rendering is a single join over the segments. Placeholders without
+    a matching variable are left in place, like the original ``str.replace``
+    based rendering did.
+    """
+
+    __slots__ = ('source', 'text', 'imports', 'body')
+
+    def __init__(self, source):
+        self.source = source
+        parts = SECTION_PATTERN.split(source)
+        sections = dict(zip(parts[1::2], parts[2::2]))
+        if sections:
+            imports = sections.get('imports', '').strip('\n')
+            body = sections.get('body', '').lstrip('\n')
+            text = f"{imports}\n\n{body}" if imports else body
+        else:
+            imports, body = split_import_header(source)
+            text = source
+        self.text = _Segments(text)
+        self.imports = _Segments(imports)
+        self.body = _Segments(body)
+
+    @property
+    def names(self):
+        """Names of the placeholders used in the template."""
+        return self.text.names
+
+    def render(self, **context):
+        """
+        Render the whole template.
+
+        Args:
+            **context: Template variables
+
+        Returns:
+            str: Rendered text
+        """
+        return self.text.render(context)
+
+    def render_sections(self, **context):
+        """
+        Render the import header and the body separately.
+
+        Args:
+            **context: Template variables
+
+        Returns:
+            RenderedTemplate: The rendered imports and body
+        """
+        return RenderedTemplate(self.imports.render(context), self.body.render(context))
+
+
+@lru_cache(maxsize=128)
+def _compile_file(path, mtime_ns, size):
+    with open(path, 'r') as f:
+        return CompiledTemplate(f.read())
+
+
+def load_template(template_path):
+    """
+    Load and compile a template file, reusing the compiled version while the
+    file's mtime and size are unchanged.
+
+    Args:
+        template_path: Path to the template file
+
+    Returns:
+        CompiledTemplate: The compiled template
+    """
+    stat = os.stat(template_path)
+    return _compile_file(os.fspath(template_path), stat.st_mtime_ns, stat.st_size)
+
+
+@lru_cache(maxsize=None)
+def bundled_templates():
+    """
+    Load every template shipped in ``django_create.templates`` through
+    ``importlib.resources``, so they are found inside zipped or frozen installs.
+    The templates are read and compiled on first use only.
+
+    Returns:
+        dict: Template file name to CompiledTemplate
+    """
+    try:
+        from importlib.resources import files
+    except ImportError:  # Python 3.8
+        from importlib import resources
+        sources = {
+            name: resources.read_text(TEMPLATES_PACKAGE, name)
+            for name in resources.contents(TEMPLATES_PACKAGE)
+            if name.endswith('.txt')
+        }
+    else:
+        sources = {
+            entry.name: entry.read_text()
+            for entry in files(TEMPLATES_PACKAGE).iterdir()
+            if entry.name.endswith('.txt')
+        }
+
+    return {
+        name: CompiledTemplate(source.replace('\r\n', '\n'))
+        for name, source in sources.items()
+    }
+
+
+def user_templates_dir():
+    """
+    Per-user template folder: ``django-create/templates`` inside the user's
+    config directory (``%APPDATA%`` on Windows, ``$XDG_CONFIG_HOME`` or
+    ``~/.config`` elsewhere).
+    """
+    if os.name == 'nt' and os.environ.get('APPDATA'):
+        config_home = os.environ['APPDATA']
+    else:
+        config_home = os.environ.get('XDG_CONFIG_HOME') or os.path.join(os.path.expanduser('~'), '.config')
+    return Path(config_home, 'django-create', 'templates')
+
+
+def template_search_path(base_path):
+    """
+    Folders searched for templates before the bundled ones, highest priority first.
+
+    Args:
+        base_path: Project root
+
+    Returns:
+        list: The project's ``.django-create/templates`` and the user template folder
+    """
+    return [Path(base_path, CACHE_DIR, 'templates'), user_templates_dir()]
+
+
+class TemplateResolver:
+    """
+    Resolves template names against a layered search path.
+
+    Every folder of the search path is listed once, when the resolver is
+    created; the first folder providing a name wins, and bundled templates
+    fill in the rest. Overriding files go through ``load_template``, so an
+    edited file is recompiled; bundled templates are kept, so repeated renders
+    of them cost a dict lookup.
+    """
+
+    def __init__(self, search_path):
+        self.search_path = [Path(folder) for folder in search_path]
+        self.sources = {}
+        self._templates = {}
+
+        for folder in self.search_path:
+            try:
+                with os.scandir(folder) as entries:
+                    for entry in entries:
+                        if entry.name.endswith('.txt') and entry.is_file():
+                            self.sources.setdefault(entry.name, Path(entry.path))
+            except OSError:
+                continue
+
+    def get(self, name):
+        """
+        Return the compiled template for a name.
+
+        Args:
+            name: Template file name (e.g. ``'model_template.txt'``)
+
+        Returns:
+            CompiledTemplate: The template from the first folder providing it,
+            or the bundled one
+        """
+        try:
+            return self._templates[name]
+        except KeyError:
+            pass
+
+        if name in self.sources:
+            return load_template(self.sources[name])
+
+        try:
+            template = bundled_templates()[name]
+        except KeyError:
+            raise ValueError(f"Unknown template '{name}'")
+
+        self._templates[name] = template
+        return template
+
+    def origin(self, name):
+        """Path of the file that overrides a template, or None for bundled ones."""
+        return self.sources.get(name)
+
+
+def _folder_mtime(folder):
+    try:
+        return os.stat(folder).st_mtime_ns
+    except OSError:
+        return None
+
+
+@lru_cache(maxsize=16)
+def _cached_resolver(search_path, mtimes_ns):
+    return TemplateResolver(search_path)
+
+
+def template_resolver(base_path=None):
+    """
+    Return the template resolver of the current run, creating it on first use.
+
+    Resolvers are also kept across runs (and for calls made outside of one)
+    while the mtimes of the search path folders are unchanged, which is what
+    adding, removing or renaming a template changes.
+
+    Args:
+        base_path: Project root; defaults to the current working directory
+
+    Returns:
+        TemplateResolver: Resolver for ``base_path``, shared by the whole run
+    """
+    base_path = os.path.abspath(base_path or os.getcwd())
+
+    def resolver():
+        search_path = tuple(template_search_path(base_path))
+        return _cached_resolver(search_path, tuple(_folder_mtime(folder) for folder in search_path))
+
+    return current_session().cached(('template_resolver', base_path), resolver)
+
+
+def get_template(template, base_path=None):
+    """
+    Return a compiled template.
+
+    Args:
+        template: Name of a template (e.g. ``'model_template.txt'``), looked up
+            in the project and user template folders before the bundled ones,
+            or path to a template file
+        base_path: Project root used for the lookup; defaults to the current
+            working directory
+
+    Returns:
+        CompiledTemplate: The compiled template
+    """
+    if isinstance(template, str) and '/' not in template and os.sep not in template:
+        return template_resolver(base_path).get(template)
+    return load_template(template)
@@ -0,0 +1,270 @@
+import os
+import json
+import shutil
+import subprocess
+import pytest
+from click.testing import CliRunner
+from pathlib import Path
+from django_create.cli import cli
+from django_create.discovery import find_app, find_app_in_git_index, AppIndex, InstalledApps, walk_for_app
+from django_create.utils import create_mock_django_app, find_app_path
+
+def test_find_app_direct_child(tmp_path):
+    # An app directly inside the base path is found without building an index
+    app_path = create_mock_django_app(tmp_path, app_name='testapp')
+
+    assert find_app('testapp', tmp_path) == app_path.resolve()
+    assert not (tmp_path / AppIndex.INDEX_DIR).exists()
+
+def test_find_app_nested_builds_index(tmp_path):
+    # A nested app is found through the index, which is persisted on disk
+    app_path = create_mock_django_app(tmp_path, app_name='testapp', subdirectory='src/apps')
+
+    found = find_app_path('testapp', tmp_path)
+
+    assert isinstance(found, Path)
+    assert found == app_path.resolve()
+    index_file = tmp_path / AppIndex.INDEX_DIR / AppIndex.INDEX_FILE
+    assert index_file.exists()
+    data = json.loads(index_file.read_text())
+    assert 'src/apps/testapp' in data['dirs']
+
+def test_find_app_missing(tmp_path):
+    create_mock_django_app(tmp_path, app_name='testapp', subdirectory='src')
+
+    assert find_app('otherapp', tmp_path) is None
+
+def test_index_prefers_shallowest_match(tmp_path):
+    shallow = create_mock_django_app(tmp_path, app_name='shop', subdirectory='a')
+    create_mock_django_app(tmp_path, app_name='shop', subdirectory='b/c/d')
+
+    assert AppIndex(tmp_path).lookup('shop') == shallow
+
+def test_index_skips_hidden_and_cache_dirs(tmp_path):
+    (tmp_path / '.venv' / 'lib' / 'shop').mkdir(parents=True)
+    (tmp_path / '__pycache__' / 'shop').mkdir(parents=True)
+
+    index = AppIndex(tmp_path)
+
+    assert index.lookup('shop') is None
+    assert not any('.venv' in rel or '__pycache__' in rel for rel in index.dirs)
+
+def test_index_refresh_is_incremental(tmp_path, monkeypatch):
+    create_mock_django_app(tmp_path, app_name='first', subdirectory='src')
+    (tmp_path / 'other' / 'deep' / 'tree').mkdir(parents=True)
+    AppIndex(tmp_path).lookup('first')
+
+    # Add a new app below src; only src (whose mtime changed) should be listed again
+    create_mock_django_app(tmp_path, app_name='second', subdirectory='src')
+
+    listed = []
+    original = AppIndex._list_subdirs
+
+    def tracking_list_subdirs(self, path, rel_path, gitignores):
+        listed.append(Path(path))
+        return original(self, path, rel_path, gitignores)
+
+    monkeypatch.setattr(AppIndex, '_list_subdirs', tracking_list_subdirs)
+    index = AppIndex(tmp_path)
+    assert index.lookup('second') == tmp_path / 'src' / 'second'
+    assert tmp_path / 'src' in listed
+    assert tmp_path / 'other' / 'deep' not in listed
+
+def test_index_drops_removed_app(tmp_path):
+    app_path = create_mock_django_app(tmp_path, app_name='shop', subdirectory='src')
+    assert AppIndex(tmp_path).lookup('shop') == app_path
+
+    for child in app_path.iterdir():
+        child.unlink()
+    app_path.rmdir()
+
+    assert AppIndex(tmp_path).lookup('shop') is None
+
+def test_index_respects_gitignore(tmp_path):
+    (tmp_path / '.gitignore').write_text("generated/\n")
+    create_mock_django_app(tmp_path, app_name='shop', subdirectory='generated')
+
+    assert AppIndex(tmp_path).lookup('shop') is None
+
+def test_index_does_not_depend_on_first_lookup(tmp_path):
+    # 'media' is normally pruned; looking up another app first must not hide it
+    create_mock_django_app(tmp_path, app_name='shop', subdirectory='src')
+    media_path = create_mock_django_app(tmp_path, app_name='media', subdirectory='src')
+
+    assert find_app('shop', tmp_path) == (tmp_path / 'src' / 'shop').resolve()
+    assert find_app('media', tmp_path) == media_path.resolve()
+    assert not any(rel.startswith('src/media') for rel in AppIndex(tmp_path).dirs)
+
+def test_walker_prunes_heavy_directories(tmp_path):
+    # Heavy folders full of subdirectories must not be listed
+    for heavy in ['node_modules', '.git', 'venv']:
+        for i in range(20):
+            (tmp_path / heavy / f'pkg{i}').mkdir(parents=True)
+    app_path = create_mock_django_app(tmp_path, app_name='shop', subdirectory='src')
+
+    result = walk_for_app('shop', tmp_path)
+
+    assert result.path == app_path
+    assert result.visited == 3  # root, src, src/shop
+
+def test_walker_prunes_virtualenvs_and_gitignored(tmp_path):
+    env_path = tmp_path / 'my-env'
+    (env_path / 'lib' / 'shop').mkdir(parents=True)
+    (env_path / 'pyvenv.cfg').write_text("home = /usr/bin\n")
+    (tmp_path / '.gitignore').write_text("# build output\n/out\n")
+    create_mock_django_app(tmp_path, app_name='shop', subdirectory='out')
+
+    result = walk_for_app('shop', tmp_path)
+
+    assert result.path is None
+
+def test_walker_prefers_django_app_over_same_named_folder(tmp_path):
+    (tmp_path / 'a' / 'shop').mkdir(parents=True)
+    app_path = create_mock_django_app(tmp_path, app_name='shop', subdirectory='b/c')
+
+    assert walk_for_app('shop', tmp_path).path == app_path
+
+    # Without a Django app, the shallowest folder with the right name is used
+    (app_path / 'models.py').unlink()
+    for file_name in ['views.py', 'viewsets.py', 'serializers.py', 'tests.py']:
+        (app_path / file_name).unlink()
+    assert walk_for_app('shop', tmp_path).path == tmp_path / 'a' / 'shop'
+
+def test_walker_max_depth(tmp_path):
+    app_path = create_mock_django_app(tmp_path, app_name='shop', subdirectory='a/b')
+
+    assert walk_for_app('shop', tmp_path, max_depth=2).path is None
+    assert walk_for_app('shop', tmp_path, max_depth=3).path == app_path
+    assert find_app('shop', tmp_path, max_depth=2) is None
+    assert find_app('shop', tmp_path, max_depth=3) == app_path.resolve()
+
+def test_cli_fs_discovery_reports_visited_directories(tmp_path):
+    app_path = create_mock_django_app(tmp_path, app_name='testapp', subdirectory='src')
+    os.chdir(tmp_path)
+
+    runner = CliRunner()
+    result = runner.invoke(cli, ['--discovery', 'fs', '--stats', 'testapp', 'create', 'model', 'Product'])
+
+    print(result.output)
+    assert result.exit_code == 0
+    assert "class Product(models.Model):" in (app_path / 'models.py').read_text()
+    assert "discovery dirs visited: 3" in result.output
+    assert not (tmp_path / AppIndex.INDEX_DIR).exists()
+
+def _write_django_project(tmp_path):
+    (tmp_path / 'manage.py').write_text(
+        "import os\n"
+        "def main():\n"
+        "    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'project.settings')\n"
+    )
+    settings_dir = tmp_path / 'project' / 'settings'
+    settings_dir.mkdir(parents=True)
+    (tmp_path / 'project' / '__init__.py').write_text("")
+    (settings_dir / 'base.py').write_text(
+        "DJANGO_APPS = ['django.contrib.admin', 'django.contrib.auth']\n"
+        "LOCAL_APPS = [\n"
+        "    'apps.shop',\n"
+        "    'apps.billing_app.apps.BillingConfig',\n"
+        "]\n"
+        "INSTALLED_APPS = DJANGO_APPS + LOCAL_APPS\n"
+    )
+    (settings_dir / '__init__.py').write_text(
+        "from .base import *\n"
+        "INSTALLED_APPS += ['apps.reports']\n"
+    )
+    create_mock_django_app(tmp_path, app_name='shop', subdirectory='apps')
+    billing = create_mock_django_app(tmp_path, app_name='billing_app', subdirectory='apps')
+    (billing / 'apps.py').write_text(
+        "from django.apps import AppConfig\n"
+        "class BillingConfig(AppConfig):\n"
+        "    name = 'apps.billing_app'\n"
+    )
+    create_mock_django_app(tmp_path, app_name='reports', subdirectory='apps')
+
+def test_installed_apps_resolves_from_settings(tmp_path):
+    _write_django_project(tmp_path)
+    # A same-named folder that is not the installed app
+    create_mock_django_app(tmp_path, app_name='shop', subdirectory='archive')
+
+    installed_apps = InstalledApps(tmp_path)
+
+    assert installed_apps.settings_path == tmp_path / 'project' / 'settings' / '__init__.py'
+    assert installed_apps.apps() == {
+        'apps.shop': 'apps/shop',
+        'apps.billing_app': 'apps/billing_app',
+        'apps.reports': 'apps/reports',
+    }
+    assert installed_apps.resolve('shop') == tmp_path / 'apps' / 'shop'
+    assert installed_apps.resolve('apps.billing_app') == tmp_path / 'apps' / 'billing_app'
+    assert installed_apps.resolve('admin') is None
+    assert find_app('shop', tmp_path) == (tmp_path / 'apps' / 'shop').resolve()
+
+def test_installed_apps_cache_keyed_on_mtime(tmp_path):
+    _write_django_project(tmp_path)
+    first = InstalledApps(tmp_path)
+    first.apps()
+    assert first.parsed_files == 3
+
+    # Unchanged settings are served from the cache without parsing
+    second = InstalledApps(tmp_path)
+    assert second.resolve('reports') == tmp_path / 'apps' / 'reports'
+    assert second.parsed_files == 0
+
+    # Touching the settings invalidates the cache
+    base = tmp_path / 'project' / 'settings' / 'base.py'
+    base.write_text("INSTALLED_APPS = ['apps.shop']\n")
+    stat = base.stat()
+    os.utime(base, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    third = InstalledApps(tmp_path)
+    assert third.resolve('billing_app') is None
+    assert third.parsed_files > 0
+
+def test_installed_apps_explicit_settings_file(tmp_path):
+    _write_django_project(tmp_path)
+    (tmp_path / 'manage.py').unlink()
+
+    assert InstalledApps(tmp_path).settings_path is None
+    installed_apps = InstalledApps(tmp_path, settings='project/settings/base.py')
+    assert installed_apps.source_root == tmp_path
+    assert installed_apps.resolve('shop') == tmp_path / 'apps' / 'shop'
+
+def test_find_app_falls_back_when_not_installed(tmp_path):
+    _write_django_project(tmp_path)
+    app_path = create_mock_django_app(tmp_path, app_name='legacy', subdirectory='old')
+
+    assert find_app('legacy', tmp_path) == app_path.resolve()
+
+def _git(cwd, *args):
+    subprocess.run(['git', *args], cwd=cwd, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+@pytest.mark.skipif(shutil.which('git') is None, reason="git is not installed")
+def test_git_discovery_uses_tracked_files(tmp_path):
+    _git(tmp_path, 'init', '-q')
+    tracked = create_mock_django_app(tmp_path, app_name='shop', subdirectory='services/api')
+    (tmp_path / 'services' / 'api' / 'shop' / 'apps.py').write_text("")
+    _git(tmp_path, 'add', '.')
+
+    # An untracked same-named folder higher up in the tree is not considered
+    (tmp_path / 'scratch' / 'shop').mkdir(parents=True)
+
+    result = find_app_in_git_index('shop', tmp_path)
+    assert result.path == tracked
+    assert result.visited == 6
+    assert find_app_in_git_index('shop', tmp_path, max_depth=2).path is None
+    assert find_app('shop', tmp_path, discovery='git') == tracked.resolve()
+
+@pytest.mark.skipif(shutil.which('git') is None, reason="git is not installed")
+def test_git_discovery_falls_back_to_walker(tmp_path):
+    # Outside a work tree the git backend is unavailable
+    outside = tmp_path / 'outside'
+    app_path = create_mock_django_app(outside, app_name='shop', subdirectory='src')
+    if find_app_in_git_index('shop', outside) is None:
+        assert find_app('shop', outside, discovery='git') == app_path.resolve()
+
+    # Inside a work tree, apps that are not tracked yet are found by walking
+    repo = tmp_path / 'repo'
+    repo.mkdir()
+    _git(repo, 'init', '-q')
+    new_app = create_mock_django_app(repo, app_name='fresh', subdirectory='src')
+    assert find_app_in_git_index('fresh', repo).path is None
+    assert find_app('fresh', repo, discovery='git') == new_app.resolve()
@@ -0,0 +1,46 @@
+from django_create.engine import CreateEngine, class_module_name
+from django_create.session import session_scope
+from django_create.utils import create_mock_django_app
+
+MODEL = "class Product(models.Model):\n    name = models.CharField(max_length=100)\n"
+
+def test_engine_creates_classes_in_module_folders(tmp_path):
+    app_path = create_mock_django_app(
+        tmp_path,
+        app_name='testapp',
+        with_models_file=False,
+        with_models_folder=True,
+        with_tests_file=False,
+        with_tests_folder=True
+    )
+
+    with session_scope():
+        engine = CreateEngine(app_path)
+        model_path = engine.create_model('Product', MODEL, "from django.db import models")
+        test_path = engine.create_test('ProductTests', "class ProductTests(TestCase):\n    pass\n")
+        nested_path = engine.create_model('Price', "class Price(models.Model):\n    pass\n", path='billing')
+
+    assert model_path == app_path / 'models' / 'product.py'
+    assert model_path.read_text() == "from django.db import models\n\n" + MODEL
+    assert test_path == app_path / 'tests' / 'test_product_tests.py'
+    assert nested_path == app_path / 'models' / 'billing' / 'price.py'
+    assert "from .product import Product\n" in (app_path / 'models' / '__init__.py').read_text()
+    assert "from .test_product_tests import ProductTests\n" in (app_path / 'tests' / '__init__.py').read_text()
+    assert "from .price import Price\n" in (app_path / 'models' / 'billing' / '__init__.py').read_text()
+
+def test_engine_appends_to_single_file_modules(tmp_path):
+    app_path = create_mock_django_app(tmp_path, app_name='testapp')
+    (app_path / 'models.py').write_text("from django.db import models\n\n\nclass Tag(models.Model):\n    pass\n")
+
+    with session_scope():
+        path = CreateEngine(app_path).create_model('Product', MODEL, "from django.db import models")
+
+    assert path == app_path / 'models.py'
+    content = path.read_text()
+    assert content.count("from django.db import models") == 1
+    assert content.endswith(MODEL)
+    assert not (app_path / 'models').exists()
+
+def test_class_module_name():
+    assert class_module_name('models', 'ProductImage') == 'product_image'
+    assert class_module_name('tests', 'ProductImage') == 'test_product_image'
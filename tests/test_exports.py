@@ -0,0 +1,73 @@
+from django_create.exports import ExportRegistry
+from django_create.session import session_scope
+from django_create.utils import Utils
+
+def test_export_registry_parses_existing_file(tmp_path):
+    init_file = tmp_path / '__init__.py'
+    init_file.write_text(
+        "# Package exports\n"
+        "from .product import Product\n"
+        "from .tag import  Tag   # spacing differs\n"
+        "from .. import signals\n"
+        "\n"
+        "__all__ = ['Tag', 'Product', 'Legacy']\n"
+        "\n"
+        "default_app_config = 'shop.apps.ShopConfig'\n"
+    )
+
+    registry = ExportRegistry(init_file)
+
+    assert registry.exports == {('product', 'Product'), ('tag', 'Tag')}
+    assert registry.all_names == {'Tag', 'Product', 'Legacy'}
+    assert registry.add('tag', 'Tag') is False
+    assert registry.add('price', 'Price') is True
+
+    registry.add_source("from .tag import Tag")
+    assert registry.render() == (
+        "# Package exports\n"
+        "from .price import Price\n"
+        "from .product import Product\n"
+        "from .tag import Tag\n"
+        "\n"
+        "from .. import signals\n"
+        "\n"
+        "default_app_config = 'shop.apps.ShopConfig'\n"
+        "\n"
+        "__all__ = [\n"
+        "    'Legacy',\n"
+        "    'Price',\n"
+        "    'Product',\n"
+        "    'Tag',\n"
+        "]\n"
+    )
+
+def test_export_registry_save_only_when_changed(tmp_path):
+    init_file = tmp_path / 'models' / '__init__.py'
+
+    registry = ExportRegistry(init_file)
+    registry.add('product', 'Product')
+    assert registry.save() is True
+    assert ExportRegistry(init_file).render() == init_file.read_text()
+    assert ExportRegistry(init_file).save() is False
+
+def test_init_written_once_per_run(tmp_path):
+    init_file = tmp_path / 'models' / '__init__.py'
+
+    with session_scope() as session:
+        for index in range(50):
+            Utils.write_or_append_content(init_file, f"from .model_{index} import Model{index}", 'init')
+            Utils.write_or_append_content(init_file, f"from .model_{index} import Model{index}", 'init')
+        assert not init_file.exists()
+
+    assert session.stats['init_files_written'] == 1
+    assert session.stats['files_written'] == 1
+    content = init_file.read_text()
+    assert content.count("from .model_7 import Model7\n") == 1
+    assert content.index("'Model10'") < content.index("'Model2'")
+
+def test_init_written_immediately_outside_a_run(tmp_path):
+    init_file = tmp_path / '__init__.py'
+
+    Utils.write_or_append_content(init_file, "from .product import Product", 'init')
+
+    assert init_file.read_text() == "from .product import Product\n\n__all__ = [\n    'Product',\n]\n"
@@ -0,0 +1,299 @@
+import os
+import subprocess
+import sys
+import pytest
+from django_create import extraction
+from django_create.extraction import extract_classes, stream_classes
+
+MODELS = '''from django.db import models
+
+
+class TimeStamped(models.Model):
+    created = models.DateTimeField(auto_now_add=True)
+
+
+class Customer(TimeStamped):
+    last_order = models.ForeignKey(Order, null=True, on_delete=models.SET_NULL, related_name='+')
+
+
+class Order(TimeStamped):
+    customer = models.ForeignKey(to=Customer, on_delete=models.CASCADE)
+    parent = models.ForeignKey('self', null=True, on_delete=models.CASCADE)
+
+
+class Invoice(models.Model):
+    order = models.OneToOneField(Order, on_delete=models.CASCADE)
+
+    def siblings(self):
+        return Invoice.objects.filter(order__customer=self.order.customer)
+
+
+class Refund(models.Model):
+    invoice = models.ForeignKey(Invoice, on_delete=models.CASCADE)
+
+    def total(self):
+        return Payment.objects.filter(refund=self).count()
+
+
+class Payment(models.Model):
+    refund = models.ForeignKey(Refund, on_delete=models.CASCADE)
+'''
+
+def test_class_references_follow_the_module_graph():
+    contents = extract_classes(MODELS)
+
+    assert contents.class_references == {
+        'TimeStamped': [],
+        # Customer and Order reference each other only as relation targets
+        'Customer': ['TimeStamped'],
+        'Order': ['TimeStamped'],
+        'Invoice': ['Order'],
+        # Refund needs Payment itself, so only Payment's reference can be made lazy
+        'Refund': ['Invoice', 'Payment'],
+        'Payment': [],
+    }
+    assert "models.ForeignKey('Order', null=True" in contents.classes['Customer']
+    assert "models.ForeignKey(to='Customer', on_delete" in contents.classes['Order']
+    assert "models.OneToOneField(Order, on_delete" in contents.classes['Invoice']
+    assert "models.ForeignKey('Refund', on_delete" in contents.classes['Payment']
+
+def test_class_imports_only_bind_used_names():
+    contents = extract_classes(
+        "import os, sys as system\n"
+        "from .utils import (\n    slugify,\n    unused,\n)\n\n"
+        "class A:\n    path = os.sep\n    slug = slugify\n"
+    )
+
+    assert contents.imports == "import os, sys as system\nfrom .utils import (\n    slugify,\n    unused,\n)"
+    # Relative imports are made a level deeper, for the new package
+    assert contents.class_imports == {'A': ["import os", "from ..utils import slugify"]}
+
+def test_class_imports_of_relative_modules_made_deeper():
+    contents = extract_classes(
+        "from django.db import models\n"
+        "from .validators import validate_sku  # Shared with the forms\n"
+        "from ..core.fields import MoneyField, unused\n\n"
+        "def price_field():\n"
+        "    return MoneyField()\n\n"
+        "class Product(models.Model):\n"
+        "    sku = models.CharField(validators=[validate_sku])\n"
+        "    price = price_field()\n"
+    )
+
+    assert contents.class_imports == {'Product': [
+        "from django.db import models",
+        "from ..validators import validate_sku  # Shared with the forms",
+    ]}
+    assert contents.common.imports == ["from ...core.fields import MoneyField"]
+
+TRICKY = MODELS + '''
+
+def helper(value):
+    if value:
+        return 1
+    else:
+        return 2
+
+
+try:
+    import yaml
+except ImportError:
+    yaml = None
+
+# Listed in the admin
+@admin.register(Payment)
+class Receipt(
+    models.Model,
+):
+    """
+Notes kept flush left.
+class NotAClass:
+    """
+    note = models.TextField(default=\'\'\'
+text = 1
+\'\'\')
+import json; import csv
+CHOICES = [
+    ('a', 'A'),
+]
+class Last(Receipt): pass
+# trailing comment
+'''
+
+def test_other_code_split_into_common_code_and_hooks():
+    contents = extract_classes(
+        '"""Docstring."""\n'
+        "import logging\n"
+        "from django.db import models\n\n"
+        "logger = logging.getLogger(__name__)\n"
+        "SIZES = ['S', 'M']\n\n"
+        "class Shirt(models.Model):\n"
+        "    size = models.CharField(choices=[(size, size) for size in SIZES])\n\n"
+        "def describe(shirt):\n"
+        "    return str(Shirt.objects.get(pk=shirt.pk))\n\n"
+        "def log_shirt(shirt):\n"
+        "    logger.info(describe(shirt))\n\n"
+        "models.signals.post_save.connect(log_shirt)\n"
+        "SHIRT_FIELDS = [field.name for field in Shirt._meta.fields]\n\n"
+        "class ShirtReport:\n"
+        "    columns = SHIRT_FIELDS\n"
+    )
+
+    assert contents.class_common == {'Shirt': ['SIZES'], 'ShirtReport': []}
+    # Functions only use the class once called
+    assert [statement.split('(')[0] for statement in contents.common.statements] == [
+        'logger = logging.getLogger', "SIZES = ['S', 'M']", 'def describe', 'def log_shirt',
+    ]
+    assert contents.common.imports == ["import logging"]
+    assert contents.common.names == ['logger', 'SIZES', 'describe', 'log_shirt']
+    assert contents.common.class_references == ['Shirt']
+    # Runs for its effect, and uses a class when run
+    assert contents.hooks.statements == [
+        "models.signals.post_save.connect(log_shirt)",
+        "SHIRT_FIELDS = [field.name for field in Shirt._meta.fields]",
+    ]
+    assert contents.hooks.imports == ["from django.db import models"]
+    assert contents.hooks.class_references == ['Shirt']
+    assert contents.hooks.common_names == ['log_shirt']
+    # A class using a hook cannot import it
+    assert contents.class_hooks == {'Shirt': [], 'ShirtReport': ['SHIRT_FIELDS']}
+
+def test_common_functions_use_classes_once_called():
+    contents = extract_classes(
+        "from django.db import models\n\n"
+        "def default_category():\n"
+        "    return Category.objects.first()\n\n"
+        "@cache(key=lambda: Category)\n"
+        "def cached_category():\n"
+        "    return Category.objects.last()\n\n"
+        "def by_name(name: str = Category.DEFAULT):\n"
+        "    return Category.objects.get(name=name)\n\n"
+        "class Category(models.Model):\n"
+        "    DEFAULT = 'misc'\n\n"
+        "class Item(models.Model):\n"
+        "    category = models.ForeignKey(Category, default=default_category, on_delete=models.CASCADE)\n"
+    )
+
+    assert contents.class_common == {'Category': [], 'Item': ['default_category']}
+    assert contents.common.names == ['default_category', 'cached_category']
+    assert contents.common.class_references == ['Category']
+    # Default values are evaluated when the function is defined
+    assert [statement.split('(')[0] for statement in contents.hooks.statements] == ['def by_name']
+    assert contents.class_hooks == {'Category': [], 'Item': []}
+
+def test_unused_imports_kept_for_their_side_effect():
+    contents = extract_classes(
+        "import app.checks\n"
+        "from django.db import models\n"
+        "from django.shortcuts import render\n"
+        "from django.contrib import admin  # noqa: F401\n"
+        "from . import signals, utils\n\n"
+        "class Shirt(models.Model):\n"
+        "    size = utils.size_field()\n"
+    )
+
+    assert contents.class_imports == {'Shirt': ["from django.db import models", "from .. import utils"]}
+    # Module imports, marked and relative ones (a level deeper, for the new package) are kept
+    assert contents.side_effect_imports == [
+        "import app.checks",
+        "from django.contrib import admin  # noqa: F401",
+        "from .. import signals",
+    ]
+
+def test_stream_classes_matches_extract_classes(tmp_path):
+    path = tmp_path / 'models.py'
+    path.write_bytes(TRICKY.encode('utf-8'))
+
+    streamed = stream_classes(path)
+    extracted = extract_classes(TRICKY)
+
+    assert list(streamed.classes) == ['TimeStamped', 'Customer', 'Order', 'Invoice', 'Refund', 'Payment', 'Receipt', 'Last']
+    assert streamed.import_statements == extracted.import_statements
+    for field in ('classes', 'class_imports', 'class_references', 'class_common', 'class_hooks'):
+        assert dict(getattr(streamed, field)) == getattr(extracted, field)
+    assert (streamed.common, streamed.hooks) == (extracted.common, extracted.hooks)
+
+def test_stream_classes_parses_a_large_string_once(tmp_path, monkeypatch):
+    # Column-0 lines looking like statements, inside a string and inside brackets
+    schema = "".join(f"class Fake{index}:\n    x = ({index},\n" for index in range(3000))
+    choices = "".join(f"choice{index},\n" for index in range(3000))
+    source = (
+        "from django.db import models\n\n"
+        f'SCHEMA = """\n{schema}"""\n\n'
+        f"CHOICES = [\n{choices}]\n\n"
+        "@decorate\n"
+        "class First(models.Model):\n    pass\n\n"
+        "class Second(models.Model):\n    label = 'it\\'s \"quoted\" # (not a comment'\n"
+    )
+    path = tmp_path / 'models.py'
+    path.write_text(source)
+    parse_lines = extraction._parse_lines
+    parsed = []
+    monkeypatch.setattr(extraction, '_PIECE_SIZE', 1024)
+    monkeypatch.setattr(extraction, '_parse_lines', lambda raw_lines: parsed.append(len(raw_lines)) or parse_lines(raw_lines))
+
+    streamed = stream_classes(path)
+    extracted = extract_classes(source)
+
+    assert list(streamed.classes) == ['First', 'Second']
+    assert dict(streamed.classes) == extracted.classes
+    assert streamed.common == extracted.common
+    # Every line is parsed once: the string, the list, then the classes
+    assert sum(parsed) == source.count("\n")
+    assert len(parsed) == 3
+
+def test_stream_classes_raises_syntax_error(tmp_path):
+    path = tmp_path / 'models.py'
+    path.write_text("class A:\n    pass\n\nclass B(:\n    pass\n")
+
+    with pytest.raises(SyntaxError):
+        stream_classes(path)
+
+MEASURE_STREAM = '''
+import resource, sys
+from django_create.extraction import stream_classes
+
+path, size_mb = sys.argv[1], int(sys.argv[2])
+with open(path, "w") as f:
+    f.write("from django.db import models\\n\\n\\n")
+    index = 0
+    while f.tell() < size_mb * 1024 * 1024:
+        f.write(
+            f"class Model{index}(models.Model):\\n"
+            f"    name = models.CharField(max_length=100, default='{index:0>60}')\\n"
+            "    code = models.IntegerField(default=0)\\n"
+            "    price = models.DecimalField(max_digits=10, decimal_places=2)\\n"
+            "    created = models.DateTimeField(auto_now_add=True)\\n"
+            "    updated = models.DateTimeField(auto_now=True)\\n"
+            "    active = models.BooleanField(default=True)\\n\\n"
+            "    class Meta:\\n"
+            "        ordering = ['name']\\n\\n\\n"
+        )
+        index += 1
+
+before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+classes = total = 0
+contents = stream_classes(path)
+for name in contents.classes:
+    total += len(contents.classes[name])
+    classes += 1
+after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+print(classes, total, after - before)
+'''
+
+@pytest.mark.skipif(sys.platform in ('win32', 'darwin'), reason="ru_maxrss is in kilobytes on Linux only")
+def test_stream_classes_memory_is_bounded(tmp_path):
+    # DJANGO_CREATE_STREAM_TEST_MB=200 runs it on a 200 MB module
+    size_mb = int(os.environ.get('DJANGO_CREATE_STREAM_TEST_MB', '2'))
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+    output = subprocess.run(
+        [sys.executable, '-c', MEASURE_STREAM, str(tmp_path / 'models.py'), str(size_mb)],
+        cwd=root, capture_output=True, text=True, check=True,
+    ).stdout
+    classes, total, growth_kb = map(int, output.split())
+
+    assert total >= size_mb * 1024 * 1024 * 0.9
+    # One piece of the module and its syntax tree at a time, plus a small
+    # record per class: never the module itself
+    assert growth_kb * 1024 < 32 * 1024 * 1024 + 400 * classes
@@ -0,0 +1,176 @@
+import pytest
+from django_create.imports import ImportBlock, find_import_header, merge_module_source, rewrite_import_levels
+
+LEVELS = {'models': 2, 'views': 1, 'serializers': 1}
+
+def test_rewrite_import_levels():
+    source = (
+        "from .models import Product\n"
+        "from ..views import ProductView\n"
+        "from .serializers import ProductSerializer\n"
+        "from .models.product import Price\n"
+        "from django.db import models\n"
+    )
+    assert rewrite_import_levels(source, LEVELS) == (
+        "from ..models import Product\n"
+        "from .views import ProductView\n"
+        "from .serializers import ProductSerializer\n"
+        "from ..models.product import Price\n"
+        "from django.db import models\n"
+    )
+
+def test_rewrite_import_levels_leaves_lookalikes():
+    source = (
+        "from .models_extra import Extra\n"
+        "from .. import models\n"
+        "from ...models import Deep\n"
+        "\n"
+        "class Product:\n"
+        "    \"\"\"\n"
+        "    from .models import Product\n"
+        "    \"\"\"\n"
+        "    note = 'from .models import X'  # from .models import Y\n"
+    )
+    assert rewrite_import_levels(source, LEVELS) == source
+
+def test_rewrite_import_levels_nested_and_multiline():
+    source = (
+        "try:\n"
+        "    from .models import (\n"
+        "        Product,\n"
+        "        Price,\n"
+        "    )\n"
+        "except ImportError:\n"
+        "    pass\n"
+        "    from .models import Tag\n"
+    )
+    assert rewrite_import_levels(source, LEVELS) == source.replace('from .models', 'from ..models')
+
+def test_rewrite_import_levels_after_strings():
+    source = (
+        "NOTE = \"it's \\\" from\"  # don't\n"
+        "HELP = '''\n"
+        "from .models import Product\n"
+        "'''\n"
+        "from .models import Price\n"
+    )
+    assert rewrite_import_levels(source, LEVELS) == source.replace(
+        "from .models import Price", "from ..models import Price"
+    )
+
+def test_import_block_parse_and_render():
+    block = ImportBlock.parse(
+        "import os, sys as system\n"
+        "from django.db import models\n"
+        "from .models import (\n"
+        "    Product,\n"
+        "    Price as Cost,\n"
+        ")\n"
+        "from __future__ import annotations\n"
+    )
+    block.update(ImportBlock.parse("from .models import Tag\nfrom django.db import models, transaction\n"))
+
+    assert block.render() == (
+        "from __future__ import annotations\n"
+        "\n"
+        "import os\n"
+        "import sys as system\n"
+        "\n"
+        "from django.db import models, transaction\n"
+        "\n"
+        "from .models import Price as Cost, Product, Tag"
+    )
+
+def test_import_block_wraps_long_imports():
+    names = ', '.join(f"Model{i}" for i in range(12))
+    rendered = ImportBlock.parse(f"from ..models import {names}").render()
+
+    assert rendered.startswith("from ..models import (\n    Model0,\n    Model1,\n")
+    assert rendered.endswith("    Model9,\n)")
+    assert ImportBlock.parse(rendered).from_imports == ImportBlock.parse(f"from ..models import {names}").from_imports
+
+def test_import_block_rejects_other_statements():
+    with pytest.raises(SyntaxError):
+        ImportBlock.parse("import os\nx = 1\n")
+
+def test_find_import_header():
+    source = (
+        "#!/usr/bin/env python\n"
+        '"""Module docstring."""\n'
+        "\n"
+        "# Core imports\n"
+        "from django.db import (\n"
+        "    models,\n"
+        ")\n"
+        "import os\n"
+        "\n"
+        "# Models\n"
+        "class A:\n"
+        "    import sys\n"
+    )
+    start, end = find_import_header(source)
+    assert source[start:end] == "# Core imports\nfrom django.db import (\n    models,\n)\nimport os\n"
+    assert find_import_header("class A:\n    pass\n") == (0, 0)
+
+def test_merge_module_source_only_rewrites_header():
+    body = (
+        "# Create your models here.\n"
+        "class Product(models.Model):\n"
+        "    name   =   models.CharField( max_length=100 )  # odd spacing kept\n"
+    )
+    current = (
+        '"""Shop models."""\n'
+        "from django.db import models  # noqa: F401\n"
+        "from .choices import (\n"
+        "    Color,  # used by Product\n"
+        "    Size as ProductSize,\n"
+        ")\n"
+        "\n" + body
+    )
+
+    merged = merge_module_source(
+        current,
+        "from django.db import models\nfrom .choices import Color, Weight",
+        "class Price(models.Model):\n    pass\n",
+    )
+
+    assert merged == (
+        '"""Shop models."""\n'
+        "from django.db import models  # noqa: F401\n"
+        "\n"
+        "# used by Product\n"
+        "from .choices import Color, Size as ProductSize, Weight\n"
+        "\n" + body +
+        "\n"
+        "class Price(models.Model):\n"
+        "    pass\n"
+    )
+
+def test_find_import_header_docstring_quotes():
+    imports = "from django.db import models\n"
+    for docstring in ("'Module doc.'\n", 'r"""Module\ndoc."""\n', "'Module ' \\\n'doc.'\n"):
+        source = docstring + imports + "\nx = 1\n"
+        start, end = find_import_header(source)
+        assert source[start:end] == imports
+    # A string that is not a docstring ends the preamble
+    assert find_import_header("b'data'\nimport os\n") == (0, 0)
+    assert find_import_header("'doc' + x\nimport os\n") == (0, 0)
+
+def test_merge_module_source_after_single_quoted_docstring():
+    current = "'Module doc.'\nfrom django.db import models\n\n\nclass A(models.Model):\n    pass\n"
+    merged = merge_module_source(current, "from django.conf import settings", "class B:\n    pass")
+    assert merged == (
+        "'Module doc.'\n"
+        "from django.conf import settings\n"
+        "from django.db import models\n"
+        "\n"
+        "class A(models.Model):\n    pass\n"
+        "\n"
+        "class B:\n    pass\n"
+    )
+
+def test_merge_module_source_unparseable_header():
+    current = "from .models import {{ broken }}\n\nclass A:\n    pass\n"
+    merged = merge_module_source(current, "from .models import B", "class C:\n    pass")
+
+    assert merged == current + "\nfrom .models import B\n\nclass C:\n    pass\n"
@@ -0,0 +1,56 @@
+import pytest
+from pathlib import Path
+from django_create.layout import ProjectLayout
+from django_create.utils import Utils, create_mock_django_app
+
+def test_scan_records_files_and_folders(tmp_path):
+    app_path = create_mock_django_app(
+        tmp_path,
+        app_name='testapp',
+        with_views_file=False,
+        with_views_folder=True,
+        with_tests_file=False,
+        with_tests_folder=True
+    )
+    (app_path / 'views' / 'products' / 'lists').mkdir(parents=True)
+    (app_path / 'views' / 'products' / '__init__.py').write_text("")
+
+    layout = ProjectLayout.scan(app_path)
+
+    assert layout.has_file('models')
+    assert not layout.has_folder('models')
+    assert layout.has_folder('views')
+    assert not layout.has_file('views')
+    assert layout.has_subpath('views/products/lists')
+    assert not layout.has_subpath('views/other')
+    assert layout.has_init('views')
+    assert layout.has_init('views/products')
+    assert not layout.has_init('views/products/lists')
+    assert layout.import_style('views') == 'dotdot'
+    assert layout.import_style('models') == 'dot'
+
+def test_layout_is_immutable(tmp_path):
+    app_path = create_mock_django_app(tmp_path, app_name='testapp')
+    layout = ProjectLayout.scan(app_path)
+
+    with pytest.raises(AttributeError):
+        layout.module_files = frozenset()
+
+    folderized = layout.with_folders(['models', 'views'])
+    assert layout.has_file('models') and not layout.has_folder('models')
+    assert folderized.has_folder('models') and not folderized.has_file('models')
+    assert folderized.has_init('views')
+    assert folderized.has_file('serializers')
+
+def test_process_template_imports_uses_layout_without_stats(tmp_path, monkeypatch):
+    app_path = create_mock_django_app(tmp_path, app_name='testapp', with_models_folder=True)
+    layout = ProjectLayout.scan(app_path)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("the filesystem should not be consulted")
+
+    monkeypatch.setattr(Path, 'exists', fail)
+    content = "from .models import Model\nfrom .views import View"
+    result = Utils.process_template_imports(content, app_path, layout)
+
+    assert result == "from ..models import Model\nfrom .views import View"
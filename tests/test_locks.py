@@ -0,0 +1,104 @@
+import os
+import subprocess
+import sys
+import pytest
+from django_create.locks import FileLock, fcntl, lock_file
+from django_create.session import session_scope
+from django_create.utils import create_mock_django_app
+
+pytestmark = pytest.mark.skipif(fcntl is None, reason="advisory locks need fcntl")
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def _is_locked(path):
+    fd = os.open(FileLock(os.path.dirname(os.path.realpath(path))).lock_path, os.O_RDWR | os.O_CREAT, 0o600)
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except BlockingIOError:
+        return True
+    finally:
+        os.close(fd)
+    return False
+
+def test_lock_held_until_run_ends(tmp_path):
+    target = tmp_path / 'models' / '__init__.py'
+
+    with session_scope() as session:
+        lock_file(target)
+        lock_file(tmp_path / 'models' / '..' / 'models' / '__init__.py')
+        assert _is_locked(target)
+
+    assert not _is_locked(target)
+    assert session.stats['locks_acquired'] == 1
+
+def test_one_lock_per_directory(tmp_path):
+    with session_scope() as session:
+        for index in range(2000):
+            lock_file(tmp_path / 'models' / f"model{index}.py")
+        lock_file(tmp_path / 'models.py')
+        assert _is_locked(tmp_path / 'models' / '__init__.py')
+
+    assert session.stats['locks_acquired'] == 2
+
+FOLDERIZE_WITH_FEW_FILES = """
+import resource, sys
+from click.testing import CliRunner
+from django_create.cli import cli
+
+resource.setrlimit(resource.RLIMIT_NOFILE, (256, resource.getrlimit(resource.RLIMIT_NOFILE)[1]))
+result = CliRunner().invoke(cli, ['testapp', 'folderize'])
+sys.exit(result.output if result.exit_code else 0)
+"""
+
+def test_folderize_many_classes_with_few_file_descriptors(tmp_path):
+    app_path = create_mock_django_app(tmp_path, 'testapp', with_models_file=True)
+    (app_path / 'models.py').write_text("from django.db import models\n\n" + "".join(
+        f"class Model{index}(models.Model):\n    pass\n\n" for index in range(600)
+    ))
+
+    result = subprocess.run(
+        [sys.executable, '-c', FOLDERIZE_WITH_FEW_FILES],
+        cwd=tmp_path, env=dict(os.environ, PYTHONPATH=PROJECT_ROOT), capture_output=True, text=True,
+    )
+
+    assert result.returncode == 0, result.stderr
+    assert (app_path / 'models' / 'model599.py').exists()
+
+def test_no_lock_outside_a_run(tmp_path):
+    lock_file(tmp_path / 'models.py')
+
+    assert not _is_locked(tmp_path / 'models.py')
+
+def _run_concurrently(base_path, commands):
+    env = dict(os.environ, PYTHONPATH=PROJECT_ROOT)
+    processes = [
+        subprocess.Popen(
+            [sys.executable, '-c', 'from django_create.cli import cli; cli()'] + command,
+            cwd=base_path, env=env, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+        )
+        for command in commands
+    ]
+    for process in processes:
+        output = process.communicate()[0].decode()
+        assert process.returncode == 0, output
+
+def test_concurrent_creates_keep_every_export(tmp_path):
+    app_path = create_mock_django_app(tmp_path, 'testapp', with_models_folder=True, with_models_file=False)
+
+    _run_concurrently(tmp_path, [['testapp', 'create', 'model', f"Model{index}"] for index in range(32)])
+
+    init_content = (app_path / 'models' / '__init__.py').read_text()
+    for index in range(32):
+        assert f"from .model{index} import Model{index}\n" in init_content
+        assert (app_path / 'models' / f"model{index}.py").exists()
+
+def test_concurrent_appends_to_one_module(tmp_path):
+    app_path = create_mock_django_app(tmp_path, 'testapp', with_models_file=True, with_models_folder=False)
+    (app_path / 'models.py').write_text("from django.db import models\n\nclass Existing(models.Model):\n    pass\n")
+
+    _run_concurrently(tmp_path, [['testapp', 'create', 'model', f"Model{index}"] for index in range(8)])
+
+    content = (app_path / 'models.py').read_text()
+    assert content.count("from django.db import models") == 1
+    for index in range(8):
+        assert content.count(f"class Model{index}(models.Model):") == 1
@@ -0,0 +1,257 @@
+import os
+import sys
+import pytest
+from click.testing import CliRunner
+from django_create.cli import cli
+from django_create.overlay import FileOverlay, current_overlay
+from django_create.session import session_scope
+from django_create.utils import create_mock_django_app
+
+def test_overlay_defers_writes_until_run_ends(tmp_path):
+    target = tmp_path / 'pkg' / 'sub' / 'module.py'
+
+    with session_scope() as session:
+        overlay = current_overlay()
+        overlay.write_text(target, "first\n")
+        overlay.write_text(target, "second\n")
+
+        # Reads are served from the pending write; nothing touched the disk yet
+        assert overlay.exists(target)
+        assert overlay.read_text(target) == "second\n"
+        assert not (tmp_path / 'pkg').exists()
+
+    assert target.read_text() == "second\n"
+    assert session.stats['files_written'] == 1
+    # Coalesced write, repeated parent mkdir, exists() and read_text() answered from memory
+    assert session.stats['syscalls_saved'] == 4
+
+def test_overlay_mkdir_recorded_once(tmp_path):
+    with session_scope() as session:
+        overlay = current_overlay()
+        for _ in range(5):
+            overlay.mkdir(tmp_path / 'models' / 'products')
+        assert not (tmp_path / 'models').exists()
+
+    assert (tmp_path / 'models' / 'products').is_dir()
+    assert session.stats['syscalls_saved'] == 4
+
+def test_overlay_reads_disk_once_and_tracks_deletes(tmp_path):
+    source = tmp_path / 'models.py'
+    source.write_text("class A:\n    pass\n")
+
+    with session_scope():
+        overlay = current_overlay()
+        assert overlay.read_text(source) == "class A:\n    pass\n"
+        source.write_text("changed behind our back\n")
+        assert overlay.read_text(source) == "class A:\n    pass\n"
+
+        overlay.unlink(source)
+        assert not overlay.exists(source)
+        with pytest.raises(FileNotFoundError):
+            overlay.read_text(source)
+        assert source.exists()
+
+    assert not source.exists()
+
+def test_overlay_writes_through_outside_a_run(tmp_path):
+    target = tmp_path / 'new' / 'file.py'
+
+    current_overlay().write_text(target, "content\n")
+
+    assert target.read_text() == "content\n"
+
+def test_folderize_reports_saved_syscalls(tmp_path, monkeypatch):
+    app_path = create_mock_django_app(tmp_path, 'testapp')
+    (app_path / 'models.py').write_text(
+        "from django.db import models\n\n"
+        + "\n\n".join(f"class Model{i}(models.Model):\n    pass" for i in range(10))
+        + "\n"
+    )
+    monkeypatch.chdir(tmp_path)
+
+    result = CliRunner().invoke(cli, ['--stats', 'testapp', 'folderize'])
+
+    assert result.exit_code == 0, result.output
+    assert "syscalls saved:" in result.output
+    assert not (app_path / 'models.py').exists()
+    assert sorted(os.listdir(app_path / 'models')) == ['__init__.py'] + [f"model{i}.py" for i in range(10)]
+    assert "from .model9 import Model9" in (app_path / 'models' / '__init__.py').read_text()
+
+def test_overlay_skips_unchanged_writes(tmp_path):
+    unchanged = tmp_path / 'unchanged.py'
+    changed = tmp_path / 'changed.py'
+    unchanged.write_text("class A:\n    pass\n")
+    changed.write_text("class A:\n    pass\n")
+    os.utime(unchanged, ns=(10**9, 10**9))
+
+    with session_scope() as session:
+        overlay = current_overlay()
+        overlay.write_text(unchanged, "class A:\n    pass\n")
+        # Read, modified and restored during the run: still identical on disk
+        content = overlay.read_text(changed)
+        overlay.write_text(changed, content + "class B:\n    pass\n")
+        overlay.write_text(changed, content)
+        overlay.write_text(tmp_path / 'new.py', "")
+
+    assert unchanged.stat().st_mtime_ns == 10**9
+    assert session.stats['writes_skipped'] == 2
+    assert session.stats['files_written'] == 1
+    assert (tmp_path / 'new.py').exists()
+
+def test_rerun_leaves_files_untouched(tmp_path, monkeypatch):
+    app_path = create_mock_django_app(tmp_path, 'testapp', with_models_folder=True, with_models_file=False)
+    monkeypatch.chdir(tmp_path)
+    runner = CliRunner()
+
+    assert runner.invoke(cli, ['testapp', 'create', 'model', 'Product']).exit_code == 0
+    init_file = app_path / 'models' / '__init__.py'
+    os.utime(init_file, ns=(10**9, 10**9))
+
+    # The export is already there: the __init__.py is rendered again but not rewritten
+    result = runner.invoke(cli, ['--stats', 'testapp', 'create', 'model', 'Product'])
+
+    assert result.exit_code == 0, result.output
+    assert init_file.stat().st_mtime_ns == 10**9
+
+def test_failed_run_discards_pending_changes(tmp_path):
+    models_py = tmp_path / 'models.py'
+    models_py.write_text("class A:\n    pass\n")
+
+    with pytest.raises(RuntimeError):
+        with session_scope():
+            overlay = current_overlay()
+            overlay.write_text(tmp_path / 'models' / 'a.py', "class A:\n    pass\n")
+            overlay.unlink(models_py)
+            raise RuntimeError("extraction failed")
+
+    assert models_py.read_text() == "class A:\n    pass\n"
+    assert not (tmp_path / 'models').exists()
+
+def test_overlay_discard_keeps_file_on_disk(tmp_path):
+    models_py = tmp_path / 'models.py'
+    models_py.write_text("class A:\n    pass\n")
+
+    with session_scope():
+        overlay = current_overlay()
+        overlay.unlink(models_py)
+        overlay.discard(models_py)
+        assert overlay.exists(models_py)
+
+    assert models_py.read_text() == "class A:\n    pass\n"
+
+def test_flush_is_atomic_when_interrupted(tmp_path, monkeypatch):
+    models_py = tmp_path / 'models.py'
+    models_py.write_text("class A:\n    pass\n")
+    first = tmp_path / 'models' / 'a.py'
+    second = tmp_path / 'models' / 'b.py'
+    replaced = []
+    original_replace = os.replace
+
+    def failing_replace(source, target):
+        if replaced:
+            raise OSError("disk full")
+        replaced.append(target)
+        original_replace(source, target)
+
+    monkeypatch.setattr(os, 'replace', failing_replace)
+
+    with pytest.raises(OSError):
+        with session_scope():
+            overlay = current_overlay()
+            overlay.write_text(first, "class A:\n    pass\n")
+            overlay.write_text(second, "class B:\n    pass\n")
+            overlay.unlink(models_py)
+
+    # Files are either complete or absent, no temporary files are left behind,
+    # and the original module is only deleted once everything else is in place
+    assert first.read_text() == "class A:\n    pass\n"
+    assert not second.exists()
+    assert sorted(os.listdir(tmp_path / 'models')) == ['a.py']
+    assert models_py.exists()
+
+@pytest.mark.skipif(not sys.platform.startswith('linux'), reason="reads fsync targets from /proc")
+def test_flush_syncs_each_file_and_directory_once(tmp_path, monkeypatch):
+    synced = []
+
+    def sync(fd):
+        path = os.readlink(f"/proc/self/fd/{fd}")
+        if path.endswith('.tmp'):
+            # Synced in one batch, once every file is written
+            assert len(list(tmp_path.rglob('*.tmp'))) == 21
+        synced.append(path)
+
+    def host_wide_sync():
+        raise AssertionError("os.sync() flushes every filesystem of the host")
+
+    monkeypatch.setattr(os, 'sync', host_wide_sync, raising=False)
+    monkeypatch.setattr(os, 'fsync', sync)
+    monkeypatch.setattr(os, 'fdatasync', sync, raising=False)
+
+    with session_scope() as session:
+        overlay = current_overlay()
+        for index in range(20):
+            overlay.write_text(tmp_path / 'models' / f"model_{index}.py", f"class Model{index}:\n    pass\n")
+        overlay.write_text(tmp_path / 'admin.py', "")
+
+    # Every temporary file is synced, once, before any is moved into place
+    temp_files = [path for path in synced if path.endswith('.tmp')]
+    assert len(temp_files) == len(set(temp_files)) == 21
+    assert sorted(path for path in synced if not path.endswith('.tmp')) == sorted([str(tmp_path), str(tmp_path / 'models')])
+    assert session.stats['dirs_synced'] == 2
+    assert session.stats['files_written'] == 21
+
+def _large_module(path, classes=2000):
+    path.write_text(
+        '"""Shop models."""\n'
+        "from django.db import models\n\n"
+        + "\n\n".join(f"class Model{i}(models.Model):\n    name = models.CharField(max_length=10)" for i in range(classes))
+        + "\n"
+    )
+    return path.read_bytes()
+
+def test_append_to_module_reads_only_its_imports(tmp_path, monkeypatch):
+    models_py = tmp_path / 'models.py'
+    original = _large_module(models_py)
+    monkeypatch.setattr(FileOverlay, 'read_text', lambda *args, **kwargs: pytest.fail("module loaded"))
+
+    with session_scope() as session:
+        overlay = current_overlay()
+        overlay.append_to_module(models_py, "from django.db import models", "class Product(models.Model):\n    pass\n")
+        overlay.append_to_module(models_py, "", "\n\nclass Tag(models.Model):\n    pass")
+
+    assert session.stats['files_appended'] == 1
+    assert session.stats['files_written'] == 0
+    assert models_py.read_bytes() == original + (
+        b"\nclass Product(models.Model):\n    pass\n"
+        b"\nclass Tag(models.Model):\n    pass\n"
+    )
+
+def test_append_to_module_inserts_new_imports_in_place(tmp_path):
+    models_py = tmp_path / 'models.py'
+    original = _large_module(models_py)
+    body = "class Product(models.Model):\n    created = models.DateTimeField(default=timezone.now)\n"
+
+    with session_scope() as session:
+        overlay = current_overlay()
+        overlay.append_to_module(models_py, "from django.db import models\nfrom django.utils import timezone", body)
+        assert overlay.import_header(models_py).startswith("from django.db import models\n")
+
+    assert session.stats['files_written'] == 1
+    header = b"from django.db import models\nfrom django.utils import timezone\n"
+    assert models_py.read_bytes() == original.replace(b"from django.db import models\n", header) + b"\n" + body.encode()
+
+def test_append_to_module_serves_patched_reads(tmp_path):
+    models_py = tmp_path / 'models.py'
+    models_py.write_text("from django.db import models\n\nclass A(models.Model):\n    pass")
+
+    with session_scope():
+        overlay = current_overlay()
+        overlay.append_to_module(models_py, "import uuid", "class B(models.Model):\n    pass\n")
+        content = overlay.read_text(models_py)
+        overlay.append_to_module(models_py, "", "class C(models.Model):\n    pass\n")
+
+    assert content == (
+        "import uuid\n\nfrom django.db import models\n\nclass A(models.Model):\n    pass\n\n"
+        "class B(models.Model):\n    pass\n"
+    )
+    assert models_py.read_text() == content + "\nclass C(models.Model):\n    pass\n"
@@ -0,0 +1,216 @@
+import os
+import subprocess
+import sys
+import zipfile
+import pytest
+from pathlib import Path
+import django_create
+from click.testing import CliRunner
+from django_create.cli import cli
+from django_create.session import session_scope
+from django_create.templating import (
+    CompiledTemplate, RenderedTemplate, TemplateResolver, bundled_templates, get_template, load_template,
+    template_search_path
+)
+from django_create.utils import Utils, create_mock_django_app
+
+def test_compiled_template_render():
+    template = CompiledTemplate("class {{ name }}({{ base }}):\n    label = '{{ name }}'\n    x = {{ missing }}\n")
+
+    assert template.names == ['name', 'base', 'name', 'missing']
+    result = template.render(name='Product', base='models.Model', unused=1)
+    assert result == "class Product(models.Model):\n    label = 'Product'\n    x = {{ missing }}\n"
+
+def test_compiled_template_without_placeholders():
+    assert CompiledTemplate("").render() == ""
+    assert CompiledTemplate("plain {{text}}").render(text='x') == "plain {{text}}"
+
+def test_compiled_template_sections():
+    template = CompiledTemplate(
+        "{% imports %}\nfrom .models import {{ name }}\n\n{% body %}\nclass {{ name }}View:\n    pass"
+    )
+
+    sections = template.render_sections(name='Product')
+    assert sections == RenderedTemplate("from .models import Product", "class ProductView:\n    pass")
+    assert template.render(name='Product') == str(sections)
+    assert str(RenderedTemplate("", "class A:\n    pass")) == "class A:\n    pass"
+
+def test_compiled_template_sections_without_markers():
+    source = "from x import (\n    a,\n    b,\n)\nimport y\n\nclass {{ name }}:\n    pass"
+    template = CompiledTemplate(source)
+
+    # Unsectioned templates render unchanged; the import header is split off
+    assert template.render(name='A') == source.replace('{{ name }}', 'A')
+    sections = template.render_sections(name='A')
+    assert sections.imports == "from x import (\n    a,\n    b,\n)\nimport y"
+    assert sections.body == "class A:\n    pass"
+
+def test_load_template_is_cached(tmp_path, monkeypatch):
+    template_path = tmp_path / 'template.txt'
+    template_path.write_text("class {{ name }}:\n    pass")
+
+    first = load_template(template_path)
+
+    # Second load must not open the file again
+    def fail_open(*args, **kwargs):
+        raise AssertionError("template was read again")
+
+    monkeypatch.setattr('builtins.open', fail_open)
+    assert load_template(template_path) is first
+    monkeypatch.undo()
+
+    # A modified template is recompiled
+    template_path.write_text("class {{ name }}(Base):\n    pass")
+    stat = template_path.stat()
+    os.utime(template_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    assert load_template(template_path).render(name='A') == "class A(Base):\n    pass"
+
+def test_render_template_missing_file(tmp_path):
+    app_path = create_mock_django_app(tmp_path, 'testapp')
+
+    with pytest.raises(ValueError):
+        Utils.render_template(tmp_path / 'missing.txt', app_path, name='A')
+
+def test_bundled_templates_loaded_once(monkeypatch):
+    templates = bundled_templates()
+
+    assert 'model_template.txt' in templates
+    assert 'viewset_template.txt' in templates
+    assert all('\r' not in template.source for template in templates.values())
+
+    # Bundled templates are served from memory after the first load; only the
+    # override folders are stat'ed, to validate the cached resolver
+    search_path = set(template_search_path(os.getcwd()))
+    original_stat = os.stat
+
+    def fail(*args, **kwargs):
+        raise AssertionError("bundled template touched the filesystem")
+
+    def folder_stat(path, *args, **kwargs):
+        if Path(path) not in search_path:
+            fail()
+        return original_stat(path, *args, **kwargs)
+
+    monkeypatch.setattr('builtins.open', fail)
+    monkeypatch.setattr(os, 'stat', folder_stat)
+    rendered = get_template('model_template.txt').render(model_name='Product')
+    assert "class Product(models.Model):" in rendered
+
+def test_get_template_unknown_name():
+    with pytest.raises(ValueError):
+        get_template('no_such_template.txt')
+
+def test_template_resolver_layers(tmp_path):
+    project_dir = tmp_path / 'project'
+    user_dir = tmp_path / 'user'
+    project_dir.mkdir()
+    user_dir.mkdir()
+    (project_dir / 'model_template.txt').write_text("class {{ model_name }}(ProjectBase):\n    pass")
+    (user_dir / 'model_template.txt').write_text("class {{ model_name }}(UserBase):\n    pass")
+    (user_dir / 'view_template.txt').write_text("class {{ view_name }}(UserView):\n    pass")
+
+    resolver = TemplateResolver([project_dir, user_dir, tmp_path / 'missing'])
+
+    assert resolver.get('model_template.txt').render(model_name='A') == "class A(ProjectBase):\n    pass"
+    assert resolver.get('view_template.txt').render(view_name='V') == "class V(UserView):\n    pass"
+    assert resolver.get('serializer_template.txt') is bundled_templates()['serializer_template.txt']
+    assert resolver.origin('model_template.txt') == project_dir / 'model_template.txt'
+    assert resolver.origin('serializer_template.txt') is None
+    with pytest.raises(ValueError):
+        resolver.get('no_such_template.txt')
+
+def test_template_resolution_cached_per_run(tmp_path, monkeypatch):
+    monkeypatch.setenv('XDG_CONFIG_HOME', str(tmp_path / 'config'))
+    templates_dir = tmp_path / '.django-create' / 'templates'
+    templates_dir.mkdir(parents=True)
+    (templates_dir / 'model_template.txt').write_text("class {{ model_name }}(HouseModel):\n    pass")
+
+    scanned = []
+    original_scandir = os.scandir
+
+    def counting_scandir(path):
+        scanned.append(Path(path))
+        return original_scandir(path)
+
+    monkeypatch.setattr(os, 'scandir', counting_scandir)
+    with session_scope():
+        for name in ('A', 'B', 'C'):
+            rendered = get_template('model_template.txt', tmp_path).render(model_name=name)
+            assert rendered == f"class {name}(HouseModel):\n    pass"
+
+    # Each folder of the search path is listed once for the whole run
+    assert scanned.count(templates_dir) == 1
+
+def test_template_resolver_cached_outside_runs(tmp_path, monkeypatch):
+    monkeypatch.setenv('XDG_CONFIG_HOME', str(tmp_path / 'config'))
+    templates_dir = tmp_path / '.django-create' / 'templates'
+    templates_dir.mkdir(parents=True)
+    (templates_dir / 'model_template.txt').write_text("class {{ model_name }}(HouseModel):\n    pass")
+
+    scanned = []
+    original_scandir = os.scandir
+
+    def counting_scandir(path):
+        scanned.append(Path(path))
+        return original_scandir(path)
+
+    monkeypatch.setattr(os, 'scandir', counting_scandir)
+    for name in ('A', 'B'):
+        assert get_template('model_template.txt', tmp_path).render(model_name=name) == f"class {name}(HouseModel):\n    pass"
+    assert scanned.count(templates_dir) == 1
+
+    # Adding a template changes the folder's mtime, which invalidates the resolver
+    (templates_dir / 'view_template.txt').write_text("class {{ view_name }}(HouseView):\n    pass")
+    stat = templates_dir.stat()
+    os.utime(templates_dir, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    assert get_template('view_template.txt', tmp_path).render(view_name='V') == "class V(HouseView):\n    pass"
+    assert scanned.count(templates_dir) == 2
+
+def test_project_template_used_by_create_command(tmp_path, monkeypatch):
+    monkeypatch.setenv('XDG_CONFIG_HOME', str(tmp_path / 'config'))
+    app_path = create_mock_django_app(tmp_path, 'testapp', with_models_file=False)
+    templates_dir = tmp_path / '.django-create' / 'templates'
+    templates_dir.mkdir(parents=True)
+    (templates_dir / 'model_template.txt').write_text(
+        "{% imports %}\nfrom core.models import BaseModel\n\n{% body %}\nclass {{ model_name }}(BaseModel):\n    pass\n"
+    )
+    (app_path / 'models').mkdir()
+    monkeypatch.chdir(tmp_path)
+
+    result = CliRunner().invoke(cli, ['testapp', 'create', 'model', 'Product'])
+
+    assert result.exit_code == 0, result.output
+    content = (app_path / 'models' / 'product.py').read_text()
+    assert content == "from core.models import BaseModel\n\nclass Product(BaseModel):\n    pass\n"
+
+def test_bundled_templates_render_from_zipapp(tmp_path):
+    """All bundled templates must load from inside a zipped install."""
+    package_root = Path(django_create.__file__).parent
+    archive = tmp_path / 'django_create.pyz'
+    main = (
+        "import django_create.templating as templating\n"
+        "assert '.pyz' in templating.__file__, templating.__file__\n"
+        "templates = templating.bundled_templates()\n"
+        "for name in sorted(templates):\n"
+        "    rendered = templates[name].render(model_name='M', view_name='V', serializer_name='S', "
+        "viewset_name='VS', test_name='T')\n"
+        "    assert '{{' not in rendered, name\n"
+        "    print(name)\n"
+    )
+    with zipfile.ZipFile(archive, 'w') as zf:
+        for path in package_root.rglob('*'):
+            if path.is_file() and '__pycache__' not in path.parts:
+                zf.write(path, (Path('django_create') / path.relative_to(package_root)).as_posix())
+        zf.writestr('__main__.py', main)
+
+    result = subprocess.run(
+        [sys.executable, '-E', '-s', str(archive)],
+        cwd=str(tmp_path),
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        universal_newlines=True
+    )
+
+    assert result.returncode == 0, result.stderr
+    rendered_names = result.stdout.split()
+    assert sorted(bundled_templates()) == rendered_names